@@ -0,0 +1,266 @@
+import asyncio
+import csv
+import io
+import json
+import re
+import time
+from datetime import datetime
+from typing import AsyncIterator, Iterator
+from urllib.parse import urlsplit
+import reflex as rx
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from app.services.estop import emergency_stop
+from app.services.fleet import fleet_hub
+from app.services.log_bus import log_bus
+from app.services.log_index import log_index
+from app.services.log_store import LogRecord, Severity
+from app.services.metrics import metrics
+from app.services.motor_control import motor_control
+from app.services.telemetry_hub import telemetry_hub
+
+MAX_POINTS = 2000
+MAX_SEARCH_RESULTS = 500
+# Sent by the dashboard on every state-changing request. A cross-site form
+# cannot set it, and a cross-site fetch that does is stopped by the Origin
+# check in `_forbidden`.
+CONTROL_HEADER = "X-Robobelt-Control"
+SOURCE_PATTERN = re.compile(r"[a-z][a-z0-9_-]{0,31}")
+EXPORT_FIELDS = [
+    "id",
+    "ts",
+    "time",
+    "severity",
+    "category",
+    "message",
+    "repeats",
+    "last",
+]
+
+
+async def telemetry_history(request: Request) -> JSONResponse:
+    """Downsampled telemetry between `start` and `end` (epoch seconds)."""
+    params = request.query_params
+    try:
+        end = float(params.get("end", time.time()))
+        start = float(params.get("start", end - 3600))
+        bucket = float(params.get("bucket", 60))
+    except ValueError:
+        return JSONResponse({"error": "start, end and bucket must be numbers"}, 400)
+    if end <= start or bucket <= 0:
+        return JSONResponse({"error": "empty range or bucket"}, 400)
+    if telemetry_hub.store is None:
+        return JSONResponse({"error": "telemetry store disabled"}, 503)
+    bucket = max(bucket, (end - start) / MAX_POINTS)
+    points = await asyncio.to_thread(telemetry_hub.store.downsample, start, end, bucket)
+    return JSONResponse(
+        {"start": start, "end": end, "bucket": bucket, "points": points}
+    )
+
+
+def _log_filters(params) -> dict:
+    """Common log query parameters; raises ValueError on bad input.
+
+    The range is `start`/`end` in epoch seconds, or the trailing `last`
+    seconds; `severity` is a comma-separated list.
+    """
+    end = float(params.get("end", time.time()))
+    if "last" in params:
+        start = end - float(params["last"])
+    else:
+        start = float(params.get("start", 0))
+    severities = frozenset(
+        name for name in params.get("severity", "").lower().split(",") if name
+    )
+    unknown = severities - {severity.label for severity in Severity}
+    if unknown:
+        raise ValueError(f"unknown severity: {', '.join(sorted(unknown))}")
+    return {
+        "start": start,
+        "end": end,
+        "severities": severities,
+        "category": params.get("category", ""),
+        "text": params.get("q", ""),
+    }
+
+
+def _as_dict(record: LogRecord) -> dict:
+    return {
+        "id": record.id,
+        "ts": record.created,
+        "time": datetime.fromtimestamp(record.created).isoformat(),
+        "severity": record.severity,
+        "category": record.category,
+        "message": record.message,
+        "repeats": record.repeats,
+        "last": record.last,
+    }
+
+
+async def _chunks(chunks: Iterator[list[LogRecord]]) -> AsyncIterator[list]:
+    """Pull blocking query chunks off the event loop one at a time."""
+    try:
+        while chunk := await asyncio.to_thread(next, chunks, None):
+            yield chunk
+    finally:
+        await asyncio.to_thread(chunks.close)
+
+
+async def _csv_lines(chunks: Iterator[list[LogRecord]]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, EXPORT_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+    async for chunk in _chunks(chunks):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_as_dict(record) for record in chunk)
+        yield buffer.getvalue()
+
+
+async def _jsonl_lines(chunks: Iterator[list[LogRecord]]) -> AsyncIterator[str]:
+    async for chunk in _chunks(chunks):
+        yield "".join(
+            json.dumps(_as_dict(record), ensure_ascii=False) + "\n" for record in chunk
+        )
+
+
+async def export_logs(request: Request):
+    """Stream the indexed log history as CSV or JSON lines.
+
+    Accepts the filters of `_log_filters` and `format=csv|jsonl`; rows are
+    read from SQLite in chunks, so any range can be exported.
+    """
+    params = request.query_params
+    try:
+        filters = _log_filters(params)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, 400)
+    export_format = params.get("format", "csv")
+    if export_format not in ("csv", "jsonl"):
+        return JSONResponse({"error": "format must be csv or jsonl"}, 400)
+    chunks = log_index.query(**filters)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    if export_format == "csv":
+        body, media_type = _csv_lines(chunks), "text/csv"
+    else:
+        body, media_type = _jsonl_lines(chunks), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="robobelt-logs-{stamp}.{export_format}"'
+            )
+        },
+    )
+
+
+async def search_logs(request: Request) -> JSONResponse:
+    """Newest indexed log entries whose message contains every word of `q`."""
+    params = request.query_params
+    try:
+        filters = _log_filters(params)
+        limit = int(params.get("limit", 100))
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, 400)
+    if limit < 1:
+        return JSONResponse({"error": "limit must be at least 1"}, 400)
+    if not filters["text"].strip():
+        return JSONResponse({"error": "q is required"}, 400)
+    limit = min(limit, MAX_SEARCH_RESULTS)
+
+    def run() -> list[dict]:
+        chunks = log_index.query(**filters, newest_first=True, limit=limit)
+        return [_as_dict(record) for chunk in chunks for record in chunk]
+
+    results = await asyncio.to_thread(run)
+    return JSONResponse({"count": len(results), "results": results})
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _forbidden(request: Request) -> JSONResponse | None:
+    """Reject a state-changing request that did not come from the dashboard.
+
+    It must carry `CONTROL_HEADER`, and a browser `Origin`, when sent, must
+    be this server, the configured frontend or backend URL, or an
+    explicitly allowed CORS origin. Clients without an Origin, such as a
+    line controller, only need the header.
+    """
+    if request.headers.get(CONTROL_HEADER) != "1":
+        return JSONResponse({"error": f"{CONTROL_HEADER} header required"}, 403)
+    origin = request.headers.get("origin")
+    config = rx.config.get_config()
+    urls = [str(request.base_url), config.deploy_url, config.api_url]
+    trusted = {_origin(url) for url in urls if url}
+    trusted.update(url for url in config.cors_allowed_origins if url != "*")
+    if origin is not None and origin not in trusted:
+        return JSONResponse({"error": "origin not allowed"}, 403)
+    return None
+
+
+async def estop(request: Request) -> JSONResponse:
+    """Read, or with POST trigger, the process-wide emergency stop.
+
+    The stop is applied before the response is sent, independently of any
+    session's event queue. POST requests must pass `_forbidden`; `source`
+    in the query names who triggered it and must be a short lowercase
+    identifier, since it is written into the log.
+    """
+    if request.method == "POST":
+        if error := _forbidden(request):
+            return error
+        source = request.query_params.get("source", "operator")
+        if not SOURCE_PATTERN.fullmatch(source):
+            return JSONResponse({"error": "invalid source"}, 400)
+        emergency_stop.trigger(source)
+    return JSONResponse(emergency_stop.status())
+
+
+async def get_metrics(request: Request) -> JSONResponse:
+    """Latency and size histograms plus producer counters.
+
+    Histograms cover the telemetry path of every session: time queued
+    after production, state lock wait, handler time, delta size and the
+    client-acknowledged latency from production to render. A POST, which
+    must pass `_forbidden`, clears the histograms after reading them.
+    """
+    if request.method == "POST" and (error := _forbidden(request)):
+        return error
+    body = {
+        "histograms": metrics.snapshot(),
+        "counters": {
+            "telemetry.seq": telemetry_hub.seq,
+            "telemetry.overruns": telemetry_hub.overruns,
+            "telemetry.subscribers": telemetry_hub.subscriber_count,
+            "fleet.ticks": fleet_hub.ticks,
+            "estop.active": int(emergency_stop.active),
+            "estop.triggers": emergency_stop.triggers,
+            "control.ticks": motor_control.ticks,
+            "control.overruns": motor_control.overruns,
+            "log.coalesced": log_bus.coalesced,
+            "log.suppressed": sum(log_bus.suppressed.values()),
+            "log.sink_dropped": log_bus.sink.dropped if log_bus.sink else 0,
+            "log.index_dropped": log_bus.index.dropped if log_bus.index else 0,
+        },
+    }
+    if request.method == "POST":
+        metrics.reset()
+    return JSONResponse(body)
+
+
+api = Starlette(
+    routes=[
+        Route("/api/telemetry/history", telemetry_history),
+        Route("/api/logs/export", export_logs),
+        Route("/api/logs/search", search_logs),
+        Route("/api/metrics", get_metrics, methods=["GET", "POST"]),
+        Route("/api/estop", estop, methods=["GET", "POST"]),
+    ]
+)
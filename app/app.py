@@ -1,18 +1,24 @@
 import reflex as rx
+from app.api import api
 from app.pages.system_status import system_status_page
 from app.pages.manual_control import manual_control_page
 from app.pages.configuration import configuration_page
 from app.pages.system_logs import system_logs_page
-from app.states.theme_state import ThemeState
+from app.pages.fleet import fleet_page
+from app import styles, theme
 
 app = rx.App(
     theme=rx.theme(appearance="light"),
     stylesheets=[
-        "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap"
+        "https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap",
+        "/fleet.css",
     ],
+    head_components=[*theme.head_components(), rx.el.style(styles.styles_css())],
     style={"font_family": "Inter, sans-serif"},
+    api_transformer=api,
 )
 app.add_page(system_status_page, route="/", title="System Status | RoboBelt")
 app.add_page(manual_control_page, route="/manual", title="Manual Control | RoboBelt")
 app.add_page(configuration_page, route="/config", title="Configuration | RoboBelt")
-app.add_page(system_logs_page, route="/logs", title="System Logs | RoboBelt")
\ No newline at end of file
+app.add_page(system_logs_page, route="/logs", title="System Logs | RoboBelt")
+app.add_page(fleet_page, route="/fleet", title="Fleet Overview | RoboBelt")
@@ -0,0 +1,215 @@
+import json
+import reflex as rx
+from reflex.constants.compiler import CompileVars, Hooks, Imports
+from reflex.event import EventHandler
+from reflex.utils.format import format_event_handler
+from reflex.vars.base import VarData
+
+
+def dispatch_js(handler: EventHandler, payload: str = "{}") -> str:
+    """JS statement that queues `handler` with a JS object literal payload."""
+    name = json.dumps(format_event_handler(handler))
+    return f"addEvents([{CompileVars.TO_EVENT}({name}, {payload})], [], {{}});"
+
+
+def effect_hook(body: str) -> rx.Var:
+    """A mount-once React effect with access to the event queue."""
+    return rx.Var(
+        _js_expr=f"useEffect(() => {{ {body} }}, []);",
+        _var_data=VarData(
+            imports={**Imports.EVENTS, "react": ["useContext", "useEffect"]},
+            hooks={Hooks.EVENTS: None},
+        ),
+    )
+
+
+def change_hook(var: rx.Var, body: str) -> rx.Var:
+    """A React effect run whenever `var` changes; `body` sees it as `value`."""
+    return rx.Var(
+        _js_expr=f"useEffect(() => {{ const value = {var}; {body} }}, [{var}]);",
+        _var_data=VarData.merge(
+            var._get_all_var_data(),
+            VarData(
+                imports={**Imports.EVENTS, "react": ["useContext", "useEffect"]},
+                hooks={Hooks.EVENTS: None},
+            ),
+        ),
+    )
+
+
+class VisibilityListener(rx.Fragment):
+    """Reports browser tab visibility changes to TelemetryState."""
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        from app.states.telemetry_state import TelemetryState
+
+        return [
+            effect_hook(
+                "const onChange = () => { "
+                "if (document.visibilityState === 'hidden') { "
+                f"{dispatch_js(TelemetryState.set_tab_hidden)} "
+                "} else { "
+                f"{dispatch_js(TelemetryState.set_tab_visible)} "
+                "} }; "
+                "document.addEventListener('visibilitychange', onChange); "
+                "return () => document.removeEventListener('visibilitychange', onChange);"
+            )
+        ]
+
+
+def visibility_listener() -> rx.Component:
+    return VisibilityListener.create()
+
+
+class TelemetryAck(rx.Fragment):
+    """Acknowledges each applied telemetry tick on the next animation frame.
+
+    The server pairs the acked sequence number with the tick's production
+    time to measure end-to-end latency, without relying on client clocks.
+    """
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        from app.states.telemetry_state import TelemetryState
+
+        return [
+            change_hook(
+                TelemetryState.telemetry_seq,
+                "if (value) requestAnimationFrame(() => { "
+                f"{dispatch_js(TelemetryState.ack_telemetry, '{seq: value}')} "
+                "});",
+            )
+        ]
+
+
+def telemetry_ack() -> rx.Component:
+    return TelemetryAck.create()
+
+
+class FleetPatcher(rx.Fragment):
+    """Applies FleetState patch rows to the rendered fleet tiles in place.
+
+    Each row is `[index, health, *channels]`; only the tiles named in the
+    patch are touched, so React never re-renders the grid.
+    """
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        from app.states.fleet_state import FleetState
+
+        return [
+            change_hook(
+                FleetState.fleet_patch,
+                "for (const row of value) { "
+                "const tile = document.getElementById(`belt-${row[0]}`); "
+                "if (!tile) continue; "
+                "tile.dataset.health = row[1]; "
+                "tile.querySelectorAll('[data-channel]').forEach("
+                "(cell, k) => { cell.textContent = row[k + 2]; }); "
+                "}",
+            )
+        ]
+
+
+def fleet_patcher() -> rx.Component:
+    return FleetPatcher.create()
+
+
+class ControlKeys(rx.Fragment):
+    """Handles the manual control keys in the browser.
+
+    Keyboard and pointer presses on `[data-key]` buttons are rendered by
+    setting `data-pressed` directly, and the keys held or tapped are sent
+    to `ControlState.apply_intent` at most `INTENT_RATE` times a second,
+    numbered so the server can drop stale intents.
+    """
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        from app.states.control_state import CONTROL_KEYS, INTENT_RATE, ControlState
+
+        send = dispatch_js(
+            ControlState.apply_intent, "{intent: {stream, seq: ++seq, keys}}"
+        )
+        return [
+            effect_hook(
+                f"const controlKeys = new Set({json.dumps(CONTROL_KEYS)}); "
+                "const held = new Set(); const tapped = new Set(); "
+                "const stream = Date.now(); let seq = 0; let dirty = false; "
+                "let pointerKey = null; "
+                "const render = (key, pressed) => document"
+                ".querySelectorAll(`[data-key='${key}']`)"
+                ".forEach((el) => { el.dataset.pressed = pressed; }); "
+                "const press = (key) => { if (held.has(key)) return; "
+                "held.add(key); tapped.add(key); dirty = true; render(key, true); }; "
+                "const release = (key) => { if (!held.delete(key)) return; "
+                "dirty = true; render(key, false); }; "
+                "const releaseAll = () => [...held].forEach(release); "
+                "const flush = () => { if (!dirty && !held.size) return; "
+                "const keys = [...new Set([...held, ...tapped])]; tapped.clear(); "
+                f"dirty = keys.length > held.size; {send} }}; "
+                "const onKeyDown = (e) => { const key = e.key.toLowerCase(); "
+                "if (!controlKeys.has(key) || e.target.closest?.("
+                "'input, select, textarea, [contenteditable]')) return; "
+                "e.preventDefault(); press(key); }; "
+                "const onKeyUp = (e) => release(e.key.toLowerCase()); "
+                "const onPointerDown = (e) => { "
+                "pointerKey = e.target.closest?.('[data-key]')?.dataset.key ?? null; "
+                "if (pointerKey) press(pointerKey); }; "
+                "const onPointerUp = () => { "
+                "if (pointerKey) release(pointerKey); pointerKey = null; }; "
+                "const onPointerOut = (e) => { "
+                "const button = e.target.closest?.('[data-key]'); "
+                "if (button && !button.contains(e.relatedTarget)) onPointerUp(); }; "
+                "const listeners = [['keydown', onKeyDown], ['keyup', onKeyUp], "
+                "['pointerdown', onPointerDown], ['pointerup', onPointerUp], "
+                "['pointercancel', onPointerUp], ['pointerout', onPointerOut], "
+                "['blur', releaseAll]]; "
+                "listeners.forEach(([name, fn]) => window.addEventListener(name, fn)); "
+                f"const timer = setInterval(flush, {1000 / INTENT_RATE}); "
+                "return () => { "
+                "listeners.forEach(([name, fn]) => window.removeEventListener(name, fn)); "
+                "clearInterval(timer); releaseAll(); flush(); };"
+            )
+        ]
+
+
+def control_keys() -> rx.Component:
+    return ControlKeys.create()
+
+
+ESTOP_CONFIRM_ID = "estop-confirm"
+
+
+class EstopControls(rx.Fragment):
+    """Handles the e-stop buttons in the browser.
+
+    Clicks on `[data-estop]` buttons are caught by a native listener that
+    opens or closes the confirmation, and "trigger" posts straight to
+    `/api/estop` with `fetch`. Reflex's event queue is never involved, so
+    the stop is sent even while a handler is running or the websocket is
+    down; the session follows the stop once it is applied.
+    """
+
+    def add_hooks(self) -> list[str | rx.Var]:
+        from app.api import CONTROL_HEADER
+
+        url = json.dumps(f"{rx.config.get_config().api_url}/api/estop")
+        headers = json.dumps({CONTROL_HEADER: "1"})
+        return [
+            effect_hook(
+                "const onClick = (e) => { "
+                "const action = e.target.closest?.('[data-estop]')?.dataset.estop; "
+                "if (!action) return; "
+                "if (action === 'trigger') { "
+                f"fetch({url}, {{method: 'POST', headers: {headers}, keepalive: true}})"
+                ".then((response) => { if (!response.ok) throw new Error(response.status); })"
+                ".catch(() => alert('EMERGENCY STOP REQUEST FAILED. Use the hardware stop.')); "
+                "} "
+                f"document.getElementById({json.dumps(ESTOP_CONFIRM_ID)})"
+                "?.classList.toggle('hidden', action !== 'open'); }; "
+                "document.addEventListener('click', onClick); "
+                "return () => document.removeEventListener('click', onClick);"
+            )
+        ]
+
+
+def estop_controls() -> rx.Component:
+    return EstopControls.create()
@@ -1,8 +1,12 @@
 import reflex as rx
 from app.components.sidebar import sidebar
 from app.components.status_panel import status_panel
+from app.components.client_events import telemetry_ack, visibility_listener
+from app.states.config_state import ConfigState
+from app.states.control_state import ControlState
+from app.states.log_state import LogState
+from app.states.telemetry_state import TelemetryState
 from app.states.ui_state import UIState
-from app.states.theme_state import ThemeState
 
 
 def mobile_header(page_title: str) -> rx.Component:
@@ -10,19 +14,13 @@ def mobile_header(page_title: str) -> rx.Component:
         rx.el.button(
             rx.icon("menu", class_name="w-6 h-6"),
             on_click=UIState.toggle_mobile_menu,
-            class_name="md:hidden p-2 mr-2 rounded-md hover:bg-gray-700",
-            style={"color": ThemeState.text_secondary},
+            class_name="rb-muted md:hidden p-2 mr-2 rounded-md hover:bg-gray-700",
         ),
         rx.el.h1(
             page_title,
-            class_name="text-lg font-semibold truncate",
-            style={"color": ThemeState.text_primary},
+            class_name="rb-text text-lg font-semibold truncate",
         ),
-        class_name="flex items-center p-4 border-b md:hidden sticky top-0 z-20",
-        style={
-            "backgroundColor": ThemeState.card_color,
-            "borderColor": ThemeState.border_color,
-        },
+        class_name="rb-panel rb-border flex items-center p-4 border-b md:hidden sticky top-0 z-20",
     )
 
 
@@ -31,6 +29,8 @@ def main_layout(
 ) -> rx.Component:
     """The main layout wrapper implementing the 3-column structure."""
     return rx.el.div(
+        visibility_listener(),
+        telemetry_ack(),
         rx.cond(
             UIState.is_mobile_menu_open,
             rx.el.div(
@@ -47,13 +47,11 @@ def main_layout(
                     rx.el.div(
                         rx.el.h1(
                             page_title,
-                            class_name="text-2xl font-bold",
-                            style={"color": ThemeState.text_primary},
+                            class_name="rb-text text-2xl font-bold",
                         ),
                         rx.el.p(
                             "Manage and monitor your robotic belt system.",
-                            class_name="text-sm mt-1",
-                            style={"color": ThemeState.text_secondary},
+                            class_name="rb-muted text-sm mt-1",
                         ),
                         class_name="hidden md:block mb-8",
                     ),
@@ -62,10 +60,15 @@ def main_layout(
                 ),
                 class_name="flex-1 overflow-y-auto p-4 md:p-8",
             ),
-            class_name="flex flex-col flex-1 md:pl-64 lg:pr-80 min-h-screen transition-all duration-300",
-            style={"backgroundColor": ThemeState.bg_color},
+            class_name="rb-surface flex flex-col flex-1 md:pl-64 lg:pr-80 min-h-screen transition-all duration-300",
         ),
         status_panel(),
-        class_name="flex h-screen w-full font-sans overflow-hidden transition-colors duration-300",
-        style={"backgroundColor": ThemeState.bg_color},
-    )
\ No newline at end of file
+        class_name="rb-surface flex h-screen w-full font-sans overflow-hidden transition-colors duration-300",
+        on_mount=[
+            TelemetryState.start_simulation,
+            LogState.start_following,
+            ControlState.start_estop_watch,
+            ControlState.start_controls_watch,
+            ConfigState.on_mount,
+        ],
+    )
@@ -1,5 +1,4 @@
 import reflex as rx
-from app.states.theme_state import ThemeState
 
 
 def nav_item(text: str, icon_name: str, url: str) -> rx.Component:
@@ -8,17 +7,14 @@ def nav_item(text: str, icon_name: str, url: str) -> rx.Component:
         rx.el.div(
             rx.icon(
                 icon_name,
-                class_name="w-5 h-5 mr-3 transition-colors",
-                style={"color": ThemeState.text_secondary},
+                class_name="rb-muted w-5 h-5 mr-3 transition-colors",
             ),
             rx.el.span(
                 text,
-                class_name="font-medium transition-colors",
-                style={"color": ThemeState.text_secondary},
+                class_name="rb-muted font-medium transition-colors",
             ),
-            class_name="flex items-center px-4 py-3 rounded-lg group transition-all duration-200 cursor-pointer hover:bg-gray-100/10",
-            style={"borderColor": "transparent"},
+            class_name="flex items-center px-4 py-3 rounded-lg border-transparent group transition-all duration-200 cursor-pointer hover:bg-gray-100/10",
         ),
         href=url,
         class_name="block mb-1",
-    )
\ No newline at end of file
+    )
@@ -1,6 +1,6 @@
 import reflex as rx
 from app.states.telemetry_state import TelemetryState
-from app.states.theme_state import ThemeState
+from app import theme
 
 
 def circular_gauge(
@@ -18,7 +18,7 @@ def circular_gauge(
                     cy="50",
                     r=radius,
                     fill="none",
-                    stroke=ThemeState.border_color,
+                    class_name="rb-stroke-border",
                     stroke_width="8",
                 ),
                 rx.el.circle(
@@ -26,7 +26,7 @@ def circular_gauge(
                     cy="50",
                     r=radius,
                     fill="none",
-                    stroke=color_hex,
+                    style={"stroke": color_hex},
                     stroke_width="8",
                     stroke_dasharray=f"{circumference}",
                     stroke_dashoffset=offset_var,
@@ -41,20 +41,17 @@ def circular_gauge(
         rx.el.div(
             rx.el.span(
                 value,
-                class_name="text-3xl font-bold",
-                style={"color": ThemeState.text_primary},
+                class_name="rb-text text-3xl font-bold",
             ),
             rx.el.span(
                 unit,
-                class_name="text-sm ml-1 mb-1",
-                style={"color": ThemeState.text_secondary},
+                class_name="rb-muted text-sm ml-1 mb-1",
             ),
             class_name="absolute inset-0 flex items-center justify-center",
         ),
         rx.el.p(
             label,
-            class_name="text-sm font-medium mt-2 text-center",
-            style={"color": ThemeState.text_secondary},
+            class_name="rb-muted text-sm font-medium mt-2 text-center",
         ),
         class_name="flex flex-col items-center relative",
     )
@@ -68,11 +65,11 @@ def temp_gauge() -> rx.Component:
         "°C",
         rx.cond(
             TelemetryState.motor_temp > 80,
-            ThemeState.error_color,
+            theme.error_color,
             rx.cond(
                 TelemetryState.motor_temp > 60,
-                ThemeState.warning_color,
-                ThemeState.accent_color,
+                theme.warning_color,
+                theme.accent_color,
             ),
         ),
     )
@@ -83,32 +80,21 @@ def tension_meter() -> rx.Component:
         rx.el.div(
             rx.el.span(
                 "Belt Tension",
-                class_name="text-sm font-medium",
-                style={"color": ThemeState.text_secondary},
+                class_name="rb-muted text-sm font-medium",
             ),
             rx.el.span(
                 rx.el.span(TelemetryState.belt_tension.to_string()),
                 " N",
-                class_name="text-lg font-bold",
-                style={"color": ThemeState.text_primary},
+                class_name="rb-text text-lg font-bold",
             ),
             class_name="flex justify-between items-end mb-2",
         ),
         rx.el.div(
             rx.el.div(
-                class_name="absolute inset-0 rounded-full border transition-colors duration-300",
-                style={
-                    "backgroundColor": ThemeState.bg_color,
-                    "borderColor": ThemeState.border_color,
-                },
+                class_name="rb-surface rb-border absolute inset-0 rounded-full border transition-colors duration-300",
             ),
             rx.el.div(
-                class_name="absolute top-0 bottom-0 opacity-30 transition-colors duration-300",
-                style={
-                    "left": "33%",
-                    "width": "50%",
-                    "backgroundColor": ThemeState.accent_color,
-                },
+                class_name="rb-accent-fill absolute top-0 bottom-0 left-1/3 w-1/2 opacity-30 transition-colors duration-300",
             ),
             rx.el.div(
                 class_name="absolute top-0 bottom-0 rounded-full transition-all duration-500 shadow-sm",
@@ -117,8 +103,8 @@ def tension_meter() -> rx.Component:
                     "backgroundColor": rx.cond(
                         (TelemetryState.belt_tension < 400)
                         | (TelemetryState.belt_tension > 550),
-                        ThemeState.error_color,
-                        ThemeState.accent_color,
+                        theme.error_color,
+                        theme.accent_color,
                     ),
                 },
             ),
@@ -126,56 +112,37 @@ def tension_meter() -> rx.Component:
         ),
         rx.el.div(
             rx.el.span(
-                "300N", class_name="text-xs", style={"color": ThemeState.text_secondary}
+                "300N",
+                class_name="rb-muted text-xs",
             ),
             rx.el.span(
                 "Optimal Range (400-550N)",
-                class_name="text-xs font-medium",
-                style={"color": ThemeState.accent_color},
+                class_name="rb-accent text-xs font-medium",
             ),
             rx.el.span(
-                "600N", class_name="text-xs", style={"color": ThemeState.text_secondary}
+                "600N",
+                class_name="rb-muted text-xs",
             ),
             class_name="flex justify-between mt-1",
         ),
-        class_name="w-full p-4 rounded-xl shadow-sm transition-colors duration-300",
-        style={
-            "backgroundColor": ThemeState.card_color,
-            "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-        },
+        class_name="rb-card w-full p-4 rounded-xl shadow-sm transition-colors duration-300",
     )
 
 
 def system_health_indicator() -> rx.Component:
     return rx.el.div(
         rx.el.div(
-            class_name="w-3 h-3 rounded-full animate-pulse mr-2",
-            style={
-                "backgroundColor": rx.match(
-                    TelemetryState.system_health,
-                    ("Optimal", ThemeState.success_color),
-                    ("Warning", ThemeState.warning_color),
-                    ThemeState.error_color,
-                )
-            },
+            custom_attrs={"data-health": TelemetryState.system_health},
+            class_name="rb-health-dot w-3 h-3 rounded-full animate-pulse mr-2",
         ),
         rx.el.span(
             "System Status: ",
-            class_name="text-sm mr-1",
-            style={"color": ThemeState.text_secondary},
+            class_name="rb-muted text-sm mr-1",
         ),
         rx.el.span(
             TelemetryState.system_health,
-            class_name="text-sm font-bold",
-            style={
-                "color": rx.match(
-                    TelemetryState.system_health,
-                    ("Optimal", ThemeState.success_color),
-                    ("Warning", ThemeState.warning_color),
-                    ThemeState.error_color,
-                )
-            },
+            custom_attrs={"data-health": TelemetryState.system_health},
+            class_name="rb-health-text text-sm font-bold",
         ),
-        class_name="flex items-center px-4 py-2 rounded-full shadow-sm transition-colors duration-300",
-        style={"backgroundColor": ThemeState.card_color},
-    )
\ No newline at end of file
+        class_name="rb-panel flex items-center px-4 py-2 rounded-full shadow-sm transition-colors duration-300",
+    )
@@ -0,0 +1,93 @@
+import reflex as rx
+from app.components.client_events import fleet_patcher
+from app.components.layout import main_layout
+from app.states.fleet_state import FleetState
+
+
+def channel_value(channel: str, unit: str) -> rx.Component:
+    """A reading filled in on the client from the fleet patch rows."""
+    return rx.el.div(
+        rx.el.span(
+            "—",
+            custom_attrs={"data-channel": channel},
+            class_name="rb-text font-mono",
+        ),
+        rx.el.span(
+            f" {unit}",
+            class_name="rb-muted",
+        ),
+    )
+
+
+def belt_tile(belt_id: rx.Var, index: rx.Var) -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            rx.el.span(
+                belt_id,
+                class_name="rb-text text-xs font-bold",
+            ),
+            rx.el.span(class_name="fleet-led w-2 h-2 rounded-full"),
+            class_name="flex justify-between items-center mb-2",
+        ),
+        channel_value("belt_speed", "RPM"),
+        channel_value("motor_temp", "°C"),
+        channel_value("belt_tension", "N"),
+        channel_value("current_draw", "A"),
+        id=f"belt-{index}",
+        custom_attrs={"data-health": "0"},
+        class_name="rb-inset fleet-tile p-3 rounded-lg text-xs leading-5",
+    )
+
+
+def health_count(label: str, count: rx.Var, color_class: str) -> rx.Component:
+    return rx.el.div(
+        rx.el.span(count, class_name=f"{color_class} text-2xl font-bold mr-2"),
+        rx.el.span(
+            label,
+            class_name="rb-muted text-sm",
+        ),
+        class_name="flex items-baseline",
+    )
+
+
+def fleet_page() -> rx.Component:
+    return main_layout(
+        rx.el.div(
+            fleet_patcher(),
+            rx.el.div(
+                rx.el.div(
+                    rx.el.h2(
+                        "Fleet Overview",
+                        class_name="rb-text text-lg font-semibold",
+                    ),
+                    rx.el.div(
+                        health_count(
+                            "Optimal",
+                            FleetState.health_counts[0],
+                            "rb-success",
+                        ),
+                        health_count(
+                            "Warning",
+                            FleetState.health_counts[1],
+                            "rb-warning",
+                        ),
+                        health_count(
+                            "Critical",
+                            FleetState.health_counts[2],
+                            "rb-error",
+                        ),
+                        class_name="flex gap-6",
+                    ),
+                    class_name="flex flex-wrap justify-between items-center gap-4 mb-6",
+                ),
+                rx.el.div(
+                    rx.foreach(FleetState.belt_ids, belt_tile),
+                    class_name="grid grid-cols-2 sm:grid-cols-3 lg:grid-cols-5 gap-2",
+                ),
+                class_name="rb-card p-6 rounded-xl shadow-sm",
+            ),
+            on_mount=FleetState.enter_fleet_page,
+            on_unmount=FleetState.leave_fleet_page,
+        ),
+        page_title="Fleet Overview",
+    )
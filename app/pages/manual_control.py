@@ -1,37 +1,26 @@
 import reflex as rx
+from app.components.client_events import (
+    ESTOP_CONFIRM_ID,
+    control_keys,
+    estop_controls,
+)
 from app.components.layout import main_layout
 from app.states.control_state import ControlState
-from app.states.theme_state import ThemeState
 
 
 def key_button(
     label: str, key_code: str, icon: str = None, wide: bool = False
 ) -> rx.Component:
-    """A visual keyboard key component."""
-    is_pressed = ControlState.active_keys[key_code]
+    """A visual keyboard key, pressed and rendered by `control_keys`."""
     return rx.el.button(
         rx.cond(
             icon,
             rx.icon(icon, class_name="w-6 h-6"),
             rx.el.span(label, class_name="text-xl font-bold"),
         ),
-        on_mouse_down=lambda: ControlState.handle_key_down(key_code),
-        on_mouse_up=lambda: ControlState.handle_key_up(key_code),
-        on_mouse_leave=lambda: ControlState.handle_key_up(key_code),
-        class_name=f"{('w-full' if wide else 'w-16')} h-16 rounded-lg border-2 flex items-center justify-center transition-all duration-75 select-none active:scale-95 hover:border-gray-500",
-        style=rx.cond(
-            is_pressed,
-            {
-                "backgroundColor": ThemeState.accent_color,
-                "borderColor": ThemeState.accent_color,
-                "color": rx.cond(ThemeState.is_contrast, "black", "#212B38"),
-            },
-            {
-                "backgroundColor": "transparent",
-                "borderColor": ThemeState.border_color,
-                "color": ThemeState.text_secondary,
-            },
-        ),
+        type="button",
+        custom_attrs={"data-key": key_code},
+        class_name=f"rb-key {('w-full' if wide else 'w-16')} h-16 rounded-lg border-2 flex items-center justify-center transition-all duration-75 select-none active:scale-95 hover:border-gray-500",
     )
 
 
@@ -39,20 +28,13 @@ def drone_telemetry_item(label: str, value: str) -> rx.Component:
     return rx.el.div(
         rx.el.span(
             label,
-            class_name="text-xs font-medium uppercase tracking-wider",
-            style={"color": ThemeState.text_secondary},
+            class_name="rb-muted text-xs font-medium uppercase tracking-wider",
         ),
         rx.el.span(
             value,
-            class_name="text-lg font-mono font-bold",
-            style={"color": ThemeState.accent_color},
+            class_name="rb-accent text-lg font-mono font-bold",
         ),
-        class_name="flex flex-col p-3 rounded-lg border",
-        style={
-            "backgroundColor": ThemeState.bg_color,
-            "borderColor": ThemeState.border_color,
-            "borderWidth": ThemeState.border_width,
-        },
+        class_name="rb-surface rb-outline flex flex-col p-3 rounded-lg border",
     )
 
 
@@ -78,35 +60,28 @@ def webcam_feed() -> rx.Component:
                 rx.el.div(
                     rx.icon(
                         "camera",
-                        class_name="w-16 h-16 opacity-50 mb-4",
-                        style={"color": ThemeState.accent_color},
+                        class_name="rb-accent w-16 h-16 opacity-50 mb-4",
                     ),
                     rx.el.p(
                         "Camera Feed Active",
-                        class_name="font-mono",
-                        style={"color": ThemeState.text_secondary},
+                        class_name="rb-muted font-mono",
                     ),
                     rx.el.p(
                         "Signal Strength: 98%",
-                        class_name="text-xs mt-2",
-                        style={"color": ThemeState.accent_color},
+                        class_name="rb-accent text-xs mt-2",
                     ),
-                    class_name="absolute inset-0 flex flex-col items-center justify-center",
-                    style={"backgroundColor": ThemeState.bg_color},
+                    class_name="rb-surface absolute inset-0 flex flex-col items-center justify-center",
                 ),
                 rx.el.div(
                     rx.icon(
                         "video-off",
-                        class_name="w-16 h-16 mb-4",
-                        style={"color": ThemeState.text_secondary},
+                        class_name="rb-muted w-16 h-16 mb-4",
                     ),
                     rx.el.p(
                         "Camera Disconnected",
-                        class_name="font-medium",
-                        style={"color": ThemeState.text_secondary},
+                        class_name="rb-muted font-medium",
                     ),
-                    class_name="absolute inset-0 flex flex-col items-center justify-center",
-                    style={"backgroundColor": ThemeState.card_color},
+                    class_name="rb-panel absolute inset-0 flex flex-col items-center justify-center",
                 ),
             ),
             rx.el.div(
@@ -114,8 +89,7 @@ def webcam_feed() -> rx.Component:
                     class_name="absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-8 h-8 border border-white/30 rounded-full"
                 ),
                 rx.el.div(
-                    class_name="absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-1 h-1 rounded-full",
-                    style={"backgroundColor": ThemeState.accent_color},
+                    class_name="rb-accent-fill absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-1 h-1 rounded-full",
                 ),
                 rx.el.div(
                     class_name="absolute top-1/2 left-0 right-0 h-[1px] bg-white/10"
@@ -125,11 +99,7 @@ def webcam_feed() -> rx.Component:
                 ),
                 class_name="absolute inset-0 pointer-events-none",
             ),
-            class_name="relative w-full aspect-video bg-black rounded-lg overflow-hidden shadow-lg border",
-            style={
-                "borderColor": ThemeState.border_color,
-                "borderWidth": ThemeState.border_width,
-            },
+            class_name="rb-outline relative w-full aspect-video bg-black rounded-lg overflow-hidden shadow-lg border",
         ),
         rx.el.div(
             rx.el.button(
@@ -142,24 +112,16 @@ def webcam_feed() -> rx.Component:
                 class_name=rx.cond(
                     ControlState.camera_connected,
                     "text-xs text-red-400 hover:text-red-300 transition-colors",
-                    "text-xs hover:opacity-80 transition-colors",
-                ),
-                style=rx.cond(
-                    ControlState.camera_connected,
-                    {},
-                    {"color": ThemeState.accent_color},
+                    "rb-accent text-xs hover:opacity-80 transition-colors",
                 ),
             ),
             rx.el.span(
                 ControlState.connection_status_text,
-                class_name="text-xs ml-auto font-medium",
-                style={
-                    "color": rx.cond(
-                        ControlState.camera_connected,
-                        ThemeState.success_color,
-                        ThemeState.error_color,
-                    )
-                },
+                class_name=rx.cond(
+                    ControlState.camera_connected,
+                    "rb-success text-xs ml-auto font-medium",
+                    "rb-error text-xs ml-auto font-medium",
+                ),
             ),
             class_name="flex justify-between items-center mt-3 px-1",
         ),
@@ -168,46 +130,35 @@ def webcam_feed() -> rx.Component:
 
 
 def estop_modal() -> rx.Component:
-    return rx.cond(
-        ControlState.show_estop_confirm,
+    return rx.el.div(
         rx.el.div(
+            rx.el.h3(
+                "CONFIRM EMERGENCY STOP",
+                class_name="text-lg font-bold text-red-500 mb-2",
+            ),
+            rx.el.p(
+                "Are you sure you want to trigger the emergency stop? This will immediately halt all system operations.",
+                class_name="rb-muted mb-6",
+            ),
             rx.el.div(
-                rx.el.h3(
-                    "CONFIRM EMERGENCY STOP",
-                    class_name="text-lg font-bold text-red-500 mb-2",
-                ),
-                rx.el.p(
-                    "Are you sure you want to trigger the emergency stop? This will immediately halt all system operations.",
-                    class_name="mb-6",
-                    style={"color": ThemeState.text_secondary},
+                rx.el.button(
+                    "Cancel",
+                    type="button",
+                    custom_attrs={"data-estop": "cancel"},
+                    class_name="rb-outline-button px-4 py-2 rounded-lg font-medium mr-3",
                 ),
-                rx.el.div(
-                    rx.el.button(
-                        "Cancel",
-                        on_click=ControlState.cancel_estop_request,
-                        class_name="px-4 py-2 rounded-lg font-medium mr-3",
-                        style={
-                            "backgroundColor": "transparent",
-                            "color": ThemeState.text_primary,
-                            "border": f"1px solid {ThemeState.border_color}",
-                        },
-                    ),
-                    rx.el.button(
-                        "TRIGGER STOP",
-                        on_click=ControlState.confirm_estop,
-                        class_name="px-4 py-2 bg-red-600 text-white rounded-lg font-bold hover:bg-red-700 shadow-lg",
-                    ),
-                    class_name="flex justify-end",
+                rx.el.button(
+                    "TRIGGER STOP",
+                    type="button",
+                    custom_attrs={"data-estop": "trigger"},
+                    class_name="px-4 py-2 bg-red-600 text-white rounded-lg font-bold hover:bg-red-700 shadow-lg",
                 ),
-                class_name="p-6 rounded-xl shadow-2xl max-w-md w-full mx-4 z-50 animate-in fade-in zoom-in duration-200",
-                style={
-                    "backgroundColor": ThemeState.card_color,
-                    "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                },
+                class_name="flex justify-end",
             ),
-            class_name="fixed inset-0 bg-black/70 z-50 flex items-center justify-center",
+            class_name="rb-card p-6 rounded-xl shadow-2xl max-w-md w-full mx-4 z-50 animate-in fade-in zoom-in duration-200",
         ),
-        rx.fragment(),
+        id=ESTOP_CONFIRM_ID,
+        class_name="hidden fixed inset-0 bg-black/70 z-50 flex items-center justify-center",
     )
 
 
@@ -234,8 +185,7 @@ def estop_overlay() -> rx.Component:
                 ),
                 class_name="flex flex-col items-center justify-center z-40",
             ),
-            class_name="absolute inset-0 backdrop-blur-sm flex items-center justify-center rounded-xl border-2 border-red-500/50",
-            style={"backgroundColor": "rgba(0,0,0,0.9)"},
+            class_name="absolute inset-0 bg-black/90 backdrop-blur-sm flex items-center justify-center rounded-xl border-2 border-red-500/50",
         ),
         rx.fragment(),
     )
@@ -244,21 +194,18 @@ def estop_overlay() -> rx.Component:
 def manual_control_page() -> rx.Component:
     return main_layout(
         rx.el.div(
+            control_keys(),
+            estop_controls(),
             estop_modal(),
             rx.el.div(
                 rx.el.div(
                     rx.el.h2(
                         "Visual Feed",
-                        class_name="text-lg font-semibold mb-4 flex items-center gap-2",
-                        style={"color": ThemeState.text_primary},
+                        class_name="rb-text text-lg font-semibold mb-4 flex items-center gap-2",
                     ),
                     rx.el.div(
                         webcam_feed(),
-                        class_name="p-4 rounded-xl shadow-sm h-fit",
-                        style={
-                            "backgroundColor": ThemeState.card_color,
-                            "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                        },
+                        class_name="rb-card p-4 rounded-xl shadow-sm h-fit",
                     ),
                     rx.el.div(
                         drone_telemetry_item(
@@ -277,8 +224,7 @@ def manual_control_page() -> rx.Component:
                 rx.el.div(
                     rx.el.h2(
                         "Command Interface",
-                        class_name="text-lg font-semibold mb-4",
-                        style={"color": ThemeState.text_primary},
+                        class_name="rb-text text-lg font-semibold mb-4",
                     ),
                     rx.el.div(
                         estop_overlay(),
@@ -286,8 +232,7 @@ def manual_control_page() -> rx.Component:
                             rx.el.div(
                                 rx.el.p(
                                     "ALTITUDE",
-                                    class_name="text-xs font-bold mb-2 text-center",
-                                    style={"color": ThemeState.text_secondary},
+                                    class_name="rb-muted text-xs font-bold mb-2 text-center",
                                 ),
                                 rx.el.div(
                                     key_button("W", "w", "arrow-big-up"),
@@ -302,8 +247,7 @@ def manual_control_page() -> rx.Component:
                             rx.el.div(
                                 rx.el.p(
                                     "NAVIGATION",
-                                    class_name="text-xs font-bold mb-2 text-center",
-                                    style={"color": ThemeState.text_secondary},
+                                    class_name="rb-muted text-xs font-bold mb-2 text-center",
                                 ),
                                 rx.el.div(
                                     key_button("UP", "arrowup", "arrow-up"),
@@ -322,20 +266,13 @@ def manual_control_page() -> rx.Component:
                         rx.el.div(
                             rx.el.button(
                                 "EMERGENCY STOP",
-                                on_click=ControlState.request_estop,
+                                type="button",
+                                custom_attrs={"data-estop": "open"},
                                 class_name="w-full py-4 bg-red-600 text-white font-bold rounded-xl hover:bg-red-700 shadow-lg transition-all active:scale-95 flex items-center justify-center gap-2",
                             ),
-                            class_name="mt-auto border-t pt-6",
-                            style={
-                                "borderColor": ThemeState.border_color,
-                                "borderTopWidth": ThemeState.border_width,
-                            },
+                            class_name="rb-divider-t mt-auto border-t pt-6",
                         ),
-                        class_name="p-6 rounded-xl shadow-sm h-full relative overflow-hidden flex flex-col",
-                        style={
-                            "backgroundColor": ThemeState.card_color,
-                            "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                        },
+                        class_name="rb-card p-6 rounded-xl shadow-sm h-full relative overflow-hidden flex flex-col",
                     ),
                     class_name="flex flex-col",
                 ),
@@ -344,4 +281,4 @@ def manual_control_page() -> rx.Component:
             class_name="outline-none focus:ring-0",
         ),
         page_title="Manual Control",
-    )
\ No newline at end of file
+    )
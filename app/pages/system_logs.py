@@ -1,110 +1,159 @@
 import reflex as rx
 from app.components.layout import main_layout
-from app.states.log_state import LogState, LogEntry
-from app.states.theme_state import ThemeState
+from app.states.log_state import LogState, LogEntry, TIME_WINDOWS
 
 
-def filter_button(label: str) -> rx.Component:
-    is_active = LogState.filter_mode == label
+def filter_button(
+    label: str, is_active: rx.Var, on_click: rx.event.EventType
+) -> rx.Component:
     return rx.el.button(
         label,
-        on_click=lambda: LogState.set_filter(label),
-        class_name="px-4 py-2 font-medium rounded-lg transition-all shadow-sm",
-        style=rx.cond(
+        on_click=on_click,
+        class_name=rx.cond(
             is_active,
-            {
-                "backgroundColor": ThemeState.accent_color,
-                "color": rx.cond(ThemeState.is_contrast, "black", "#212B38"),
-                "fontWeight": "bold",
-            },
-            {
-                "backgroundColor": "transparent",
-                "color": ThemeState.text_secondary,
-                "border": f"1px solid {ThemeState.border_color}",
-            },
+            "rb-accent-fill px-4 py-2 font-bold rounded-lg transition-all shadow-sm",
+            "rb-ghost px-4 py-2 font-medium rounded-lg transition-all shadow-sm",
         ),
     )
 
 
+def severity_button(label: str, severity: str) -> rx.Component:
+    return filter_button(
+        label,
+        LogState.severity_filter.contains(severity),
+        lambda: LogState.toggle_severity(severity),
+    )
+
+
+def filter_select(
+    options: list[str] | rx.Var, value: rx.Var, on_change: rx.event.EventType
+) -> rx.Component:
+    return rx.el.select(
+        rx.foreach(options, lambda option: rx.el.option(option, value=option)),
+        value=value,
+        on_change=on_change,
+        class_name="rb-input px-3 py-2 text-sm rounded-lg outline-none border",
+    )
+
+
+def filter_bar() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            filter_button(
+                "All",
+                (LogState.severity_filter.length() == 0)
+                & (LogState.category_filter == "All")
+                & (LogState.time_window == "All time")
+                & (LogState.search_text == ""),
+                LogState.reset_filters,
+            ),
+            severity_button("Errors", "error"),
+            severity_button("Warnings", "warning"),
+            severity_button("Info", "info"),
+            severity_button("Success", "success"),
+            class_name="flex flex-wrap gap-2",
+        ),
+        rx.el.div(
+            filter_select(
+                LogState.category_options,
+                LogState.category_filter,
+                LogState.set_category_filter,
+            ),
+            filter_select(
+                list(TIME_WINDOWS), LogState.time_window, LogState.set_time_window
+            ),
+            rx.el.form(
+                rx.el.input(
+                    name="search",
+                    placeholder="Search messages",
+                    default_value=LogState.search_text,
+                    class_name="rb-input px-3 py-2 text-sm rounded-lg outline-none border w-56",
+                ),
+                on_submit=LogState.search,
+            ),
+            class_name="flex flex-wrap gap-2",
+        ),
+        class_name="flex flex-wrap justify-between gap-4 mb-6",
+    )
+
+
+def page_button(
+    label: str, icon: str, on_click: rx.event.EventType, enabled: rx.Var
+) -> rx.Component:
+    return rx.el.button(
+        rx.icon(icon, class_name="w-4 h-4 mr-1"),
+        label,
+        on_click=on_click,
+        disabled=~enabled,
+        class_name="rb-ghost flex items-center px-3 py-1.5 text-sm font-medium rounded-lg transition-all disabled:opacity-40 disabled:cursor-not-allowed",
+    )
+
+
+def pagination_bar() -> rx.Component:
+    return rx.el.div(
+        rx.el.div(
+            page_button(
+                "Newest", "chevrons-up", LogState.newest_page, LogState.has_newer
+            ),
+            page_button("Newer", "chevron-up", LogState.newer_page, LogState.has_newer),
+            page_button(
+                "Older", "chevron-down", LogState.older_page, LogState.has_older
+            ),
+            class_name="flex gap-2",
+        ),
+        rx.el.div(
+            rx.el.label(
+                "Jump to",
+                class_name="rb-muted text-sm mr-2",
+            ),
+            rx.el.input(
+                type="datetime-local",
+                on_change=LogState.jump_to_time,
+                class_name="rb-input px-3 py-1.5 text-sm rounded-lg outline-none border",
+            ),
+            class_name="flex items-center",
+        ),
+        class_name="flex flex-wrap justify-between items-center gap-4 mt-4",
+    )
+
+
 def log_row(entry: LogEntry) -> rx.Component:
-    severity_base_style = {
-        "fontWeight": "bold",
-        "padding": "2px 8px",
-        "borderRadius": "9999px",
-        "display": "inline-block",
-        "width": "5rem",
-        "textAlign": "center",
-        "fontSize": "0.75rem",
-    }
     return rx.el.tr(
         rx.el.td(
             rx.el.span(entry.timestamp, class_name="font-mono text-sm opacity-70"),
-            class_name="px-6 py-4 whitespace-nowrap",
-            style={"color": ThemeState.text_secondary},
+            class_name="rb-muted px-6 py-4 whitespace-nowrap",
         ),
         rx.el.td(
             rx.el.span(
                 entry.severity.upper(),
-                style=rx.match(
-                    entry.severity,
-                    (
-                        "error",
-                        {
-                            **severity_base_style,
-                            "color": ThemeState.error_color,
-                            "backgroundColor": "rgba(239, 68, 68, 0.1)",
-                            "border": f"1px solid {ThemeState.error_color}",
-                        },
-                    ),
-                    (
-                        "warning",
-                        {
-                            **severity_base_style,
-                            "color": ThemeState.warning_color,
-                            "backgroundColor": "rgba(245, 158, 11, 0.1)",
-                            "border": f"1px solid {ThemeState.warning_color}",
-                        },
-                    ),
-                    (
-                        "success",
-                        {
-                            **severity_base_style,
-                            "color": ThemeState.success_color,
-                            "backgroundColor": "rgba(16, 185, 129, 0.1)",
-                            "border": f"1px solid {ThemeState.success_color}",
-                        },
-                    ),
-                    {
-                        **severity_base_style,
-                        "color": ThemeState.accent_color,
-                        "backgroundColor": "rgba(59, 130, 246, 0.1)",
-                        "border": f"1px solid {ThemeState.accent_color}",
-                    },
-                ),
+                class_name="rb-severity",
+                custom_attrs={"data-severity": entry.severity},
             ),
             class_name="px-6 py-4 whitespace-nowrap",
         ),
         rx.el.td(
             rx.el.span(
                 entry.category,
-                class_name="text-sm font-medium",
-                style={"color": ThemeState.text_secondary},
+                class_name="rb-muted text-sm font-medium",
             ),
             class_name="px-6 py-4 whitespace-nowrap",
         ),
         rx.el.td(
             rx.el.p(
                 entry.message,
-                class_name="text-sm",
-                style={"color": ThemeState.text_primary},
+                rx.cond(
+                    entry.repeats > 1,
+                    rx.el.span(
+                        f"×{entry.repeats}",
+                        title=f"Repeated until {entry.last_timestamp}",
+                        class_name="rb-ghost ml-2 px-1.5 py-0.5 text-xs font-mono rounded",
+                    ),
+                ),
+                class_name="rb-text text-sm",
             ),
             class_name="px-6 py-4",
         ),
-        class_name="transition-colors border-b",
-        style={
-            "borderColor": ThemeState.border_color,
-            "borderBottomWidth": ThemeState.border_width,
-        },
+        class_name="rb-divider-b transition-colors border-b",
     )
 
 
@@ -115,36 +164,40 @@ def system_logs_page() -> rx.Component:
                 rx.el.div(
                     rx.el.h2(
                         "System Logs",
-                        class_name="text-lg font-semibold",
-                        style={"color": ThemeState.text_primary},
+                        class_name="rb-text text-lg font-semibold",
                     ),
                     rx.el.div(
                         rx.el.span(
-                            f"{LogState.filtered_entries.length()} entries",
-                            class_name="text-sm",
-                            style={"color": ThemeState.text_secondary},
+                            rx.cond(
+                                LogState.count_capped,
+                                f"{LogState.filtered_count}+ entries",
+                                f"{LogState.filtered_count} entries",
+                            ),
+                            class_name="rb-muted text-sm",
+                        ),
+                        rx.el.a(
+                            rx.icon(
+                                "download",
+                                class_name="rb-muted w-4 h-4",
+                            ),
+                            href=LogState.export_url,
+                            class_name="ml-4 p-2 rounded-lg transition-colors hover:bg-gray-100/10",
+                            title="Export Logs (CSV)",
                         ),
                         rx.el.button(
                             rx.icon(
                                 "trash-2",
-                                class_name="w-4 h-4 hover:text-red-500",
-                                style={"color": ThemeState.text_secondary},
+                                class_name="rb-muted w-4 h-4 hover:text-red-500",
                             ),
                             on_click=LogState.clear_logs,
-                            class_name="ml-4 p-2 rounded-lg transition-colors hover:bg-gray-100/10",
-                            title="Clear Logs",
+                            class_name="ml-1 p-2 rounded-lg transition-colors hover:bg-gray-100/10",
+                            title="Clear Logs (this view only)",
                         ),
                         class_name="flex items-center",
                     ),
                     class_name="flex justify-between items-center mb-6",
                 ),
-                rx.el.div(
-                    filter_button("All"),
-                    filter_button("Errors Only"),
-                    filter_button("Warnings"),
-                    filter_button("System Events"),
-                    class_name="flex flex-wrap gap-2 mb-6",
-                ),
+                filter_bar(),
                 rx.el.div(
                     rx.el.table(
                         rx.el.thead(
@@ -166,29 +219,18 @@ def system_logs_page() -> rx.Component:
                                     class_name="px-6 py-3 text-left text-xs font-bold uppercase tracking-wider",
                                 ),
                             ),
-                            style={
-                                "backgroundColor": ThemeState.bg_color,
-                                "color": ThemeState.text_secondary,
-                                "borderBottom": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                            },
+                            class_name="rb-surface rb-muted rb-divider-b",
                         ),
                         rx.el.tbody(rx.foreach(LogState.filtered_entries, log_row)),
                         class_name="min-w-full",
                     ),
-                    class_name="overflow-x-auto rounded-xl border",
-                    style={
-                        "borderColor": ThemeState.border_color,
-                        "borderWidth": ThemeState.border_width,
-                    },
+                    class_name="rb-outline overflow-x-auto rounded-xl border",
                 ),
-                class_name="p-6 rounded-xl shadow-sm",
-                style={
-                    "backgroundColor": ThemeState.card_color,
-                    "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                },
+                pagination_bar(),
+                class_name="rb-card p-6 rounded-xl shadow-sm",
             ),
             class_name="space-y-6",
             on_mount=LogState.on_mount,
         ),
         page_title="System Logs",
-    )
\ No newline at end of file
+    )
@@ -1,7 +1,6 @@
 import reflex as rx
 from app.components.layout import main_layout
 from app.states.telemetry_state import TelemetryState
-from app.states.theme_state import ThemeState
 from app.components.visualizations import (
     temp_gauge,
     tension_meter,
@@ -9,29 +8,49 @@ from app.components.visualizations import (
 )
 
 
+def sparkline(points: str) -> rx.Component:
+    """A small trend line drawn from pre-aggregated history buckets."""
+    return rx.el.svg(
+        rx.el.svg.polyline(
+            points=points,
+            fill="none",
+            class_name="rb-stroke-accent",
+            stroke_width="1.5",
+            stroke_linejoin="round",
+            vector_effect="non-scaling-stroke",
+        ),
+        view_box="0 0 100 24",
+        preserve_aspect_ratio="none",
+        class_name="w-full h-8 mt-3",
+    )
+
+
 def status_card(
-    title: str, value: str, icon: str, trend: str = None, trend_up: bool = True
+    title: str,
+    value: str,
+    icon: str,
+    trend: str = None,
+    trend_up: bool = True,
+    trend_points: str = None,
 ) -> rx.Component:
     return rx.el.div(
         rx.el.div(
             rx.el.div(
                 rx.el.p(
                     title,
-                    class_name="text-sm font-medium",
-                    style={"color": ThemeState.text_secondary},
+                    class_name="rb-muted text-sm font-medium",
                 ),
                 rx.el.h3(
                     value,
-                    class_name="text-2xl font-bold mt-1",
-                    style={"color": ThemeState.text_primary},
+                    class_name="rb-text text-2xl font-bold mt-1",
                 ),
             ),
             rx.el.div(
                 rx.icon(
-                    icon, class_name="w-6 h-6", style={"color": ThemeState.accent_color}
+                    icon,
+                    class_name="rb-accent w-6 h-6",
                 ),
-                class_name="p-3 rounded-lg transition-colors duration-300",
-                style={"backgroundColor": ThemeState.bg_color},
+                class_name="rb-surface p-3 rounded-lg transition-colors duration-300",
             ),
             class_name="flex justify-between items-start",
         ),
@@ -40,27 +59,18 @@ def status_card(
             rx.el.div(
                 rx.el.span(
                     trend,
-                    class_name="text-xs font-medium flex items-center mt-4",
-                    style={
-                        "color": rx.cond(
-                            trend_up, ThemeState.accent_color, ThemeState.error_color
-                        )
-                    },
+                    class_name=f"{'rb-accent' if trend_up else 'rb-error'} text-xs font-medium flex items-center mt-4",
                 ),
                 rx.el.span(
                     "vs last hour",
-                    class_name="text-xs ml-2 mt-4",
-                    style={"color": ThemeState.text_secondary},
+                    class_name="rb-muted text-xs ml-2 mt-4",
                 ),
                 class_name="flex items-center",
             ),
             rx.el.div(class_name="mt-4 h-4"),
         ),
-        class_name="p-6 rounded-xl transition-colors duration-300 hover:shadow-md",
-        style={
-            "backgroundColor": ThemeState.card_color,
-            "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-        },
+        sparkline(trend_points) if trend_points is not None else rx.fragment(),
+        class_name="rb-card p-6 rounded-xl transition-colors duration-300 hover:shadow-md",
     )
 
 
@@ -72,22 +82,25 @@ def system_status_page() -> rx.Component:
                     "Belt Speed",
                     f"{TelemetryState.belt_speed} RPM",
                     "gauge",
-                    "+2% Efficiency",
+                    TelemetryState.trends["belt_speed"],
                     True,
+                    TelemetryState.sparklines["belt_speed"],
                 ),
                 status_card(
                     "Motor Temp",
                     f"{TelemetryState.motor_temp}°C",
                     "thermometer",
-                    "Optimal Range",
+                    TelemetryState.trends["motor_temp"],
                     True,
+                    TelemetryState.sparklines["motor_temp"],
                 ),
                 status_card(
                     "Power Draw",
                     f"{TelemetryState.current_draw:.1f} A",
                     "zap",
-                    "-1.2% Usage",
+                    TelemetryState.trends["current_draw"],
                     True,
+                    TelemetryState.sparklines["current_draw"],
                 ),
                 status_card("Uptime", TelemetryState.uptime_formatted, "clock"),
                 class_name="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8",
@@ -97,8 +110,7 @@ def system_status_page() -> rx.Component:
                     rx.el.div(
                         rx.el.h3(
                             "System Health & Diagnostics",
-                            class_name="text-lg font-semibold",
-                            style={"color": ThemeState.text_primary},
+                            class_name="rb-text text-lg font-semibold",
                         ),
                         system_health_indicator(),
                         class_name="flex justify-between items-center mb-4",
@@ -107,22 +119,16 @@ def system_status_page() -> rx.Component:
                         rx.el.div(
                             rx.el.h4(
                                 "Motor Thermal Monitor",
-                                class_name="text-sm font-medium mb-6",
-                                style={"color": ThemeState.text_secondary},
+                                class_name="rb-muted text-sm font-medium mb-6",
                             ),
                             temp_gauge(),
-                            class_name="flex flex-col items-center justify-center p-6 rounded-xl transition-colors duration-300",
-                            style={
-                                "backgroundColor": ThemeState.bg_color,
-                                "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                            },
+                            class_name="rb-inset flex flex-col items-center justify-center p-6 rounded-xl transition-colors duration-300",
                         ),
                         rx.el.div(
                             rx.el.div(
                                 rx.el.h4(
                                     "Belt Tension Analysis",
-                                    class_name="text-sm font-medium mb-4",
-                                    style={"color": ThemeState.text_secondary},
+                                    class_name="rb-muted text-sm font-medium mb-4",
                                 ),
                                 tension_meter(),
                                 class_name="mb-8",
@@ -130,106 +136,56 @@ def system_status_page() -> rx.Component:
                             rx.el.div(
                                 rx.el.h4(
                                     "Component Status",
-                                    class_name="text-sm font-medium mb-3",
-                                    style={"color": ThemeState.text_secondary},
+                                    class_name="rb-muted text-sm font-medium mb-3",
                                 ),
                                 rx.el.div(
                                     rx.el.div(
                                         rx.el.span(
                                             "Drive Motor",
-                                            class_name="text-sm",
-                                            style={"color": ThemeState.text_primary},
+                                            class_name="rb-text text-sm",
                                         ),
                                         rx.el.span(
                                             "Active",
-                                            class_name="text-xs font-bold px-2 py-1 rounded-full",
-                                            style={
-                                                "color": ThemeState.success_color,
-                                                "backgroundColor": rx.cond(
-                                                    ThemeState.is_contrast,
-                                                    "transparent",
-                                                    "rgba(8, 198, 171, 0.2)",
-                                                ),
-                                                "border": rx.cond(
-                                                    ThemeState.is_contrast,
-                                                    f"1px solid {ThemeState.success_color}",
-                                                    "none",
-                                                ),
-                                            },
+                                            class_name="rb-success-badge text-xs font-bold px-2 py-1 rounded-full",
                                         ),
-                                        class_name="flex justify-between items-center py-2 border-b",
-                                        style={
-                                            "borderColor": ThemeState.border_color,
-                                            "borderBottomWidth": ThemeState.border_width,
-                                        },
+                                        class_name="rb-divider-b flex justify-between items-center py-2 border-b",
                                     ),
                                     rx.el.div(
                                         rx.el.span(
                                             "Tensioner Arm",
-                                            class_name="text-sm",
-                                            style={"color": ThemeState.text_primary},
+                                            class_name="rb-text text-sm",
                                         ),
                                         rx.el.span(
                                             "Locked",
-                                            class_name="text-xs font-bold px-2 py-1 rounded-full",
-                                            style={
-                                                "color": ThemeState.success_color,
-                                                "backgroundColor": rx.cond(
-                                                    ThemeState.is_contrast,
-                                                    "transparent",
-                                                    "rgba(8, 198, 171, 0.2)",
-                                                ),
-                                                "border": rx.cond(
-                                                    ThemeState.is_contrast,
-                                                    f"1px solid {ThemeState.success_color}",
-                                                    "none",
-                                                ),
-                                            },
+                                            class_name="rb-success-badge text-xs font-bold px-2 py-1 rounded-full",
                                         ),
-                                        class_name="flex justify-between items-center py-2 border-b",
-                                        style={
-                                            "borderColor": ThemeState.border_color,
-                                            "borderBottomWidth": ThemeState.border_width,
-                                        },
+                                        class_name="rb-divider-b flex justify-between items-center py-2 border-b",
                                     ),
                                     rx.el.div(
                                         rx.el.span(
                                             "Emergency Stop",
-                                            class_name="text-sm",
-                                            style={"color": ThemeState.text_primary},
+                                            class_name="rb-text text-sm",
                                         ),
                                         rx.el.span(
                                             "Disengaged",
-                                            class_name="text-xs font-bold px-2 py-1 rounded-full",
-                                            style={
-                                                "color": ThemeState.text_secondary,
-                                                "backgroundColor": ThemeState.bg_color,
-                                                "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                                            },
+                                            class_name="rb-muted rb-inset text-xs font-bold px-2 py-1 rounded-full",
                                         ),
                                         class_name="flex justify-between items-center py-2",
                                     ),
-                                    class_name="rounded-xl p-4",
-                                    style={
-                                        "backgroundColor": ThemeState.card_color,
-                                        "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                                    },
+                                    class_name="rb-card rounded-xl p-4",
                                 ),
                             ),
                             class_name="flex flex-col justify-center",
                         ),
                         class_name="grid grid-cols-1 md:grid-cols-2 gap-8",
                     ),
-                    class_name="p-6 rounded-xl shadow-sm transition-colors duration-300",
-                    style={
-                        "backgroundColor": ThemeState.card_color,
-                        "border": f"{ThemeState.border_width} solid {ThemeState.border_color}",
-                    },
+                    class_name="rb-card p-6 rounded-xl shadow-sm transition-colors duration-300",
                 ),
                 class_name="mb-8",
             ),
             class_name="flex flex-col",
-            on_mount=TelemetryState.start_simulation,
+            on_mount=TelemetryState.enter_status_page,
+            on_unmount=TelemetryState.leave_status_page,
         ),
         page_title="System Status",
-    )
\ No newline at end of file
+    )
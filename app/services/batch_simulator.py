@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+from app.services import settings
+from app.services.telemetry_history import CHANNELS
+
+SPEED, TEMP, TENSION, CURRENT = (
+    CHANNELS.index(name)
+    for name in ("belt_speed", "motor_temp", "belt_tension", "current_draw")
+)
+
+
+@dataclass(frozen=True)
+class FaultScenario:
+    """A fault that changes a belt's physics for `duration` seconds.
+
+    `heat` adds °C per second on top of normal thermal drift, `tension`
+    and `current` offset those channels, and `speed_factor` scales the
+    speed the belt actually reaches (0 for a jam).
+    """
+
+    name: str
+    duration: float
+    heat: float = 0.0
+    tension: float = 0.0
+    current: float = 0.0
+    speed_factor: float = 1.0
+
+
+FAULT_SCENARIOS = (
+    FaultScenario("overheat", duration=90, heat=0.8),
+    FaultScenario("slip", duration=30, tension=-150, speed_factor=0.8),
+    FaultScenario("overtension", duration=45, tension=160, current=0.8),
+    FaultScenario("jam", duration=15, heat=0.5, current=3.0, speed_factor=0.0),
+)
+
+
+class BatchSimulator:
+    """Vectorized simulation of `size` belts advanced together each tick.
+
+    Every belt ramps towards its own target speed, its motor temperature
+    lags towards an equilibrium set by speed and a slowly drifting ambient
+    temperature, and tension and current follow speed with noise. Faults
+    from `FAULT_SCENARIOS` are started at random at `fault_rate` per belt
+    per second, or on demand with `inject`. Targets are re-drawn at
+    `retarget_rate` per belt per second so a fleet keeps ramping up and
+    down; the single-belt source sets it to 0 and drives the target itself.
+
+    All state is held in per-belt arrays and a tick is a fixed number of
+    whole-array operations, so 10k belts advance in a few milliseconds.
+    """
+
+    accel = 7.5  # RPM per second
+    decel = 12.5
+    max_speed = 3000
+    ambient = 25.0
+    heat_per_rpm = 0.02
+    thermal_lag = 30.0  # seconds; 0 disables the pull towards equilibrium
+    temp_drift = 0.0  # °C per second
+    temp_walk = 0.0  # °C per square-root second
+    temp_noise = 0.3  # °C per tick
+    tension_per_rpm = 0.05
+    tension_noise = 2.0
+    current_per_rpm = 0.002
+    current_noise = 0.02
+
+    def __init__(
+        self,
+        size: int,
+        interval: float = settings.TELEMETRY_INTERVAL,
+        seed: int | None = None,
+        fault_rate: float = settings.SIM_FAULT_RATE,
+        retarget_rate: float = 0.0,
+        scenarios: Sequence[FaultScenario] = FAULT_SCENARIOS,
+    ):
+        self.size = size
+        self.interval = interval
+        self.fault_rate = fault_rate
+        self.retarget_rate = retarget_rate
+        self.scenarios = tuple(scenarios)
+        self.elapsed = 0.0
+        self._rng = np.random.default_rng(seed)
+        # Row 0 is "no fault", so fault index + 1 selects the parameters.
+        self._heat = np.array([0.0] + [s.heat for s in self.scenarios])
+        self._tension = np.array([0.0] + [s.tension for s in self.scenarios])
+        self._current = np.array([0.0] + [s.current for s in self.scenarios])
+        self._speed_factor = np.array([1.0] + [s.speed_factor for s in self.scenarios])
+        self._duration = np.array([s.duration for s in self.scenarios])
+        self._names = [s.name for s in self.scenarios]
+        self.target = np.zeros(size)
+        self.speed = np.zeros(size)
+        self.temp = np.full(size, self.ambient)
+        self.ambient_offset = np.zeros(size)
+        self.fault = np.full(size, -1, dtype=np.int8)
+        self.fault_until = np.zeros(size)
+
+    def set_target(self, speed: float | np.ndarray, belts=None):
+        """Set the target speed of every belt, or of the selected belts."""
+        speed = np.clip(speed, 0, self.max_speed)
+        if belts is None:
+            self.target[:] = speed
+        else:
+            self.target[belts] = speed
+
+    def randomize(self, low: float = 0, high: float = 1800):
+        """Start every belt at a random running speed and warm motor."""
+        self.set_target(self._rng.uniform(low, high, self.size))
+        self.speed[:] = self.target
+        self.temp[:] = self._equilibrium(self.speed)
+
+    def inject(self, name: str, belts=None, duration: float | None = None):
+        """Start a fault scenario on every belt, or on the selected belts."""
+        fault = self._names.index(name)
+        belts = slice(None) if belts is None else belts
+        self.fault[belts] = fault
+        if duration is None:
+            duration = self.scenarios[fault].duration
+        self.fault_until[belts] = self.elapsed + duration
+
+    def active_faults(self) -> dict[str, int]:
+        """Number of belts currently in each fault scenario."""
+        counts = np.bincount(self.fault + 1, minlength=len(self.scenarios) + 1)
+        return {name: int(n) for name, n in zip(self._names, counts[1:].tolist())}
+
+    def _equilibrium(self, speed: np.ndarray) -> np.ndarray:
+        return self.ambient + self.ambient_offset + speed * self.heat_per_rpm
+
+    def _start_faults(self, dt: float):
+        rng = self._rng
+        self.fault[self.fault_until <= self.elapsed] = -1
+        if self.fault_rate <= 0:
+            return
+        healthy = self.fault < 0
+        start = np.flatnonzero(healthy & (rng.random(self.size) < self.fault_rate * dt))
+        if len(start):
+            faults = rng.integers(0, len(self.scenarios), len(start))
+            self.fault[start] = faults
+            self.fault_until[start] = self.elapsed + self._duration[faults]
+
+    def _retarget(self, dt: float):
+        if self.retarget_rate <= 0:
+            return
+        rng = self._rng
+        belts = np.flatnonzero(rng.random(self.size) < self.retarget_rate * dt)
+        if len(belts):
+            self.target[belts] = rng.uniform(0, 2000, len(belts)).round(-1)
+
+    def step(
+        self, dt: float | None = None, speed: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Advance every belt by `dt` seconds and return a `(size, 4)` array.
+
+        Columns follow `CHANNELS`. With `speed`, the belts run at the given
+        speeds, measured by an external motor model, instead of ramping
+        towards their targets.
+        """
+        dt = self.interval if dt is None else dt
+        rng = self._rng
+        size = self.size
+        self.elapsed += dt
+        self._retarget(dt)
+        self._start_faults(dt)
+        fault = self.fault + 1
+
+        if speed is None:
+            ramp = np.clip(self.target - self.speed, -self.decel * dt, self.accel * dt)
+            self.speed += ramp
+            running = self.speed > 0
+            self.speed += running * rng.normal(0, 1.0, size)
+        else:
+            self.speed[:] = speed
+        np.clip(self.speed, 0, self.max_speed, out=self.speed)
+        speed = self.speed * self._speed_factor[fault]
+
+        self.ambient_offset += rng.normal(0, 0.02 * np.sqrt(dt), size)
+        np.clip(self.ambient_offset, -5, 10, out=self.ambient_offset)
+        if self.thermal_lag > 0:
+            lag = min(1.0, dt / self.thermal_lag)
+            self.temp += (self._equilibrium(speed) - self.temp) * lag
+        self.temp += (self.temp_drift + self._heat[fault]) * dt
+        noise = np.hypot(self.temp_noise, self.temp_walk * np.sqrt(dt))
+        self.temp += rng.normal(0, noise, size)
+        np.clip(self.temp, 20, 95, out=self.temp)
+
+        tension = 450 + speed * self.tension_per_rpm + self._tension[fault]
+        tension += rng.uniform(-self.tension_noise, self.tension_noise, size)
+        current = 1.0 + speed * self.current_per_rpm + self._current[fault]
+        current += rng.uniform(-self.current_noise, self.current_noise, size)
+
+        values = np.empty((size, len(CHANNELS)))
+        values[:, SPEED] = speed
+        values[:, TEMP] = self.temp
+        values[:, TENSION] = np.clip(tension, 300, 600)
+        values[:, CURRENT] = np.clip(current, 0.5, 8.0)
+        return values
+
+    def read(self) -> np.ndarray:
+        """The next tick at the simulator's own interval."""
+        return self.step()
+
+
+class SingleBeltSimulator(BatchSimulator):
+    """The operator dashboard's belt, with its original physics.
+
+    Tension and current follow speed with the steeper coefficients and
+    wider noise of the original single-belt simulation, and the motor
+    temperature is its random walk: on average +0.5 °C per 2 s tick with
+    no pull towards an equilibrium, scaled here to any tick interval.
+    """
+
+    thermal_lag = 0.0
+    temp_drift = 0.25
+    temp_walk = 0.79
+    temp_noise = 0.0
+    tension_per_rpm = 0.2
+    tension_noise = 10.0
+    current_per_rpm = 0.01
+    current_noise = 0.1
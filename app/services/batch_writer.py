@@ -0,0 +1,113 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any
+
+_IDLE = object()
+
+
+class BatchWriter:
+    """Background thread that persists queued items in batches.
+
+    `submit` never blocks: items are queued and written by the thread every
+    `batch_size` items or `flush_interval` seconds, whichever comes first.
+    When the queue is full new items are dropped and counted. Subclasses
+    implement `_open`, `_write_batch` and `_close`, and may override
+    `_maintain` for periodic housekeeping.
+    """
+
+    name = "batch-writer"
+    maintain_interval = 3600.0
+
+    def __init__(self, batch_size: int, flush_interval: float, queue_size: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[Any] = queue.Queue(queue_size)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.close)
+
+    def submit(self, item: Any):
+        """Queue an item for writing without blocking."""
+        if self._thread is None:
+            self.start()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        """Flush pending items and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout=max(self.flush_interval, 5.0))
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _write_batch(self, batch: list[Any]):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+    def _maintain(self):
+        pass
+
+    def _flush(self, batch: list[Any]):
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            logging.exception(f"Error: {e}")
+
+    def _run(self):
+        try:
+            self._open()
+        except Exception as e:
+            logging.exception(f"Error: {e}")
+            return
+        batch: list[Any] = []
+        deadline = time.monotonic() + self.flush_interval
+        last_maintenance = time.monotonic()
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = _IDLE
+            if item is None:
+                running = False
+            elif item is not _IDLE:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+            now = time.monotonic()
+            if batch and (
+                len(batch) >= self.batch_size or now >= deadline or not running
+            ):
+                self._flush(batch)
+                batch = []
+            if not batch:
+                deadline = now + self.flush_interval
+            if now - last_maintenance >= self.maintain_interval:
+                try:
+                    self._maintain()
+                except Exception as e:
+                    logging.exception(f"Error: {e}")
+                last_maintenance = now
+        self._close()
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from typing import Protocol, Sequence
+from app.services.fleet import fleet_hub
+from app.services.log_bus import LogBus, log_bus
+from app.services.metrics import metrics
+from app.services.motor_control import motor_control
+from app.services.telemetry_hub import telemetry_hub
+
+TRIGGER_TIME = metrics.histogram("estop.trigger_ms")
+
+
+class Producer(Protocol):
+    def halt(self, active: bool): ...
+
+
+class EstopSubscription:
+    """Wake-up signal for one session mirroring the e-stop latch."""
+
+    def __init__(self, estop: "EmergencyStop", key: str):
+        self._estop = estop
+        self.key = key
+        self._event = asyncio.Event()
+        self.closed = False
+
+    def notify(self):
+        self._event.set()
+
+    async def wait(self) -> bool:
+        """Wait for a change; returns False once the subscription is replaced."""
+        await self._event.wait()
+        self._event.clear()
+        return not self.closed
+
+    def stop(self):
+        self.closed = True
+        self._event.set()
+
+    def close(self):
+        self.stop()
+        self._estop.unsubscribe(self)
+
+
+class EmergencyStop:
+    """Process-wide emergency stop latch.
+
+    `trigger` and `reset` never await: every producer is halted and every
+    subscribed session is woken before they return, so a stop takes effect
+    in the call that requests it. Sessions then mirror the latch into their
+    own state; a busy session delays what its operator sees, never the stop.
+    """
+
+    def __init__(self, producers: Sequence[Producer], log: LogBus | None = None):
+        self.producers = list(producers)
+        self.log = log
+        self.active = False
+        self.source = ""
+        self.changed_at = 0.0
+        self.triggers = 0
+        self._subscribers: dict[str, EstopSubscription] = {}
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def trigger(self, source: str = "operator") -> bool:
+        """Latch the stop; returns False if it was already active."""
+        if self.active:
+            return False
+        began = time.monotonic()
+        self.active = True
+        self.triggers += 1
+        self._changed(source)
+        TRIGGER_TIME.observe((time.monotonic() - began) * 1000)
+        if self.log is not None:
+            self.log.publish(
+                "error",
+                "System",
+                f"EMERGENCY STOP TRIGGERED BY {source.upper()}. SYSTEM HALTED.",
+                audit=True,
+            )
+        return True
+
+    def reset(self, source: str = "operator") -> bool:
+        """Release the stop; returns False if it was not active."""
+        if not self.active:
+            return False
+        self.active = False
+        self._changed(source)
+        if self.log is not None:
+            self.log.publish(
+                "warning",
+                "System",
+                "Emergency stop reset. System returned to ready state.",
+                audit=True,
+            )
+        return True
+
+    def _changed(self, source: str):
+        self.source = source
+        self.changed_at = time.monotonic()
+        for producer in self.producers:
+            producer.halt(self.active)
+        for subscription in tuple(self._subscribers.values()):
+            subscription.notify()
+
+    def status(self) -> dict:
+        return {
+            "active": self.active,
+            "source": self.source,
+            "since": (
+                round(time.monotonic() - self.changed_at, 3)
+                if self.changed_at
+                else None
+            ),
+        }
+
+    def subscribe(self, key: str) -> EstopSubscription:
+        previous = self._subscribers.pop(key, None)
+        if previous is not None:
+            previous.stop()
+        subscription = EstopSubscription(self, key)
+        self._subscribers[key] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription: EstopSubscription):
+        if self._subscribers.get(subscription.key) is subscription:
+            del self._subscribers[subscription.key]
+
+
+emergency_stop = EmergencyStop([motor_control, telemetry_hub, fleet_hub], log=log_bus)
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Sequence
+import numpy as np
+from app.services import settings
+from app.services.batch_simulator import BatchSimulator
+from app.services.health_rules import HealthEngine
+from app.services.telemetry_delta import PRECISION
+from app.services.telemetry_history import CHANNELS
+
+# Fleet tiles are small, so they use coarser deadbands than the belt view.
+FLEET_DEADBANDS = {
+    "belt_speed": 10,
+    "motor_temp": 1,
+    "belt_tension": 5,
+    "current_draw": 0.1,
+}
+_DEADBANDS = np.array([FLEET_DEADBANDS[name] for name in CHANNELS])
+_PRECISION = [PRECISION.get(name, 0) for name in CHANNELS]
+
+
+class FleetTelemetry:
+    """Columnar telemetry for a fleet of belts.
+
+    `values` holds one row per belt and one column per channel, and
+    `health` one compact level per belt (0 Optimal, 1 Warning,
+    2 Critical). `update` returns only the belts whose readings moved past
+    a channel deadband or whose health changed since they were last shown.
+    """
+
+    def __init__(self, belt_ids: Sequence[str]):
+        self.belt_ids = list(belt_ids)
+        size = len(self.belt_ids)
+        self.values = np.zeros((size, len(CHANNELS)))
+        self.health = np.zeros(size, dtype=np.int8)
+        self.engine = HealthEngine(belts=size)
+        self._shown = np.full((size, len(CHANNELS)), np.nan)
+        self._shown_health = np.full(size, -1, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.belt_ids)
+
+    def update(self, values: np.ndarray, now: float) -> np.ndarray:
+        """Store a tick for every belt and return the indices that changed."""
+        self.values = values
+        self.health = self.engine.evaluate(values, now)
+        moved = ~(np.abs(values - self._shown) < _DEADBANDS).all(axis=1)
+        changed = np.flatnonzero(moved | (self.health != self._shown_health))
+        self._shown[changed] = values[changed]
+        self._shown_health[changed] = self.health[changed]
+        return changed
+
+    def rows(self, indices: np.ndarray) -> list[list[float]]:
+        """Compact `[index, health, *channels]` rows at display precision."""
+        rows = []
+        for i in indices.tolist():
+            row = [i, int(self.health[i])]
+            for value, digits in zip(self.values[i].tolist(), _PRECISION):
+                row.append(round(value, digits) if digits else int(round(value)))
+            rows.append(row)
+        return rows
+
+    def health_counts(self) -> list[int]:
+        return np.bincount(self.health, minlength=3).tolist()
+
+
+def create_fleet_source(size: int, interval: float) -> BatchSimulator:
+    """A simulated fleet already running at mixed speeds."""
+    source = BatchSimulator(
+        size,
+        interval=interval,
+        seed=settings.SIM_SEED,
+        retarget_rate=settings.FLEET_RETARGET_RATE,
+    )
+    source.randomize()
+    return source
+
+
+class FleetSubscription:
+    """Belts changed since one session last read the fleet."""
+
+    def __init__(self, hub: "FleetHub", key: str):
+        self._hub = hub
+        self.key = key
+        self._pending = np.ones(len(hub.fleet), dtype=bool)
+        self._event = asyncio.Event()
+        if hub.ticks:
+            self._event.set()
+        self.closed = False
+
+    def mark(self, indices: np.ndarray):
+        if len(indices):
+            self._pending[indices] = True
+            self._event.set()
+
+    async def changed(self) -> np.ndarray | None:
+        """Wait for changes and return the indices of the changed belts.
+
+        Returns None once the subscription has been replaced or closed.
+        """
+        await self._event.wait()
+        self._event.clear()
+        if self.closed:
+            return None
+        indices = np.flatnonzero(self._pending)
+        self._pending[:] = False
+        return indices
+
+    def stop(self):
+        """Wake the waiting session so it can exit."""
+        self.closed = True
+        self._event.set()
+
+    def close(self):
+        self.stop()
+        self._hub.unsubscribe(self)
+
+
+class FleetHub:
+    """Process-wide fleet producer, running while the fleet page is open."""
+
+    def __init__(
+        self,
+        belt_ids: Sequence[str],
+        source_factory: Callable[[int, float], BatchSimulator] = create_fleet_source,
+        interval: float = settings.FLEET_INTERVAL,
+    ):
+        self.fleet = FleetTelemetry(belt_ids)
+        self._source_factory = source_factory
+        self.interval = interval
+        self.ticks = 0
+        self.halted = False
+        self._source: BatchSimulator | None = None
+        self._retarget_rate = 0.0
+        self._subscribers: dict[str, FleetSubscription] = {}
+        self._task: asyncio.Task | None = None
+
+    def halt(self, active: bool):
+        """Stop every belt, and keep them stopped, while `active`."""
+        self.halted = active
+        if self._source is not None:
+            self._apply_halt(self._source)
+
+    def _apply_halt(self, source: BatchSimulator):
+        if self.halted:
+            source.retarget_rate = 0.0
+            source.set_target(0)
+        else:
+            source.retarget_rate = self._retarget_rate
+
+    def subscribe(self, key: str) -> FleetSubscription:
+        previous = self._subscribers.pop(key, None)
+        if previous is not None:
+            previous.stop()
+        subscription = FleetSubscription(self, key)
+        self._subscribers[key] = subscription
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._produce())
+        return subscription
+
+    def unsubscribe(self, subscription: FleetSubscription):
+        if self._subscribers.get(subscription.key) is subscription:
+            del self._subscribers[subscription.key]
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _produce(self):
+        source = self._source = self._source_factory(len(self.fleet), self.interval)
+        self._retarget_rate = source.retarget_rate
+        if self.halted:
+            self._apply_halt(source)
+        deadline = time.monotonic()
+        while True:
+            try:
+                changed = self.fleet.update(source.read(), time.monotonic())
+            except Exception as e:
+                logging.exception(f"Error: {e}")
+            else:
+                self.ticks += 1
+                for subscription in tuple(self._subscribers.values()):
+                    subscription.mark(changed)
+            deadline = max(deadline + self.interval, time.monotonic())
+            await asyncio.sleep(deadline - time.monotonic())
+
+
+fleet_hub = FleetHub([f"BELT-{i + 1:03d}" for i in range(settings.FLEET_SIZE)])
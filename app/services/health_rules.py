@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+from app.services.telemetry_history import CHANNELS
+
+OPTIMAL, WARNING, CRITICAL = 0, 1, 2
+HEALTH_LABELS = ("Optimal", "Warning", "Critical")
+
+
+@dataclass(frozen=True)
+class HealthRule:
+    """Raise `level` while a channel is above `above` or below `below`.
+
+    Once raised, the channel must come back inside the limits by
+    `hysteresis` before the rule clears, and either change only takes
+    effect after the condition has held for `dwell` seconds.
+    """
+
+    channel: str
+    level: int
+    above: float | None = None
+    below: float | None = None
+    hysteresis: float = 0.0
+    dwell: float = 0.0
+
+
+DEFAULT_RULES = (
+    HealthRule("motor_temp", WARNING, above=70, hysteresis=2, dwell=4),
+    HealthRule("motor_temp", CRITICAL, above=85, hysteresis=2, dwell=2),
+    HealthRule("belt_tension", WARNING, above=550, below=350, hysteresis=5, dwell=4),
+    HealthRule("belt_tension", CRITICAL, above=580, below=320, hysteresis=5, dwell=2),
+)
+
+
+class HealthEngine:
+    """Evaluates a fixed rule set for any number of belts per tick.
+
+    Rules are compiled into per-rule arrays and each tick is a handful of
+    whole-array operations over a `(belts, rules)` grid, so the cost does
+    not grow with Python branches per rule or per belt.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[HealthRule] = DEFAULT_RULES,
+        belts: int = 1,
+        channels: Sequence[str] = CHANNELS,
+    ):
+        self.rules = tuple(rules)
+        self._channel = np.array([channels.index(r.channel) for r in self.rules])
+        self._level = np.array([r.level for r in self.rules], dtype=np.int8)
+        self._above = np.array(
+            [np.inf if r.above is None else r.above for r in self.rules]
+        )
+        self._below = np.array(
+            [-np.inf if r.below is None else r.below for r in self.rules]
+        )
+        self._hysteresis = np.array([r.hysteresis for r in self.rules])
+        self._dwell = np.array([r.dwell for r in self.rules])
+        self.resize(belts)
+
+    def resize(self, belts: int):
+        """Reset the engine for `belts` belts, all starting Optimal."""
+        shape = (belts, len(self.rules))
+        self._active = np.zeros(shape, dtype=bool)
+        self._pending_since = np.full(shape, np.nan)
+        self.health = np.zeros(belts, dtype=np.int8)
+
+    def evaluate(self, values: np.ndarray, now: float) -> np.ndarray:
+        """Update and return the health level of every belt.
+
+        `values` has one row per belt and one column per channel.
+        """
+        readings = values[:, self._channel]
+        tripped = (readings > self._above) | (readings < self._below)
+        cleared = (readings <= self._above - self._hysteresis) & (
+            readings >= self._below + self._hysteresis
+        )
+        wanted = np.where(self._active, ~cleared, tripped)
+        changing = wanted != self._active
+        since = np.where(
+            changing,
+            np.where(np.isnan(self._pending_since), now, self._pending_since),
+            np.nan,
+        )
+        commit = changing & (now - since >= self._dwell)
+        self._active ^= commit
+        since[commit] = np.nan
+        self._pending_since = since
+        self.health = np.where(self._active, self._level, OPTIMAL).max(
+            axis=1, initial=OPTIMAL
+        )
+        return self.health
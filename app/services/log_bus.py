@@ -0,0 +1,262 @@
+import asyncio
+import re
+import time
+from typing import Callable
+from app.services import settings
+from app.services.log_index import LogIndex, log_index
+from app.services.log_sink import LogSink, log_sink
+from app.services.log_store import LogRecord, LogStore
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+# Delay before sessions are told about repeat counts on visible entries.
+REPEAT_NOTIFY_DELAY = 1.0
+# Floor on the sweep period, so a zero coalesce window cannot spin it.
+MIN_SWEEP_INTERVAL = 1.0
+
+
+def message_template(message: str) -> str:
+    """The message with its numbers masked, used to group repeats."""
+    return _NUMBER.sub("#", message)
+
+
+class TokenBucket:
+    """Allows `rate` events per second on average, in bursts of `burst`."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _Window:
+    """An entry that identical events are folded into until `closes`."""
+
+    __slots__ = ("entry_id", "closes")
+
+    def __init__(self, entry_id: int, closes: float):
+        self.entry_id = entry_id
+        self.closes = closes
+
+
+class LogSubscription:
+    """Wake-up signal for one session following the shared log.
+
+    Publishing only sets a flag; the session reads whatever is new from
+    the shared store past its own cursor, so a burst of entries costs one
+    wake-up rather than one queued copy per entry. Ids of entries whose
+    repeat count changed are collected for the session to re-read.
+    """
+
+    def __init__(self, bus: "LogBus", key: str):
+        self._bus = bus
+        self.key = key
+        self._event = asyncio.Event()
+        self.repeated: set[int] = set()
+
+    def notify(self):
+        self._event.set()
+
+    async def wait(self):
+        await self._event.wait()
+        self._event.clear()
+
+    def take_repeated(self) -> set[int]:
+        repeated, self.repeated = self.repeated, set()
+        return repeated
+
+    def close(self):
+        self._bus.unsubscribe(self)
+
+
+class LogBus:
+    """Process-wide log shared by every session.
+
+    Entries are appended once to a single `LogStore`, archived to the sink
+    and added to the searchable history index; sessions keep only a read
+    cursor and the page they display.
+
+    Events with the same severity, category and message template within
+    `coalesce_window` seconds are folded into the first entry's repeat
+    count instead of creating new entries; the entry keeps the latest
+    message text, and sessions hear about new counts at most once per
+    `REPEAT_NOTIFY_DELAY`. Each category is also rate limited by a token
+    bucket; suppressed entries are summarized once the category has tokens
+    again, or by the sweep once a burst has stopped. Errors are never rate
+    limited. Audit entries, the record of operator actions and e-stops,
+    are never coalesced or rate limited, so every action keeps its own
+    entry in order.
+    """
+
+    def __init__(
+        self,
+        store: LogStore | None = None,
+        sink: LogSink | None = None,
+        index: LogIndex | None = None,
+        coalesce_window: float = settings.LOG_COALESCE_WINDOW,
+        rate: float = settings.LOG_RATE_PER_SECOND,
+        burst: int = settings.LOG_RATE_BURST,
+    ):
+        self.store = store if store is not None else LogStore()
+        self.sink = sink
+        self.index = index
+        self.coalesce_window = coalesce_window
+        self.rate = rate
+        self.burst = burst
+        self.coalesced = 0
+        self.suppressed: dict[str, int] = {}
+        self._started = False
+        self._subscribers: dict[str, LogSubscription] = {}
+        self._windows: dict[tuple[str, str, str], _Window] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._sweep_pending = False
+        self._notify_pending = False
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _start(self):
+        """Record the process start once, on first use."""
+        self._started = True
+        self.publish("info", "System", "System initialized successfully.")
+
+    def _call_later(self, delay: float, callback: Callable[[], None]) -> bool:
+        """Schedule a callback on the running loop, if there is one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        loop.call_later(delay, callback)
+        return True
+
+    def _persist(self, record: LogRecord):
+        if self.sink is not None:
+            self.sink.write(record)
+        if self.index is not None:
+            self.index.write(record)
+
+    def _append(self, now: float, severity: str, category: str, message: str):
+        entry_id = self.store.append(now, severity, category, message)
+        record = self.store.get(entry_id)
+        self._persist(record)
+        for subscription in tuple(self._subscribers.values()):
+            subscription.notify()
+        return record
+
+    def _allow(self, severity: str, category: str, now: float) -> bool:
+        """Take a token for the category, summarizing earlier drops."""
+        if severity == "error":
+            return True
+        bucket = self._buckets.get(category)
+        if bucket is None:
+            bucket = self._buckets[category] = TokenBucket(self.rate, self.burst, now)
+        if not bucket.take(now):
+            self.suppressed[category] = self.suppressed.get(category, 0) + 1
+            self._schedule_sweep()
+            return False
+        self._summarize(category, now)
+        return True
+
+    def _summarize(self, category: str, now: float):
+        dropped = self.suppressed.pop(category, 0)
+        if dropped:
+            self._append(
+                now,
+                "warning",
+                category,
+                f"{dropped} {category} entries suppressed by rate limiting.",
+            )
+
+    def _repeat(self, window: _Window, now: float, message: str) -> LogRecord:
+        self.store.bump(window.entry_id, now, message)
+        self.coalesced += 1
+        for subscription in self._subscribers.values():
+            subscription.repeated.add(window.entry_id)
+        if not self._notify_pending:
+            self._notify_pending = self._call_later(
+                REPEAT_NOTIFY_DELAY, self._notify_repeats
+            )
+        return self.store.get(window.entry_id)
+
+    def _notify_repeats(self):
+        self._notify_pending = False
+        for subscription in tuple(self._subscribers.values()):
+            if subscription.repeated:
+                subscription.notify()
+
+    def _close_window(self, key: tuple[str, str, str]):
+        """Persist the final repeat count of a coalesced entry."""
+        window = self._windows.pop(key)
+        record = self.store.get(window.entry_id)
+        if record is not None and record.repeats > 1:
+            self._persist(record)
+
+    def _sweep(self):
+        self._sweep_pending = False
+        now = time.time()
+        for key, window in tuple(self._windows.items()):
+            if window.closes <= now:
+                self._close_window(key)
+        for category in tuple(self.suppressed):
+            if self._buckets[category].take(now):
+                self._summarize(category, now)
+        if self._windows or self.suppressed:
+            self._schedule_sweep()
+
+    def _schedule_sweep(self):
+        if not self._sweep_pending:
+            self._sweep_pending = self._call_later(
+                max(self.coalesce_window, MIN_SWEEP_INTERVAL), self._sweep
+            )
+
+    def publish(
+        self, severity: str, category: str, message: str, audit: bool = False
+    ) -> LogRecord | None:
+        """Log an entry for every session and wake their followers.
+
+        `audit` marks an operator action or e-stop, which always gets its
+        own entry. Returns the new or coalesced entry, or None if it was
+        rate limited.
+        """
+        if not self._started:
+            self._start()
+        now = time.time()
+        if audit:
+            return self._append(now, severity, category, message)
+        key = (severity, category, message_template(message))
+        window = self._windows.get(key)
+        if window is not None:
+            if now < window.closes and self.store.get(window.entry_id) is not None:
+                return self._repeat(window, now, message)
+            self._close_window(key)
+        if not self._allow(severity, category, now):
+            return None
+        record = self._append(now, severity, category, message)
+        self._windows[key] = _Window(record.id, now + self.coalesce_window)
+        self._schedule_sweep()
+        return record
+
+    def subscribe(self, key: str) -> LogSubscription:
+        if not self._started:
+            self._start()
+        subscription = LogSubscription(self, key)
+        self._subscribers[key] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription):
+        if self._subscribers.get(subscription.key) is subscription:
+            del self._subscribers[subscription.key]
+
+
+log_bus = LogBus(sink=log_sink, index=log_index)
@@ -0,0 +1,178 @@
+import os
+import sqlite3
+import time
+from typing import Iterator
+from app.services import settings
+from app.services.batch_writer import BatchWriter
+from app.services.log_store import LogRecord, Severity
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    severity INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    message TEXT NOT NULL,
+    repeats INTEGER NOT NULL DEFAULT 1,
+    last REAL
+);
+CREATE INDEX IF NOT EXISTS logs_ts ON logs (ts);
+CREATE VIRTUAL TABLE IF NOT EXISTS logs_fts USING fts5 (
+    message, content='logs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS logs_insert AFTER INSERT ON logs BEGIN
+    INSERT INTO logs_fts (rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS logs_update AFTER UPDATE OF message ON logs BEGIN
+    INSERT INTO logs_fts (logs_fts, rowid, message)
+    VALUES ('delete', old.id, old.message);
+    INSERT INTO logs_fts (rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS logs_delete AFTER DELETE ON logs BEGIN
+    INSERT INTO logs_fts (logs_fts, rowid, message)
+    VALUES ('delete', old.id, old.message);
+END;
+"""
+
+
+def fts_phrase(text: str) -> str:
+    """Quote each word so user input is never parsed as FTS syntax."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+class LogIndex(BatchWriter):
+    """Full log history in SQLite with an FTS5 index over messages.
+
+    Entries are inserted in batches by the writer thread; reads open their
+    own connection and page through results in chunks so exports and
+    searches over millions of rows never hold them all in memory.
+
+    Row ids are the log bus ids offset past the rows of earlier runs, so
+    writing a coalesced entry again updates its repeat count in place.
+    """
+
+    name = "log-index"
+
+    def __init__(
+        self,
+        path: str = settings.LOG_INDEX_PATH,
+        retention_days: float = settings.LOG_INDEX_RETENTION_DAYS,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+    ):
+        super().__init__(batch_size, flush_interval, queue_size)
+        self.path = path
+        self.retention_seconds = retention_days * 86400
+        self._conn: sqlite3.Connection | None = None
+        self._id_base = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(logs)")}
+        if "repeats" not in columns:
+            conn.execute(
+                "ALTER TABLE logs ADD COLUMN repeats INTEGER NOT NULL DEFAULT 1"
+            )
+            conn.execute("ALTER TABLE logs ADD COLUMN last REAL")
+        return conn
+
+    def write(self, record: LogRecord):
+        """Queue a record for indexing without blocking."""
+        self.submit(record)
+
+    def _open(self):
+        self._conn = self._connect()
+        (last_id,) = self._conn.execute("SELECT MAX(id) FROM logs").fetchone()
+        self._id_base = 0 if last_id is None else last_id + 1
+
+    def _write_batch(self, batch: list[LogRecord]):
+        rows = [
+            (
+                self._id_base + record.id,
+                record.created,
+                Severity[record.severity.upper()],
+                record.category,
+                record.message,
+                record.repeats,
+                record.last,
+            )
+            for record in batch
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO logs "
+                "(id, ts, severity, category, message, repeats, last) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET "
+                "message = excluded.message, repeats = excluded.repeats, "
+                "last = excluded.last",
+                rows,
+            )
+
+    def _close(self):
+        self._conn.close()
+        self._conn = None
+
+    def _maintain(self):
+        """Prune entries older than the retention period."""
+        cutoff = time.time() - self.retention_seconds
+        with self._conn:
+            self._conn.execute("DELETE FROM logs WHERE ts < ?", (cutoff,))
+
+    def query(
+        self,
+        start: float,
+        end: float,
+        severities: frozenset[str] = frozenset(),
+        category: str = "",
+        text: str = "",
+        newest_first: bool = False,
+        limit: int | None = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[list[LogRecord]]:
+        """Matching entries with `start <= ts < end`, in chunks.
+
+        `text` is matched word by word against the full-text index.
+        """
+        sql = (
+            "SELECT logs.id, logs.ts, logs.severity, logs.category, logs.message, "
+            "logs.repeats, logs.last FROM logs"
+        )
+        where = ["logs.ts >= ?", "logs.ts < ?"]
+        params: list = [start, end]
+        if text.strip():
+            sql += " JOIN logs_fts ON logs_fts.rowid = logs.id"
+            where.append("logs_fts MATCH ?")
+            params.append(fts_phrase(text))
+        if category:
+            where.append("logs.category = ?")
+            params.append(category)
+        if severities:
+            codes = [Severity[name.upper()] for name in severities]
+            where.append(f"logs.severity IN ({', '.join('?' * len(codes))})")
+            params.extend(codes)
+        sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY logs.ts {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        conn = self._connect()
+        try:
+            cursor = conn.execute(sql, params)
+            while rows := cursor.fetchmany(chunk_size):
+                yield [
+                    LogRecord(entry_id, created, Severity(code).label, *rest)
+                    for entry_id, created, code, *rest in rows
+                ]
+        finally:
+            conn.close()
+
+
+log_index = LogIndex()
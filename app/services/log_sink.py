@@ -0,0 +1,147 @@
+import gzip
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+from typing import IO
+from app.services import settings
+from app.services.batch_writer import BatchWriter
+from app.services.log_store import LogRecord
+
+ACTIVE_NAME = "robobelt.jsonl"
+
+
+class LogSink(BatchWriter):
+    """Durable JSON-lines archive of every log entry.
+
+    Entries are written by a background thread in batches. The active file
+    is rotated once it exceeds `max_bytes` or its first entry is older
+    than `max_age` seconds; rotated files are gzip-compressed and only the
+    newest `keep` archives are retained. Ids continue from the highest one
+    already archived, so they stay unique across restarts. A coalesced
+    entry is written again with `repeats` and `last` once its window
+    closes; readers should keep the last line for each id.
+    """
+
+    name = "log-sink"
+    maintain_interval = 60.0
+
+    def __init__(
+        self,
+        directory: str = settings.LOG_ARCHIVE_DIR,
+        max_bytes: int = settings.LOG_ARCHIVE_MAX_BYTES,
+        max_age: float = settings.LOG_ARCHIVE_MAX_AGE,
+        keep: int = settings.LOG_ARCHIVE_KEEP,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+    ):
+        super().__init__(batch_size, flush_interval, queue_size)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.keep = keep
+        self._file: IO[str] | None = None
+        self._opened_at = 0.0
+        self._id_base: int | None = None
+
+    @property
+    def active_path(self) -> str:
+        return os.path.join(self.directory, ACTIVE_NAME)
+
+    def write(self, record: LogRecord):
+        """Queue a record for archiving without blocking."""
+        self.submit(record)
+
+    @staticmethod
+    def _scan(path: str) -> tuple[float | None, int | None]:
+        """Time of the first entry and the highest id in an archive file."""
+        if not os.path.exists(path):
+            return None, None
+        opener = gzip.open if path.endswith(".gz") else open
+        first, last_id = None, None
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if first is None:
+                    first = entry["ts"]
+                last_id = entry["id"] if last_id is None else max(last_id, entry["id"])
+        return first, last_id
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        first, last_id = self._scan(self.active_path)
+        if self._id_base is None:
+            for archive in reversed(self.archives()):
+                if last_id is not None:
+                    break
+                _, last_id = self._scan(archive)
+            self._id_base = 0 if last_id is None else last_id + 1
+        self._file = open(self.active_path, "a", encoding="utf-8")
+        self._opened_at = time.time() if first is None else first
+
+    def _write_batch(self, batch: list[LogRecord]):
+        lines = []
+        for record in batch:
+            entry = {
+                "id": self._id_base + record.id,
+                "ts": record.created,
+                "time": datetime.fromtimestamp(record.created).isoformat(),
+                "severity": record.severity,
+                "category": record.category,
+                "message": record.message,
+            }
+            if record.repeats > 1:
+                entry["repeats"] = record.repeats
+                entry["last"] = record.last
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.writelines(lines)
+        self._file.flush()
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _close(self):
+        self._file.close()
+        self._file = None
+
+    def _maintain(self):
+        if self._file.tell() and time.time() - self._opened_at >= self.max_age:
+            self._rotate()
+
+    def _rotate(self):
+        """Compress the active file into a timestamped archive."""
+        self._close()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        archive = os.path.join(self.directory, f"robobelt-{stamp}.jsonl.gz")
+        suffix = 1
+        while os.path.exists(archive):
+            name = f"robobelt-{stamp}-{suffix}.jsonl.gz"
+            archive = os.path.join(self.directory, name)
+            suffix += 1
+        with open(self.active_path, "rb") as src, gzip.open(archive, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(self.active_path)
+        archives = self.archives()
+        for path in archives[: max(0, len(archives) - self.keep)]:
+            os.remove(path)
+        self._open()
+
+    def archives(self) -> list[str]:
+        """Paths of the compressed archives, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            (
+                os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.startswith("robobelt-") and name.endswith(".jsonl.gz")
+            ),
+            key=os.path.getmtime,
+        )
+
+
+log_sink = LogSink()
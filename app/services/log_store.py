@@ -0,0 +1,337 @@
+import heapq
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime
+from enum import IntEnum
+from typing import Iterator, NamedTuple
+from app.services import settings
+
+
+class Severity(IntEnum):
+    ERROR = 0
+    WARNING = 1
+    INFO = 2
+    SUCCESS = 3
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+_SEVERITY_LABELS = [severity.label for severity in Severity]
+_SEVERITY_CODES = {label: code for code, label in enumerate(_SEVERITY_LABELS)}
+
+
+class LogRecord(NamedTuple):
+    """A materialized view of one stored entry."""
+
+    id: int
+    created: float
+    severity: str
+    category: str
+    message: str
+    # Occurrences coalesced into this entry and the time of the latest one.
+    repeats: int = 1
+    last: float | None = None
+
+    @property
+    def timestamp(self) -> str:
+        return datetime.fromtimestamp(self.created).strftime("%H:%M:%S")
+
+    @property
+    def last_timestamp(self) -> str:
+        last = self.created if self.last is None else self.last
+        return datetime.fromtimestamp(last).strftime("%H:%M:%S")
+
+
+@dataclass(frozen=True)
+class LogQuery:
+    """Filter over log records; empty fields match everything."""
+
+    severities: frozenset[str] = frozenset()
+    category: str = ""
+    since: float | None = None
+    until: float | None = None
+    text: str = ""
+    min_id: int = 0
+
+    def matches(self, record: LogRecord) -> bool:
+        return (
+            record.id >= self.min_id
+            and (not self.severities or record.severity in self.severities)
+            and (not self.category or record.category == self.category)
+            and (self.since is None or record.created > self.since)
+            and (self.until is None or record.created <= self.until)
+            and (not self.text or self.text.lower() in record.message.lower())
+        )
+
+
+class _Interner:
+    """Small integer codes for strings, assigned on first use."""
+
+    __slots__ = ("codes", "names")
+
+    def __init__(self):
+        self.codes: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def code(self, name: str) -> int:
+        code = self.codes.get(name)
+        if code is None:
+            code = self.codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+
+class _IdIndex:
+    """Ascending ids of the records sharing one attribute value."""
+
+    __slots__ = ("ids", "head")
+
+    def __init__(self):
+        self.ids = array("q")
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.ids) - self.head
+
+    def pop_oldest(self):
+        self.head += 1
+        if self.head >= 1024 and self.head * 2 >= len(self.ids):
+            del self.ids[: self.head]
+            self.head = 0
+
+    def span(self, low: int, high: int) -> tuple[int, int]:
+        """Positions of the ids in `[low, high)`."""
+        return (
+            bisect_left(self.ids, low, self.head),
+            bisect_left(self.ids, high, self.head),
+        )
+
+    def count(self, low: int, high: int) -> int:
+        start, stop = self.span(low, high)
+        return stop - start
+
+    def iter_ids(self, low: int, high: int, newest_first: bool) -> Iterator[int]:
+        start, stop = self.span(low, high)
+        ids = self.ids
+        if newest_first:
+            return (ids[i] for i in range(stop - 1, start - 1, -1))
+        return (ids[i] for i in range(start, stop))
+
+
+class LogStore:
+    """Bounded append-only log with O(1) append and lookup by id.
+
+    Entries are kept as parallel arrays of `capacity` slots: creation time,
+    severity code, interned category code, message, repeat count and time
+    of the latest repeat. Ids are sequential, so the slot of an id is
+    `id % capacity` and the oldest entry is overwritten once the ring is
+    full. `LogRecord` tuples are only built for entries that are read.
+
+    Secondary indexes by severity, category and the pair of both are
+    maintained on append and eviction, so filtered queries only visit
+    candidate records and counts come from index sizes.
+    """
+
+    def __init__(self, capacity: int = settings.LOG_CAPACITY):
+        self.capacity = capacity
+        self._created = array("d", bytes(8 * capacity))
+        self._severities = array("B", bytes(capacity))
+        self._categories = array("H", bytes(2 * capacity))
+        self._messages: list[str | None] = [None] * capacity
+        self._repeats = array("I", bytes(4 * capacity))
+        self._last = array("d", bytes(8 * capacity))
+        self._category_names = _Interner()
+        self.next_id = 0
+        self._by_severity: dict[int, _IdIndex] = {}
+        self._by_category: dict[int, _IdIndex] = {}
+        self._by_pair: dict[int, _IdIndex] = {}
+
+    @property
+    def first_id(self) -> int:
+        return max(0, self.next_id - self.capacity)
+
+    @property
+    def categories(self) -> list[str]:
+        names = self._category_names.names
+        return sorted(names[code] for code, index in self._by_category.items() if index)
+
+    def __len__(self) -> int:
+        return self.next_id - self.first_id
+
+    def append(self, created: float, severity: str, category: str, message: str) -> int:
+        """Store an entry and return its id."""
+        severity_code = _SEVERITY_CODES[severity]
+        category_code = self._category_names.code(category)
+        entry_id = self.next_id
+        slot = entry_id % self.capacity
+        if entry_id - self.capacity >= self.first_id:
+            evicted_severity = self._severities[slot]
+            evicted_category = self._categories[slot]
+            self._by_severity[evicted_severity].pop_oldest()
+            self._by_category[evicted_category].pop_oldest()
+            self._by_pair[evicted_severity << 16 | evicted_category].pop_oldest()
+        self._created[slot] = created
+        self._severities[slot] = severity_code
+        self._categories[slot] = category_code
+        self._messages[slot] = message
+        self._repeats[slot] = 1
+        self._last[slot] = created
+        self._by_severity.setdefault(severity_code, _IdIndex()).ids.append(entry_id)
+        self._by_category.setdefault(category_code, _IdIndex()).ids.append(entry_id)
+        pair = severity_code << 16 | category_code
+        self._by_pair.setdefault(pair, _IdIndex()).ids.append(entry_id)
+        self.next_id += 1
+        return entry_id
+
+    def bump(self, entry_id: int, created: float, message: str) -> bool:
+        """Count another occurrence of an entry and keep its latest text."""
+        if not self.first_id <= entry_id < self.next_id:
+            return False
+        slot = entry_id % self.capacity
+        self._repeats[slot] += 1
+        self._last[slot] = created
+        self._messages[slot] = message
+        return True
+
+    def _record(self, entry_id: int) -> LogRecord:
+        slot = entry_id % self.capacity
+        return LogRecord(
+            entry_id,
+            self._created[slot],
+            _SEVERITY_LABELS[self._severities[slot]],
+            self._category_names.names[self._categories[slot]],
+            self._messages[slot],
+            self._repeats[slot],
+            self._last[slot],
+        )
+
+    def get(self, entry_id: int) -> LogRecord | None:
+        if self.first_id <= entry_id < self.next_id:
+            return self._record(entry_id)
+        return None
+
+    def iter_newest(self, before_id: int | None = None) -> Iterator[LogRecord]:
+        """Records from newest to oldest, starting below `before_id`."""
+        start = self.next_id if before_id is None else min(before_id, self.next_id)
+        for entry_id in range(start - 1, self.first_id - 1, -1):
+            yield self._record(entry_id)
+
+    def iter_oldest(self, after_id: int = -1) -> Iterator[LogRecord]:
+        """Records from oldest to newest, starting above `after_id`."""
+        for entry_id in range(max(after_id + 1, self.first_id), self.next_id):
+            yield self._record(entry_id)
+
+    def id_after(self, created: float) -> int:
+        """The first id logged after `created` (binary search by time)."""
+        low, high = self.first_id, self.next_id
+        while low < high:
+            mid = (low + high) // 2
+            if self._created[mid % self.capacity] <= created:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _bounds(
+        self, query: LogQuery, after_id: int, before_id: int | None
+    ) -> tuple[int, int]:
+        low = max(self.first_id, after_id + 1, query.min_id)
+        high = self.next_id if before_id is None else min(before_id, self.next_id)
+        if query.since is not None:
+            low = max(low, self.id_after(query.since))
+        if query.until is not None:
+            high = min(high, self.id_after(query.until))
+        return low, high
+
+    def _indexes(self, query: LogQuery) -> list[_IdIndex] | None:
+        """Indexes covering the query's severity/category, None for all."""
+        severities = [
+            _SEVERITY_CODES[severity]
+            for severity in query.severities
+            if severity in _SEVERITY_CODES
+        ]
+        category = self._category_names.codes.get(query.category, -1)
+        if query.category and category < 0:
+            return []
+        if query.severities and query.category:
+            keys = [severity << 16 | category for severity in severities]
+            return [self._by_pair[key] for key in keys if key in self._by_pair]
+        if query.severities:
+            return [
+                self._by_severity[severity]
+                for severity in severities
+                if severity in self._by_severity
+            ]
+        if query.category:
+            index = self._by_category.get(category)
+            return [index] if index is not None else []
+        return None
+
+    def _candidates(
+        self, query: LogQuery, low: int, high: int, newest_first: bool
+    ) -> Iterator[int]:
+        """Ids in `[low, high)` matching the query's indexed fields."""
+        indexes = self._indexes(query)
+        if indexes is None:
+            if newest_first:
+                return iter(range(high - 1, low - 1, -1))
+            return iter(range(low, high))
+        streams = [index.iter_ids(low, high, newest_first) for index in indexes]
+        return heapq.merge(*streams, reverse=newest_first)
+
+    def _matching(
+        self, query: LogQuery, low: int, high: int, newest_first: bool
+    ) -> Iterator[int]:
+        """Candidate ids whose message also contains the query text."""
+        candidates = self._candidates(query, low, high, newest_first)
+        if not query.text:
+            return candidates
+        text = query.text.lower()
+        messages = self._messages
+        capacity = self.capacity
+        return (
+            entry_id
+            for entry_id in candidates
+            if text in messages[entry_id % capacity].lower()
+        )
+
+    def select(
+        self,
+        query: LogQuery,
+        limit: int,
+        before_id: int | None = None,
+        after_id: int = -1,
+        newest_first: bool = True,
+    ) -> list[LogRecord]:
+        """Up to `limit` matching records strictly between the two ids."""
+        low, high = self._bounds(query, after_id, before_id)
+        records = []
+        for entry_id in self._matching(query, low, high, newest_first):
+            records.append(self._record(entry_id))
+            if len(records) >= limit:
+                break
+        return records
+
+    def count(self, query: LogQuery, limit: int) -> int:
+        """Number of matching records, or `limit` if there are more.
+
+        Queries without a text filter are answered from index sizes; text
+        queries scan the indexed candidates.
+        """
+        low, high = self._bounds(query, -1, None)
+        if not query.text:
+            indexes = self._indexes(query)
+            if indexes is None:
+                total = max(0, high - low)
+            else:
+                total = sum(index.count(low, high) for index in indexes)
+            return min(total, limit)
+        total = 0
+        for _ in self._matching(query, low, high, True):
+            total += 1
+            if total >= limit:
+                break
+        return total
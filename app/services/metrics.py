@@ -0,0 +1,88 @@
+from bisect import bisect_left
+from typing import Sequence
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+# For sub-millisecond timings such as control loop jitter.
+TIMING_BUCKETS_MS = (0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS_BYTES = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, plus count, sum and max.
+
+    Bucket `i` counts values up to `bounds[i]`; the last bucket counts
+    everything above the largest bound. Percentiles are reported as the
+    upper bound of the bucket they fall in.
+    """
+
+    def __init__(self, name: str, unit: str, bounds: Sequence[float]):
+        self.name = name
+        self.unit = unit
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "unit": self.unit,
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p90": self.percentile(0.9),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+            "buckets": {
+                **{str(bound): n for bound, n in zip(self.bounds, self.counts)},
+                "+Inf": self.counts[-1],
+            },
+        }
+
+    def reset(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class Metrics:
+    """Process-wide named histograms, created on first use."""
+
+    def __init__(self):
+        self._histograms: dict[str, Histogram] = {}
+
+    def histogram(
+        self, name: str, unit: str = "ms", bounds: Sequence[float] = LATENCY_BUCKETS_MS
+    ) -> Histogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram(name, unit, bounds)
+        return histogram
+
+    def snapshot(self) -> dict[str, dict]:
+        return {name: h.snapshot() for name, h in sorted(self._histograms.items())}
+
+    def reset(self):
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+
+metrics = Metrics()
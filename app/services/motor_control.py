@@ -0,0 +1,228 @@
+import atexit
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+import numpy as np
+from app.services import settings
+from app.services.metrics import TIMING_BUCKETS_MS, metrics
+
+JITTER = metrics.histogram("control.jitter_ms", bounds=TIMING_BUCKETS_MS)
+STEP_TIME = metrics.histogram("control.step_ms", bounds=TIMING_BUCKETS_MS)
+
+
+@dataclass(frozen=True)
+class PidGains:
+    kp: float = 1.0
+    ki: float = 0.1
+    kd: float = 0.05
+
+    @property
+    def valid(self) -> bool:
+        return all(valid_gain(gain) for gain in (self.kp, self.ki, self.kd))
+
+
+def valid_gain(value: float) -> bool:
+    """Whether `value` can be used as a PID gain: finite and non-negative."""
+    return math.isfinite(value) and value >= 0
+
+
+class PidController:
+    """PID speed controller with setpoint feedforward.
+
+    The output is the drive command in RPM: the setpoint plus the PID
+    correction, clamped to `[0, limit]`. The derivative acts on the
+    measurement so setpoint steps do not kick the output, and the integral
+    stops growing while the output is saturated. A non-finite integral or
+    output resets the controller and falls back to the feedforward alone.
+    """
+
+    def __init__(self, gains: PidGains, limit: float):
+        self.gains = gains
+        self.limit = limit
+        self.integral = 0.0
+        self._last: float | None = None
+
+    def set_gains(self, gains: PidGains):
+        """Swap gains, rescaling the integral so the output does not jump."""
+        if self.gains.ki and gains.ki:
+            self.integral *= self.gains.ki / gains.ki
+        if not math.isfinite(self.integral):
+            self.integral = 0.0
+        self.gains = gains
+
+    def reset(self):
+        self.integral = 0.0
+        self._last = None
+
+    def update(self, setpoint: float, measured: float, dt: float) -> float:
+        gains = self.gains
+        error = setpoint - measured
+        derivative = 0.0
+        if self._last is not None and dt > 0:
+            derivative = (self._last - measured) / dt
+        self._last = measured
+        integral = self.integral + error * dt
+        output = (
+            setpoint + gains.kp * error + gains.ki * integral + gains.kd * derivative
+        )
+        if not (math.isfinite(integral) and math.isfinite(output)):
+            self.reset()
+            return min(max(setpoint, 0.0), self.limit)
+        if 0 <= output <= self.limit or (output < 0) == (error > 0):
+            self.integral = integral
+        return min(max(output, 0.0), self.limit)
+
+
+class MotorModel:
+    """First-order belt motor: speed lags the drive by `tau` seconds.
+
+    A slowly wandering load drags the belt below the drive speed, so the
+    controller's integral term has something to correct. A non-finite
+    speed is reset to a standstill rather than carried into the next step.
+    """
+
+    def __init__(
+        self,
+        tau: float = 0.8,
+        drag: float = 40.0,
+        max_speed: float = 3000,
+        seed: int | None = settings.SIM_SEED,
+    ):
+        self.tau = tau
+        self.drag = drag
+        self.max_speed = max_speed
+        self.speed = 0.0
+        self._load = drag
+        self._rng = np.random.default_rng(seed)
+
+    def step(self, drive: float, dt: float) -> float:
+        self._load += (self.drag - self._load) * min(1.0, dt)
+        self._load += self._rng.normal(0, 5 * np.sqrt(dt))
+        # A stopped belt is held by friction rather than driven backwards.
+        load = self._load if self.speed > 0 or drive > self._load else drive
+        self.speed += (drive - load - self.speed) * min(1.0, dt / self.tau)
+        if not math.isfinite(self.speed):
+            self.speed = 0.0
+        self.speed = min(max(self.speed, 0.0), self.max_speed)
+        return self.speed
+
+
+class ControlLoop:
+    """Fixed-rate motor speed loop on its own thread.
+
+    Every tick runs the PID against the motor model with the time actually
+    elapsed, off the event loop and outside every state lock. Setpoints
+    and gains may be set from any thread; gains are picked up at the start
+    of the next tick; gains saved in a browser are loaded by the first
+    session that mounts. Ticks are scheduled against absolute deadlines:
+    lateness is recorded as jitter, and ticks missed entirely are counted
+    as overruns and skipped. Sessions read `speed` at display rate through
+    the telemetry hub.
+    """
+
+    name = "motor-control"
+
+    def __init__(
+        self,
+        rate: float = settings.CONTROL_RATE,
+        gains: PidGains = PidGains(),
+        motor: MotorModel | None = None,
+    ):
+        self.rate = rate
+        self.motor = motor if motor is not None else MotorModel()
+        self.pid = PidController(gains, self.motor.max_speed)
+        self.setpoint = 0.0
+        self.drive = 0.0
+        self.halted = False
+        self.ticks = 0
+        self.overruns = 0
+        self._gains = gains
+        self.gains_set = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def speed(self) -> float:
+        return self.motor.speed
+
+    def set_setpoint(self, speed: float):
+        self.setpoint = max(0.0, float(speed))
+
+    def set_gains(self, gains: PidGains):
+        if not gains.valid:
+            raise ValueError(f"PID gains must be finite and non-negative: {gains}")
+        self._gains = gains
+        self.gains_set = True
+
+    def load_gains(self, gains: PidGains):
+        """Apply persisted gains unless gains were already set in this process."""
+        if not gains.valid:
+            raise ValueError(f"PID gains must be finite and non-negative: {gains}")
+        if not self.gains_set:
+            self.set_gains(gains)
+
+    def halt(self, active: bool):
+        """Cut the drive on the next tick while an emergency stop is active."""
+        self.halted = active
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.close)
+
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout=1.0)
+
+    def step(self, dt: float):
+        """Run one control tick covering `dt` seconds."""
+        gains = self._gains
+        if gains is not self.pid.gains:
+            self.pid.set_gains(gains)
+        if self.halted:
+            self.pid.reset()
+            self.drive = 0.0
+        else:
+            self.drive = self.pid.update(self.setpoint, self.motor.speed, dt)
+        self.motor.step(self.drive, dt)
+        self.ticks += 1
+
+    def _run(self):
+        period = 1 / self.rate
+        deadline = last = time.perf_counter()
+        while True:
+            deadline += period
+            delay = deadline - time.perf_counter()
+            if delay > 0 and self._stop.wait(delay):
+                return
+            if self._stop.is_set():
+                return
+            now = time.perf_counter()
+            late = now - deadline
+            if late >= period:
+                missed = int(late // period)
+                self.overruns += missed
+                deadline += missed * period
+            JITTER.observe(late * 1000)
+            try:
+                self.step(now - last)
+            except Exception as e:
+                logging.exception(f"Error: {e}")
+            last = now
+            STEP_TIME.observe((time.perf_counter() - now) * 1000)
+
+
+motor_control = ControlLoop()
@@ -0,0 +1,49 @@
+import os
+
+TELEMETRY_INTERVAL = float(os.environ.get("ROBOBELT_TELEMETRY_INTERVAL", "2.0"))
+TELEMETRY_IDLE_INTERVAL = float(
+    os.environ.get("ROBOBELT_TELEMETRY_IDLE_INTERVAL", "10.0")
+)
+TELEMETRY_REPLAY_PATH = os.environ.get("ROBOBELT_TELEMETRY_REPLAY", "")
+# Replay speed relative to real time; 0 replays as fast as possible.
+TELEMETRY_REPLAY_SPEED = float(os.environ.get("ROBOBELT_TELEMETRY_REPLAY_SPEED", "1"))
+TELEMETRY_RECORD_PATH = os.environ.get("ROBOBELT_TELEMETRY_RECORD", "")
+# Seed for the simulators; unset gives a different run every start.
+SIM_SEED = (
+    int(os.environ["ROBOBELT_SIM_SEED"])
+    if os.environ.get("ROBOBELT_SIM_SEED")
+    else None
+)
+# Motor control loop ticks per second.
+CONTROL_RATE = float(os.environ.get("ROBOBELT_CONTROL_RATE", "100"))
+# Simulated faults per fleet belt per second; the operator belt has none.
+SIM_FAULT_RATE = float(os.environ.get("ROBOBELT_SIM_FAULT_RATE", "0.0005"))
+
+DATA_DIR = os.environ.get("ROBOBELT_DATA_DIR", "data")
+TELEMETRY_DB_PATH = os.path.join(DATA_DIR, "telemetry.db")
+TELEMETRY_RETENTION_DAYS = float(
+    os.environ.get("ROBOBELT_TELEMETRY_RETENTION_DAYS", "30")
+)
+
+LOG_CAPACITY = int(os.environ.get("ROBOBELT_LOG_CAPACITY", "10000"))
+LOG_VIEW_SIZE = int(os.environ.get("ROBOBELT_LOG_VIEW_SIZE", "50"))
+LOG_ARCHIVE_DIR = os.path.join(DATA_DIR, "logs")
+LOG_ARCHIVE_MAX_BYTES = int(
+    os.environ.get("ROBOBELT_LOG_ARCHIVE_MAX_BYTES", "10000000")
+)
+LOG_ARCHIVE_MAX_AGE = float(os.environ.get("ROBOBELT_LOG_ARCHIVE_MAX_AGE", "86400"))
+LOG_ARCHIVE_KEEP = int(os.environ.get("ROBOBELT_LOG_ARCHIVE_KEEP", "30"))
+LOG_INDEX_PATH = os.path.join(DATA_DIR, "logs.db")
+LOG_INDEX_RETENTION_DAYS = float(
+    os.environ.get("ROBOBELT_LOG_INDEX_RETENTION_DAYS", "90")
+)
+LOG_COALESCE_WINDOW = float(os.environ.get("ROBOBELT_LOG_COALESCE_WINDOW", "60"))
+LOG_RATE_PER_SECOND = float(os.environ.get("ROBOBELT_LOG_RATE_PER_SECOND", "1.0"))
+LOG_RATE_BURST = int(os.environ.get("ROBOBELT_LOG_RATE_BURST", "20"))
+
+FLEET_SIZE = int(os.environ.get("ROBOBELT_FLEET_SIZE", "200"))
+FLEET_INTERVAL = float(
+    os.environ.get("ROBOBELT_FLEET_INTERVAL", str(TELEMETRY_INTERVAL))
+)
+# Target changes per belt per second in the simulated fleet.
+FLEET_RETARGET_RATE = float(os.environ.get("ROBOBELT_FLEET_RETARGET_RATE", "0.01"))
@@ -0,0 +1,44 @@
+from typing import Any
+from app.services.telemetry_source import TelemetrySample
+
+# Smallest change in each channel worth pushing to the browser.
+DEADBANDS = {
+    "belt_speed": 2,
+    "motor_temp": 1,
+    "belt_tension": 0.5,
+    "current_draw": 0.05,
+}
+
+# Decimal places each float channel is displayed with.
+PRECISION = {
+    "belt_tension": 1,
+    "current_draw": 2,
+}
+
+
+def telemetry_delta(current: Any, sample: TelemetrySample) -> dict[str, Any]:
+    """Return only the fields of `sample` that differ visibly from `current`.
+
+    `current` is anything exposing the telemetry fields as attributes,
+    usually the TelemetryState itself. Numeric channels are compared
+    against their deadband after rounding to display precision, except
+    that a channel reaching or leaving zero is always sent so a stopped
+    belt never shows a stale reading. Uptime only changes once a minute
+    because it is displayed in hours and minutes.
+    """
+    delta = {}
+    for name, deadband in DEADBANDS.items():
+        value = getattr(sample, name)
+        precision = PRECISION.get(name)
+        if precision is not None:
+            value = round(value, precision)
+        previous = getattr(current, name)
+        if value != previous and (
+            abs(value - previous) >= deadband or not (value and previous)
+        ):
+            delta[name] = value
+    if sample.system_health != current.system_health:
+        delta["system_health"] = sample.system_health
+    if sample.uptime_seconds // 60 != current.uptime_seconds // 60:
+        delta["uptime_seconds"] = sample.uptime_seconds
+    return delta
@@ -0,0 +1,170 @@
+from array import array
+from typing import Any
+from app.services import settings
+
+CHANNELS = ("belt_speed", "motor_temp", "belt_tension", "current_draw")
+
+# Bucket width in seconds -> number of buckets kept (24 h each).
+ROLLUPS = {60: 1440, 600: 144, 3600: 24}
+
+
+class RingBuffer:
+    """Fixed-capacity float buffer backed by a preallocated array."""
+
+    def __init__(self, capacity: int, typecode: str = "f"):
+        self.capacity = capacity
+        self._data = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float):
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def __getitem__(self, index: int) -> float:
+        """Item by age: 0 is the oldest retained value, -1 the newest."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("ring buffer index out of range")
+        return self._data[(self._head - self._count + index) % self.capacity]
+
+    def latest(self, n: int) -> list[float]:
+        """The newest `n` values, oldest first."""
+        n = min(n, self._count)
+        return [self[i] for i in range(self._count - n, self._count)]
+
+
+class Rollup:
+    """Min/max/mean of one channel over fixed-width time buckets."""
+
+    def __init__(self, width: int, capacity: int):
+        self.width = width
+        self.mins = RingBuffer(capacity)
+        self.maxs = RingBuffer(capacity)
+        self.means = RingBuffer(capacity)
+        self.starts = RingBuffer(capacity, "d")
+        self._bucket: int | None = None
+        self._min = self._max = self._sum = 0.0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return len(self.means)
+
+    def add(self, timestamp: float, value: float) -> bool:
+        """Accumulate a value; returns True when a bucket was closed."""
+        bucket = int(timestamp // self.width)
+        closed = False
+        if self._bucket is not None and bucket != self._bucket:
+            self._close()
+            closed = True
+        if self._count == 0:
+            self._bucket = bucket
+            self._min = self._max = self._sum = value
+            self._count = 1
+        else:
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+            self._sum += value
+            self._count += 1
+        return closed
+
+    def _close(self):
+        self.mins.append(self._min)
+        self.maxs.append(self._max)
+        self.means.append(self._sum / self._count)
+        self.starts.append(self._bucket * self.width)
+        self._count = 0
+
+
+class ChannelHistory:
+    """Raw samples plus rollups for a single telemetry channel."""
+
+    def __init__(self, capacity: int):
+        self.raw = RingBuffer(capacity)
+        self.rollups = {
+            width: Rollup(width, buckets) for width, buckets in ROLLUPS.items()
+        }
+
+    def add(self, timestamp: float, value: float) -> bool:
+        self.raw.append(value)
+        closed = False
+        for rollup in self.rollups.values():
+            closed = rollup.add(timestamp, value) or closed
+        return closed
+
+
+class TelemetryHistory:
+    """24 h of telemetry per channel in constant memory.
+
+    Dashboard views read the pre-aggregated buckets; `version` changes
+    whenever a bucket closes so consumers know when to refresh.
+    """
+
+    def __init__(self, interval: float = settings.TELEMETRY_INTERVAL):
+        capacity = int(86400 / interval) + 1
+        self.channels = {name: ChannelHistory(capacity) for name in CHANNELS}
+        self.version = 0
+        self._snapshot_version = -1
+        self._snapshot: tuple[dict[str, str], dict[str, str]] = ({}, {})
+
+    def record(self, timestamp: float, sample: Any):
+        """Append the channel values of `sample` taken at `timestamp`."""
+        closed = False
+        for name, history in self.channels.items():
+            closed = history.add(timestamp, getattr(sample, name)) or closed
+        if closed:
+            self.version += 1
+
+    def trend(self, channel: str, width: int = 60, span: int = 60) -> str | None:
+        """Change of the latest bucket mean against the bucket `span` earlier.
+
+        The earlier bucket is looked up by its start time, so gaps from a
+        restart are not skipped over; None if it was never recorded.
+        """
+        rollup = self.channels[channel].rollups[width]
+        if not len(rollup):
+            return None
+        wanted = rollup.starts[-1] - span * width
+        low, high = 0, len(rollup) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if rollup.starts[middle] < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        if rollup.starts[low] != wanted:
+            return None
+        previous = rollup.means[low]
+        if previous == 0:
+            return None
+        change = (rollup.means[-1] - previous) / abs(previous) * 100
+        return f"{change:+.1f}%"
+
+    def sparkline(self, channel: str, width: int = 60, points: int = 30) -> str:
+        """SVG polyline points for the latest bucket means in a 100x24 box."""
+        values = self.channels[channel].rollups[width].means.latest(points)
+        if len(values) < 2:
+            return ""
+        low, high = min(values), max(values)
+        spread = (high - low) or 1.0
+        step = 100 / (len(values) - 1)
+        return " ".join(
+            f"{i * step:.1f},{22 - (v - low) / spread * 20:.1f}"
+            for i, v in enumerate(values)
+        )
+
+    def snapshot(self) -> tuple[dict[str, str], dict[str, str]]:
+        """Trend texts and sparklines per channel, cached per version."""
+        if self._snapshot_version != self.version:
+            self._snapshot = (
+                {name: self.trend(name) or "—" for name in CHANNELS},
+                {name: self.sparkline(name) for name in CHANNELS},
+            )
+            self._snapshot_version = self.version
+        return self._snapshot
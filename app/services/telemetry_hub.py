@@ -0,0 +1,371 @@
+import asyncio
+import dataclasses
+import logging
+import time
+from typing import Any, Callable
+import numpy as np
+from app.services import settings
+from app.services.health_rules import (
+    CRITICAL,
+    HEALTH_LABELS,
+    OPTIMAL,
+    WARNING,
+    HealthEngine,
+)
+from app.services.log_bus import LogBus, log_bus
+from app.services.motor_control import ControlLoop, motor_control
+from app.services.telemetry_history import CHANNELS, TelemetryHistory
+from app.services.telemetry_recording import TelemetryRecorder
+from app.services.telemetry_store import TelemetryStore
+from app.services.telemetry_source import (
+    TelemetrySample,
+    TelemetrySource,
+    create_telemetry_source,
+)
+
+LIVE = "live"
+IDLE = "idle"
+PAUSED = "paused"
+
+
+class TelemetrySubscription:
+    """A bounded queue of samples for one session.
+
+    When the consumer falls behind, the oldest queued sample is dropped so
+    the session always catches up to the most recent readings. The `mode`
+    controls how often samples are delivered: every tick when live, at most
+    once per idle interval when idle, and not at all when paused.
+    """
+
+    def __init__(self, hub: "TelemetryHub", key: str, maxsize: int, mode: str):
+        self._hub = hub
+        self.key = key
+        self.mode = mode
+        self._queue: asyncio.Queue[TelemetrySample] = asyncio.Queue(maxsize)
+        self._last_delivery = 0.0
+        self.dropped = 0
+
+    def push(self, sample: TelemetrySample):
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(sample)
+        self._last_delivery = time.monotonic()
+
+    def offer(self, sample: TelemetrySample, now: float):
+        """Deliver a sample if the subscription's mode wants it."""
+        if self.mode == PAUSED:
+            return
+        if self.mode == IDLE and now - self._last_delivery < self._hub.idle_interval:
+            return
+        self.push(sample)
+
+    def set_mode(self, mode: str):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        if mode != PAUSED and self._hub.latest is not None:
+            self.push(self._hub.latest)
+
+    async def get(self) -> TelemetrySample:
+        return await self._queue.get()
+
+    def close(self):
+        self._hub.unsubscribe(self)
+
+
+class ControlSubscription:
+    """Wake-up signal for one session mirroring the shared motor controls."""
+
+    def __init__(self, hub: "TelemetryHub", key: str):
+        self._hub = hub
+        self.key = key
+        self._event = asyncio.Event()
+        self.closed = False
+
+    def notify(self):
+        self._event.set()
+
+    async def wait(self) -> bool:
+        """Wait for a change; returns False once the subscription is replaced."""
+        await self._event.wait()
+        self._event.clear()
+        return not self.closed
+
+    def stop(self):
+        self.closed = True
+        self._event.set()
+
+    def close(self):
+        self.stop()
+        self._hub.unsubscribe_controls(self)
+
+
+class TelemetryHub:
+    """Process-wide telemetry producer fanned out to every session.
+
+    A single task reads from the telemetry source while at least one
+    session is subscribed, so all operator screens see the same belt.
+    Ticks are scheduled against absolute deadlines so a slow read does not
+    push every later tick back. With a `recorder`, every sample and
+    control event is also written to a replayable recording.
+    """
+
+    def __init__(
+        self,
+        source_factory: Callable[[], TelemetrySource] = create_telemetry_source,
+        interval: float = settings.TELEMETRY_INTERVAL,
+        idle_interval: float = settings.TELEMETRY_IDLE_INTERVAL,
+        queue_size: int = 4,
+        store: TelemetryStore | None = None,
+        log: LogBus | None = None,
+        recorder: TelemetryRecorder | None = None,
+        motor: ControlLoop | None = None,
+    ):
+        self._source_factory = source_factory
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.queue_size = queue_size
+        self.target_speed = 0
+        self.setpoint = 0
+        self.running = False
+        self.halted = False
+        self.started_at = time.monotonic()
+        self.latest: TelemetrySample | None = None
+        self.overruns = 0
+        self.seq = 0
+        self.history = TelemetryHistory(interval)
+        self.store = store
+        self.log = log
+        self.recorder = recorder
+        self.motor = motor
+        self.health = HealthEngine()
+        self._health = OPTIMAL
+        self._backfilled = False
+        self._subscribers: dict[str, TelemetrySubscription] = {}
+        self._control_subscribers: dict[str, ControlSubscription] = {}
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def set_target_speed(self, speed: int):
+        """Update the setpoint the belt is driven towards.
+
+        The motor control loop, if any, picks it up on its next tick.
+        """
+        speed = 0 if self.halted else max(0, int(speed))
+        if speed != self.target_speed:
+            self.record_event("target_speed", speed)
+        self.target_speed = speed
+        if self.motor is not None:
+            self.motor.set_setpoint(speed)
+
+    def set_controls(self, setpoint: int, running: bool):
+        """Set the operators' shared speed setpoint and run switch.
+
+        The belt is driven at `setpoint` while running; every session
+        subscribed with `subscribe_controls` is woken to show the change.
+        """
+        setpoint = max(0, int(setpoint))
+        changed = (setpoint, running) != (self.setpoint, self.running)
+        self.setpoint = setpoint
+        self.running = running
+        self.set_target_speed(setpoint if running else 0)
+        if changed:
+            for subscription in tuple(self._control_subscribers.values()):
+                subscription.notify()
+
+    def subscribe_controls(self, key: str) -> ControlSubscription:
+        previous = self._control_subscribers.pop(key, None)
+        if previous is not None:
+            previous.stop()
+        subscription = ControlSubscription(self, key)
+        self._control_subscribers[key] = subscription
+        return subscription
+
+    def unsubscribe_controls(self, subscription: ControlSubscription):
+        if self._control_subscribers.get(subscription.key) is subscription:
+            del self._control_subscribers[subscription.key]
+
+    def halt(self, active: bool):
+        """Hold the setpoint at zero while an emergency stop is active.
+
+        The producer is woken so the stop reaches the source on this tick
+        rather than the next scheduled one. A stop also turns the shared
+        controls off, so the belt does not restart when it is reset.
+        """
+        if active:
+            self.set_controls(0, False)
+        self.set_target_speed(0)
+        self.halted = active
+        self.record_event("estop", active)
+        self._wake.set()
+
+    def record_event(self, name: str, value: Any):
+        """Add a control event to the recording, if one is being made."""
+        if self.recorder is not None:
+            self.recorder.event(name, value)
+
+    def _replay_events(self, source: TelemetrySource):
+        for name, value in source.take_events():
+            if name == "target_speed":
+                self.set_target_speed(value)
+            else:
+                self.record_event(name, value)
+
+    def subscribe(self, key: str, mode: str = LIVE) -> TelemetrySubscription:
+        previous = self._subscribers.pop(key, None)
+        if previous is not None:
+            previous.mode = PAUSED
+        subscription = TelemetrySubscription(self, key, self.queue_size, mode)
+        if self.latest is not None and mode != PAUSED:
+            subscription.push(self.latest)
+        self._subscribers[key] = subscription
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._produce())
+        return subscription
+
+    def unsubscribe(self, subscription: TelemetrySubscription):
+        if self._subscribers.get(subscription.key) is subscription:
+            del self._subscribers[subscription.key]
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def set_mode(self, key: str, mode: str):
+        """Change the delivery rate for the session subscribed under `key`."""
+        subscription = self._subscribers.get(key)
+        if subscription is not None:
+            subscription.set_mode(mode)
+
+    def uptime_seconds(self) -> int:
+        return int(time.monotonic() - self.started_at)
+
+    def _evaluate_health(self, sample: TelemetrySample, now: float) -> int:
+        values = np.array([[getattr(sample, name) for name in CHANNELS]], float)
+        return int(self.health.evaluate(values, now)[0])
+
+    def _log_health(self, level: int, sample: TelemetrySample):
+        """Log health transitions once for all sessions."""
+        if level == self._health:
+            return
+        if level == CRITICAL:
+            self.log.publish(
+                "error",
+                "System",
+                f"CRITICAL HEALTH ALERT: Motor {sample.motor_temp}°C, Tension {sample.belt_tension:.0f}N",
+            )
+        elif level == WARNING:
+            self.log.publish(
+                "warning",
+                "System",
+                "System warning detected. Parameters deviating from optimal.",
+            )
+        else:
+            self.log.publish(
+                "success",
+                "System",
+                "System parameters stabilized. Health is Optimal.",
+            )
+        self._health = level
+
+    def _load_history(self, start: float, end: float) -> TelemetryHistory:
+        history = TelemetryHistory(self.interval)
+        for row in self.store.samples(start, end):
+            history.record(row.timestamp, row)
+        return history
+
+    async def _backfill(self):
+        """Reload the last 24 h of history from the store after a restart.
+
+        A day of rows takes seconds to aggregate, so the history is rebuilt
+        on a worker thread and swapped in; the version moves forward so
+        sessions redraw from it.
+        """
+        self._backfilled = True
+        if self.store is None:
+            return
+        now = time.time()
+        try:
+            history = await asyncio.to_thread(self._load_history, now - 86400, now)
+        except Exception as e:
+            logging.exception(f"Error: {e}")
+            return
+        history.version += self.history.version + 1
+        self.history = history
+
+    async def _produce(self):
+        if not self._backfilled:
+            await self._backfill()
+        source = self._source_factory()
+        deadline = time.monotonic()
+        try:
+            while True:
+                try:
+                    sample = await source.read(self.target_speed)
+                except Exception as e:
+                    logging.exception(f"Error: {e}")
+                else:
+                    self._replay_events(source)
+                    level = self._evaluate_health(sample, source.now())
+                    sample = dataclasses.replace(
+                        sample,
+                        system_health=HEALTH_LABELS[level],
+                        uptime_seconds=self.uptime_seconds(),
+                        seq=self.seq + 1,
+                        produced=time.monotonic(),
+                    )
+                    self.seq += 1
+                    self.latest = sample
+                    timestamp = time.time()
+                    self.history.record(timestamp, sample)
+                    if self.store is not None and not source.replay:
+                        self.store.append(timestamp, sample)
+                    if self.recorder is not None:
+                        self.recorder.sample(sample)
+                    if self.log is not None and not source.replay:
+                        self._log_health(level, sample)
+                    now = time.monotonic()
+                    for subscription in tuple(self._subscribers.values()):
+                        subscription.offer(sample, now)
+                if source.paced:
+                    await asyncio.sleep(0)
+                    continue
+                deadline += self.interval
+                delay = deadline - time.monotonic()
+                if delay < 0:
+                    missed = int(-delay // self.interval) + 1
+                    self.overruns += missed
+                    deadline += missed * self.interval
+                    delay += missed * self.interval
+                if await self._sleep(delay):
+                    deadline = time.monotonic()
+        finally:
+            await source.close()
+
+    async def _sleep(self, delay: float) -> bool:
+        """Sleep until the next tick; returns True if `halt` woke us early."""
+        # asyncio.wait_for can swallow a cancel that lands as the wait
+        # completes, which would leave an orphaned producer running.
+        try:
+            async with asyncio.timeout(delay):
+                await self._wake.wait()
+        except TimeoutError:
+            return False
+        self._wake.clear()
+        return True
+
+
+telemetry_hub = TelemetryHub(
+    store=TelemetryStore(),
+    log=log_bus,
+    recorder=(
+        TelemetryRecorder(settings.TELEMETRY_RECORD_PATH)
+        if settings.TELEMETRY_RECORD_PATH
+        else None
+    ),
+    motor=motor_control,
+)
@@ -0,0 +1,209 @@
+import asyncio
+import json
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import IO, Any, Iterator, NamedTuple
+from app.services import settings
+from app.services.batch_writer import BatchWriter
+from app.services.telemetry_history import CHANNELS
+from app.services.telemetry_source import TelemetrySample, TelemetrySource
+
+MAGIC = b"RBREC\x01"
+SAMPLE = 0
+EVENT = 1
+# Magic, wall-clock start, tick interval and simulator seed (-1 for none).
+_HEADER = struct.Struct("<6sddq")
+# Kind and seconds since the start of the recording.
+_FRAME = struct.Struct("<Bd")
+_CHANNELS = struct.Struct(f"<{len(CHANNELS)}f")
+_EVENT_LENGTH = struct.Struct("<H")
+
+
+@dataclass(frozen=True)
+class RecordingHeader:
+    started: float
+    interval: float
+    seed: int | None
+
+
+class RecordedFrame(NamedTuple):
+    """One sample or control event, `offset` seconds into the recording."""
+
+    offset: float
+    sample: TelemetrySample | None = None
+    event: tuple[str, Any] | None = None
+
+
+def encode_sample(offset: float, sample: TelemetrySample) -> bytes:
+    values = [getattr(sample, name) for name in CHANNELS]
+    return _FRAME.pack(SAMPLE, offset) + _CHANNELS.pack(*values)
+
+
+def encode_event(offset: float, name: str, value: Any) -> bytes:
+    payload = json.dumps([name, value], separators=(",", ":")).encode()
+    return _FRAME.pack(EVENT, offset) + _EVENT_LENGTH.pack(len(payload)) + payload
+
+
+class TelemetryRecording:
+    """Reader for a binary telemetry recording.
+
+    The file is a fixed header followed by frames: a kind byte and a
+    float64 offset, then either the channels as float32 in `CHANNELS`
+    order (25 bytes per sample) or a length-prefixed JSON `[name, value]`
+    control event.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self.header = self._read_header(file)
+
+    @staticmethod
+    def _read_header(file: IO[bytes]) -> RecordingHeader:
+        data = file.read(_HEADER.size)
+        if len(data) < _HEADER.size or data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a telemetry recording")
+        _, started, interval, seed = _HEADER.unpack(data)
+        return RecordingHeader(started, interval, None if seed < 0 else seed)
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        with open(self.path, "rb") as file:
+            self._read_header(file)
+            while True:
+                data = file.read(_FRAME.size)
+                if len(data) < _FRAME.size:
+                    return
+                kind, offset = _FRAME.unpack(data)
+                if kind == SAMPLE:
+                    data = file.read(_CHANNELS.size)
+                    if len(data) < _CHANNELS.size:
+                        return
+                    values = dict(zip(CHANNELS, _CHANNELS.unpack(data)))
+                    values["belt_speed"] = int(round(values["belt_speed"]))
+                    values["motor_temp"] = int(round(values["motor_temp"]))
+                    yield RecordedFrame(offset, sample=TelemetrySample(**values))
+                else:
+                    data = file.read(_EVENT_LENGTH.size)
+                    if len(data) < _EVENT_LENGTH.size:
+                        return
+                    (length,) = _EVENT_LENGTH.unpack(data)
+                    data = file.read(length)
+                    if len(data) < length:
+                        return
+                    name, value = json.loads(data)
+                    yield RecordedFrame(offset, event=(name, value))
+
+
+class TelemetryRecorder(BatchWriter):
+    """Writes the telemetry stream and control events to a recording.
+
+    Frames are encoded on the caller's side and appended by a background
+    thread; the file is replaced when the recorder starts.
+    """
+
+    name = "telemetry-recorder"
+
+    def __init__(
+        self,
+        path: str,
+        interval: float = settings.TELEMETRY_INTERVAL,
+        seed: int | None = settings.SIM_SEED,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        queue_size: int = 10000,
+    ):
+        super().__init__(batch_size, flush_interval, queue_size)
+        self.path = path
+        self.interval = interval
+        self.seed = seed
+        self.started = time.time()
+        self._clock = time.monotonic()
+        self._file: IO[bytes] | None = None
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._clock
+
+    def sample(self, sample: TelemetrySample, offset: float | None = None):
+        """Queue a sample, stamped now unless `offset` is given."""
+        offset = self.elapsed() if offset is None else offset
+        self.submit(encode_sample(offset, sample))
+
+    def event(self, name: str, value: Any, offset: float | None = None):
+        """Queue a control event, stamped now unless `offset` is given."""
+        offset = self.elapsed() if offset is None else offset
+        self.submit(encode_event(offset, name, value))
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "wb")
+        seed = -1 if self.seed is None else self.seed
+        self._file.write(_HEADER.pack(MAGIC, self.started, self.interval, seed))
+
+    def _write_batch(self, batch: list[bytes]):
+        self._file.write(b"".join(batch))
+        self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RecordingReplaySource(TelemetrySource):
+    """Replays a binary recording at `speed` times real time.
+
+    A speed of 0 replays as fast as the hub consumes samples. The source
+    paces itself from the recorded offsets, and reports them as its clock
+    so health dwell times match the original run at any speed. Control
+    events between samples are handed to the hub through `take_events`.
+    """
+
+    paced = True
+    replay = True
+
+    def __init__(self, path: str, speed: float = settings.TELEMETRY_REPLAY_SPEED):
+        self.path = path
+        self.speed = speed
+        self.recording = TelemetryRecording(path)
+        self._frames: Iterator[RecordedFrame] | None = None
+        self._events: list[tuple[str, Any]] = []
+        self._offset = 0.0
+        self._started = 0.0
+        self._last: TelemetrySample | None = None
+
+    def now(self) -> float:
+        return self._offset
+
+    def take_events(self) -> list[tuple[str, Any]]:
+        events, self._events = self._events, []
+        return events
+
+    def _next_sample(self) -> RecordedFrame | None:
+        if self._frames is None:
+            self._frames = iter(self.recording)
+        for frame in self._frames:
+            if frame.sample is not None:
+                return frame
+            self._events.append(frame.event)
+        return None
+
+    async def read(self, target_speed: int) -> TelemetrySample:
+        frame = await asyncio.to_thread(self._next_sample)
+        if frame is None:
+            if self._last is None:
+                raise EOFError(f"No telemetry samples in {self.path}")
+            await asyncio.sleep(self.recording.header.interval)
+            return self._last
+        if not self._started:
+            self._started = time.monotonic() - frame.offset / (self.speed or 1)
+        if self.speed > 0:
+            delay = self._started + frame.offset / self.speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        self._offset = frame.offset
+        self._last = frame.sample
+        return frame.sample
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import time
+import numpy as np
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+from app.services import settings
+from app.services.batch_simulator import SingleBeltSimulator
+from app.services.motor_control import ControlLoop, motor_control
+
+
+@dataclass(frozen=True)
+class TelemetrySample:
+    """A single reading of the belt channels."""
+
+    belt_speed: int
+    motor_temp: int
+    belt_tension: float
+    current_draw: float
+    system_health: str = "Optimal"
+    uptime_seconds: int = 0
+    # Stamped by the hub: tick sequence number and monotonic production time.
+    seq: int = 0
+    produced: float = 0.0
+
+
+class TelemetrySource(ABC):
+    """Produces telemetry samples for the dashboard.
+
+    Sources run outside of any state lock; `target_speed` is the setpoint
+    the operator requested, which simulated sources use to drive the belt.
+    Sources report raw channels only; health is assigned by the hub.
+    Paced sources wait for their own next sample inside `read`, so the hub
+    does not add its tick interval on top. Replay sources re-emit data that
+    was already stored and logged when it was recorded, so the hub keeps
+    their samples out of the telemetry store and the log.
+    """
+
+    paced = False
+    replay = False
+
+    @abstractmethod
+    async def read(self, target_speed: int) -> TelemetrySample:
+        """Return the next sample."""
+
+    def now(self) -> float:
+        """Monotonic time of the latest sample, used for health dwell times."""
+        return time.monotonic()
+
+    def take_events(self) -> list[tuple[str, Any]]:
+        """Control events the source replayed since the last read."""
+        return []
+
+    async def close(self):
+        """Release any resources held by the source."""
+
+
+class SimulatedTelemetrySource(TelemetrySource):
+    """Simulation of a single belt driven towards the operator's setpoint.
+
+    With a `motor` control loop, the belt speed is the loop's measured
+    speed and the setpoint is left to the loop; otherwise the simulator
+    ramps towards `target_speed` itself.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.TELEMETRY_INTERVAL,
+        seed: int | None = settings.SIM_SEED,
+        motor: ControlLoop | None = None,
+        motor_temp: int = 42,
+    ):
+        self.simulator = SingleBeltSimulator(
+            1, interval=interval, seed=seed, fault_rate=0.0
+        )
+        self.simulator.temp[:] = motor_temp
+        self.motor = motor
+        if motor is not None:
+            motor.start()
+
+    async def read(self, target_speed: int) -> TelemetrySample:
+        if self.motor is None:
+            self.simulator.set_target(target_speed)
+            values = self.simulator.read()
+        else:
+            values = self.simulator.step(speed=np.array([self.motor.speed]))
+        speed, temp, tension, current = values[0].tolist()
+        return TelemetrySample(
+            belt_speed=int(round(speed)),
+            motor_temp=int(round(temp)),
+            belt_tension=tension,
+            current_draw=current,
+        )
+
+
+class ReplayTelemetrySource(TelemetrySource):
+    """Replays samples from a JSON-lines file, one object per line.
+
+    Each line needs `belt_speed`, `motor_temp`, `belt_tension` and
+    `current_draw`. The file is rewound when `loop` is set, otherwise the
+    last sample is repeated once the file is exhausted.
+    """
+
+    replay = True
+
+    def __init__(self, path: str, loop: bool = True):
+        self.path = path
+        self.loop = loop
+        self._file = None
+        self._last: TelemetrySample | None = None
+
+    def _next_line(self) -> str:
+        if self._file is None:
+            self._file = open(self.path, encoding="utf-8")
+        while True:
+            line = self._file.readline()
+            if not line:
+                if not self.loop or self._last is None:
+                    return ""
+                self._file.seek(0)
+                continue
+            if line.strip():
+                return line
+
+    async def read(self, target_speed: int) -> TelemetrySample:
+        line = await asyncio.to_thread(self._next_line)
+        if not line:
+            if self._last is None:
+                raise EOFError(f"No telemetry samples in {self.path}")
+            return self._last
+        data = json.loads(line)
+        self._last = TelemetrySample(
+            belt_speed=int(data["belt_speed"]),
+            motor_temp=int(data["motor_temp"]),
+            belt_tension=float(data["belt_tension"]),
+            current_draw=float(data["current_draw"]),
+        )
+        return self._last
+
+    async def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def create_telemetry_source() -> TelemetrySource:
+    """Build the source selected by the ROBOBELT_TELEMETRY_REPLAY env var.
+
+    `.rbrec` files are binary recordings, anything else is JSON lines.
+    """
+    path = settings.TELEMETRY_REPLAY_PATH
+    if path.endswith(".rbrec"):
+        from app.services.telemetry_recording import RecordingReplaySource
+
+        return RecordingReplaySource(path)
+    if path:
+        return ReplayTelemetrySource(path)
+    return SimulatedTelemetrySource(motor=motor_control)
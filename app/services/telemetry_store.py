@@ -0,0 +1,118 @@
+import os
+import sqlite3
+import time
+from typing import Any, NamedTuple
+from app.services import settings
+from app.services.batch_writer import BatchWriter
+from app.services.telemetry_history import CHANNELS
+
+
+class StoredSample(NamedTuple):
+    timestamp: float
+    belt_speed: float
+    motor_temp: float
+    belt_tension: float
+    current_draw: float
+
+
+class TelemetryStore(BatchWriter):
+    """Embedded SQLite time-series store for the telemetry channels.
+
+    `append` only enqueues; the writer thread inserts rows in batches every
+    `batch_size` samples or `flush_interval` seconds, whichever comes
+    first, so the telemetry loop never waits on disk I/O.
+    """
+
+    name = "telemetry-store"
+
+    def __init__(
+        self,
+        path: str = settings.TELEMETRY_DB_PATH,
+        batch_size: int = 100,
+        flush_interval: float = 10.0,
+        retention_days: float = settings.TELEMETRY_RETENTION_DAYS,
+        queue_size: int = 10000,
+    ):
+        super().__init__(batch_size, flush_interval, queue_size)
+        self.path = path
+        self.retention_seconds = retention_days * 86400
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS samples ("
+            "ts REAL PRIMARY KEY, "
+            + ", ".join(f"{name} REAL" for name in CHANNELS)
+            + ")"
+        )
+        return conn
+
+    def append(self, timestamp: float, sample: Any):
+        """Queue a sample for writing without blocking."""
+        self.submit((timestamp, *(getattr(sample, name) for name in CHANNELS)))
+
+    def _open(self):
+        self._conn = self._connect()
+
+    def _write_batch(self, batch: list[tuple]):
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO samples (ts, {', '.join(CHANNELS)}) "
+                f"VALUES (?{', ?' * len(CHANNELS)})",
+                batch,
+            )
+
+    def _close(self):
+        self._conn.close()
+        self._conn = None
+
+    def _maintain(self):
+        """Prune samples older than the retention period."""
+        cutoff = time.time() - self.retention_seconds
+        with self._conn:
+            self._conn.execute("DELETE FROM samples WHERE ts < ?", (cutoff,))
+
+    def samples(self, start: float, end: float) -> list[StoredSample]:
+        """Raw samples with `start <= timestamp < end`, oldest first."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT ts, {', '.join(CHANNELS)} FROM samples "
+                "WHERE ts >= ? AND ts < ? ORDER BY ts",
+                (start, end),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [StoredSample(*row) for row in rows]
+
+    def downsample(
+        self, start: float, end: float, bucket_seconds: float
+    ) -> list[dict[str, float]]:
+        """Min/max/mean per channel over `bucket_seconds` wide buckets."""
+        aggregates = ", ".join(
+            f"MIN({name}), MAX({name}), AVG({name})" for name in CHANNELS
+        )
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT CAST(ts / ? AS INTEGER) AS bucket, COUNT(*), {aggregates} "
+                "FROM samples WHERE ts >= ? AND ts < ? "
+                "GROUP BY bucket ORDER BY bucket",
+                (bucket_seconds, start, end),
+            ).fetchall()
+        finally:
+            conn.close()
+        result = []
+        for bucket, count, *values in rows:
+            point = {"timestamp": bucket * bucket_seconds, "count": count}
+            for i, name in enumerate(CHANNELS):
+                low, high, mean = values[i * 3 : i * 3 + 3]
+                point[name] = {"min": low, "max": high, "mean": mean}
+            result.append(point)
+        return result
@@ -3,7 +3,10 @@ import json
 import logging
 from typing import Optional
 from pydantic import BaseModel
-from app.states.log_state import LogState
+from app.services.log_bus import log_bus
+from app.services.motor_control import PidGains, motor_control, valid_gain
+
+INVALID_GAINS = "PID gains must be finite and non-negative."
 
 
 class SystemConfig(BaseModel):
@@ -25,16 +28,26 @@ class ConfigState(rx.State):
 
     @rx.event
     def on_mount(self):
-        """Load configuration from local storage on mount."""
+        """Load configuration from local storage on mount.
+
+        Runs on every page, so the saved PID gains reach the control loop
+        as soon as the first session after a restart mounts.
+        """
         try:
             if self.config_json and self.config_json != "{}":
                 data = json.loads(self.config_json)
                 config = SystemConfig(**data)
+                gains = PidGains(kp=config.pid_p, ki=config.pid_i, kd=config.pid_d)
+                if not gains.valid:
+                    return rx.toast(
+                        f"Saved configuration ignored: {INVALID_GAINS}", duration=3000
+                    )
                 self.max_speed = config.max_speed
                 self.pid_p = config.pid_p
                 self.pid_i = config.pid_i
                 self.pid_d = config.pid_d
                 self.calibration_offset = config.calibration_offset
+                motor_control.load_gains(gains)
         except Exception as e:
             logging.exception(f"Error: {e}")
             print(f"Failed to load config: {e}")
@@ -56,29 +69,38 @@ class ConfigState(rx.State):
     @rx.event
     def set_pid_p(self, value: str):
         try:
-            self.pid_p = float(value)
-            self.has_unsaved_changes = True
+            gain = float(value)
         except ValueError as e:
             logging.exception(f"Error: {e}")
-            pass
+            return
+        if not valid_gain(gain):
+            return rx.toast(INVALID_GAINS, duration=3000)
+        self.pid_p = gain
+        self.has_unsaved_changes = True
 
     @rx.event
     def set_pid_i(self, value: str):
         try:
-            self.pid_i = float(value)
-            self.has_unsaved_changes = True
+            gain = float(value)
         except ValueError as e:
             logging.exception(f"Error: {e}")
-            pass
+            return
+        if not valid_gain(gain):
+            return rx.toast(INVALID_GAINS, duration=3000)
+        self.pid_i = gain
+        self.has_unsaved_changes = True
 
     @rx.event
     def set_pid_d(self, value: str):
         try:
-            self.pid_d = float(value)
-            self.has_unsaved_changes = True
+            gain = float(value)
         except ValueError as e:
             logging.exception(f"Error: {e}")
-            pass
+            return
+        if not valid_gain(gain):
+            return rx.toast(INVALID_GAINS, duration=3000)
+        self.pid_d = gain
+        self.has_unsaved_changes = True
 
     @rx.event
     def set_calibration_offset(self, value: str):
@@ -99,6 +121,10 @@ class ConfigState(rx.State):
             if not -50 <= self.calibration_offset <= 50:
                 yield rx.toast("Offset must be between -50 and 50.", duration=3000)
                 return
+            gains = PidGains(kp=self.pid_p, ki=self.pid_i, kd=self.pid_d)
+            if not gains.valid:
+                yield rx.toast(INVALID_GAINS, duration=3000)
+                return
             new_config = SystemConfig(
                 max_speed=self.max_speed,
                 pid_p=self.pid_p,
@@ -108,9 +134,12 @@ class ConfigState(rx.State):
             )
             self.config_json = new_config.model_dump_json()
             self.has_unsaved_changes = False
-            logs = await self.get_state(LogState)
-            logs.add_log(
-                "info", "Config", "Configuration updated and saved successfully."
+            motor_control.set_gains(gains)
+            log_bus.publish(
+                "info",
+                "Config",
+                "Configuration updated and saved successfully.",
+                audit=True,
             )
             yield rx.toast("Configuration saved successfully.", duration=3000)
         except Exception as e:
@@ -127,8 +156,10 @@ class ConfigState(rx.State):
         self.pid_d = defaults.pid_d
         self.calibration_offset = defaults.calibration_offset
         self.has_unsaved_changes = True
-        logs = await self.get_state(LogState)
-        logs.add_log(
-            "warning", "Config", "Configuration values reset to defaults (unsaved)."
+        log_bus.publish(
+            "warning",
+            "Config",
+            "Configuration values reset to defaults (unsaved).",
+            audit=True,
         )
-        yield rx.toast("Values reset to defaults. Click Save to apply.", duration=3000)
\ No newline at end of file
+        yield rx.toast("Values reset to defaults. Click Save to apply.", duration=3000)
@@ -1,6 +1,21 @@
+import time
 import reflex as rx
 from app.states.config_state import ConfigState
-from app.states.log_state import LogState
+from app.services.estop import emergency_stop
+from app.services.log_bus import log_bus
+from app.services.metrics import metrics
+from app.services.telemetry_hub import telemetry_hub
+
+# Keys the manual control page streams to `ControlState.apply_intent`.
+CONTROL_KEYS = ("w", "s", "arrowup", "arrowdown", "arrowleft", "arrowright")
+DRIVE_KEYS = frozenset({"w", "s", "arrowup", "arrowdown"})
+# Intents per second while a key is held; each applies one step.
+INTENT_RATE = 20
+ALTITUDE_STEP = 0.5
+HEADING_STEP = 5
+
+# Time from the e-stop latch changing to this session's view following it.
+ESTOP_SESSION = metrics.histogram("estop.session_ms")
 
 
 class ControlState(rx.State):
@@ -8,11 +23,14 @@ class ControlState(rx.State):
     directional_bias: int = 0
     is_motor_running: bool = False
     emergency_stop_active: bool = False
-    show_estop_confirm: bool = False
     camera_connected: bool = False
     drone_altitude: float = 0.0
     drone_heading: int = 0
-    active_keys: dict[str, bool] = {}
+    _held_keys: list[str] = []
+    _intent_stream: int = 0
+    _intent_seq: int = 0
+    _is_watching_estop: bool = False
+    _is_watching_controls: bool = False
 
     @rx.var
     def connection_status_text(self) -> str:
@@ -22,48 +40,68 @@ class ControlState(rx.State):
     def connection_status_color(self) -> str:
         return "text-[#08C6AB]" if self.camera_connected else "text-red-500"
 
+    def _publish_setpoint(self):
+        """Share the motor setpoint and run switch with every session."""
+        telemetry_hub.set_controls(self.target_speed, self.is_motor_running)
+
+    def _follow_controls(self):
+        """Mirror the shared setpoint and run switch into this session."""
+        self.target_speed = telemetry_hub.setpoint
+        self.is_motor_running = telemetry_hub.running
+
     @rx.event
     async def toggle_camera(self):
         self.camera_connected = not self.camera_connected
-        logs = await self.get_state(LogState)
         if self.camera_connected:
-            logs.add_log("info", "Camera", "Camera stream connected.")
+            log_bus.publish("info", "Camera", "Camera stream connected.", audit=True)
             yield rx.toast("Camera stream established.", duration=2000)
         else:
-            logs.add_log("warning", "Camera", "Camera stream disconnected by user.")
+            log_bus.publish(
+                "warning", "Camera", "Camera stream disconnected by user.", audit=True
+            )
             yield rx.toast("Camera disconnected.", duration=2000)
 
     @rx.event
-    def handle_key_down(self, key: str):
-        """Handle key press events for drone control."""
-        if self.emergency_stop_active:
+    def apply_intent(self, intent: dict):
+        """Apply one tick of the client's key stream.
+
+        The client sends the keys held or tapped during each tick, numbered
+        within a stream that starts at page load. Intents from an older
+        stream, or numbered at or below the last one applied, are dropped,
+        so a late intent can never re-press a released key.
+        """
+        stream = int(intent.get("stream", 0))
+        seq = int(intent.get("seq", 0))
+        if stream < self._intent_stream or (
+            stream == self._intent_stream and seq <= self._intent_seq
+        ):
             return
-        key = key.lower()
-        self.active_keys[key] = True
-        if key == "w":
-            self.drone_altitude += 0.5
-        elif key == "s":
-            self.drone_altitude = max(0, self.drone_altitude - 0.5)
-        elif key == "arrowleft":
-            self.drone_heading = (self.drone_heading - 5) % 360
-        elif key == "arrowright":
-            self.drone_heading = (self.drone_heading + 5) % 360
-        if not self.is_motor_running and key in ["w", "s", "arrowup", "arrowdown"]:
+        self._intent_stream = stream
+        self._intent_seq = seq
+        if emergency_stop.active:
+            return
+        keys = {str(key).lower() for key in intent.get("keys", [])}
+        keys &= set(CONTROL_KEYS)
+        if "w" in keys:
+            self.drone_altitude += ALTITUDE_STEP
+        if "s" in keys:
+            self.drone_altitude = max(0, self.drone_altitude - ALTITUDE_STEP)
+        if "arrowleft" in keys:
+            self.drone_heading = (self.drone_heading - HEADING_STEP) % 360
+        if "arrowright" in keys:
+            self.drone_heading = (self.drone_heading + HEADING_STEP) % 360
+        if keys & DRIVE_KEYS and not self.is_motor_running:
             self.is_motor_running = True
-
-    @rx.event
-    def handle_key_up(self, key: str):
-        """Handle key release events."""
-        key = key.lower()
-        self.active_keys[key] = False
-        move_keys = ["w", "s", "arrowup", "arrowdown", "arrowleft", "arrowright"]
-        if not any((self.active_keys.get(k, False) for k in move_keys)):
+            self._publish_setpoint()
+        elif not keys and self._held_keys:
             self.is_motor_running = False
+            self._publish_setpoint()
+        self._held_keys = sorted(keys)
 
     @rx.event
     async def set_speed(self, value: int):
         """Set the target speed, clamped by max_speed config."""
-        if self.emergency_stop_active:
+        if emergency_stop.active:
             yield rx.toast("Cannot change speed: Emergency Stop Active!", duration=3000)
             return
         config_state = await self.get_state(ConfigState)
@@ -75,9 +113,11 @@ class ControlState(rx.State):
                 f"Speed limited to {max_limit} RPM by configuration.", duration=3000
             )
         if self.target_speed != new_speed:
-            logs = await self.get_state(LogState)
-            logs.add_log("info", "Motor", f"Target speed set to {new_speed} RPM.")
+            log_bus.publish(
+                "info", "Motor", f"Target speed set to {new_speed} RPM.", audit=True
+            )
         self.target_speed = new_speed
+        self._publish_setpoint()
 
     @rx.event
     def set_bias(self, value: int):
@@ -87,49 +127,94 @@ class ControlState(rx.State):
     @rx.event
     async def toggle_motor(self):
         """Start or stop the motor normal operation."""
-        if self.emergency_stop_active:
+        if emergency_stop.active:
             yield rx.toast("Cannot start motor: Emergency Stop Active!", duration=3000)
             return
-        logs = await self.get_state(LogState)
         self.is_motor_running = not self.is_motor_running
+        if not self.is_motor_running:
+            self.target_speed = 0
+        self._publish_setpoint()
         if self.is_motor_running:
-            logs.add_log("info", "Motor", "Motor sequence initiated manually.")
+            log_bus.publish(
+                "info", "Motor", "Motor sequence initiated manually.", audit=True
+            )
             yield rx.toast("Motor sequence initiated.", duration=2000)
         else:
-            self.target_speed = 0
-            logs.add_log("info", "Motor", "Motor stopped manually.")
+            log_bus.publish("info", "Motor", "Motor stopped manually.", audit=True)
             yield rx.toast("Motor stopped.", duration=2000)
 
-    @rx.event
-    def request_estop(self):
-        """Show confirmation for E-Stop."""
-        self.show_estop_confirm = True
+    def _follow_estop(self) -> bool:
+        """Mirror the e-stop latch; returns True if this session changed."""
+        active = emergency_stop.active
+        if active == self.emergency_stop_active:
+            return False
+        self.emergency_stop_active = active
+        if active:
+            self.is_motor_running = False
+            self.target_speed = 0
+            self._held_keys = []
+        return True
 
     @rx.event
-    def cancel_estop_request(self):
-        """Cancel E-Stop confirmation."""
-        self.show_estop_confirm = False
+    def start_estop_watch(self):
+        if not self._is_watching_estop:
+            self._is_watching_estop = True
+            return ControlState.watch_estop
+
+    @rx.event(background=True)
+    async def watch_estop(self):
+        """Follow e-stops triggered from any session or the API.
+
+        The stop itself has already halted the producers when this wakes;
+        this only brings the session's controls and overlay in line.
+        """
+        async with self:
+            subscription = emergency_stop.subscribe(self.router.session.client_token)
+            self._follow_estop()
+        try:
+            while await subscription.wait():
+                async with self:
+                    changed = self._follow_estop()
+                if not changed:
+                    continue
+                ESTOP_SESSION.observe(
+                    (time.monotonic() - emergency_stop.changed_at) * 1000
+                )
+                if emergency_stop.active:
+                    yield rx.toast(
+                        "EMERGENCY STOP TRIGGERED! System Halted.", duration=5000
+                    )
+                else:
+                    yield rx.toast("Emergency Stop reset. System ready.", duration=3000)
+        finally:
+            subscription.close()
 
     @rx.event
-    async def confirm_estop(self):
-        """Trigger actual Emergency Stop."""
-        self.emergency_stop_active = True
-        self.is_motor_running = False
-        self.target_speed = 0
-        self.active_keys = {}
-        self.show_estop_confirm = False
-        logs = await self.get_state(LogState)
-        logs.add_log(
-            "error", "System", "EMERGENCY STOP TRIGGERED BY USER. SYSTEM HALTED."
-        )
-        yield rx.toast("EMERGENCY STOP TRIGGERED! System Halted.", duration=5000)
+    def start_controls_watch(self):
+        if not self._is_watching_controls:
+            self._is_watching_controls = True
+            return ControlState.watch_controls
+
+    @rx.event(background=True)
+    async def watch_controls(self):
+        """Follow setpoint and run changes made from any session.
+
+        The belt is shared, so a second operator's slider and run button
+        show what the belt is actually being driven at.
+        """
+        async with self:
+            subscription = telemetry_hub.subscribe_controls(
+                self.router.session.client_token
+            )
+            self._follow_controls()
+        try:
+            while await subscription.wait():
+                async with self:
+                    self._follow_controls()
+        finally:
+            subscription.close()
 
     @rx.event
-    async def reset_estop(self):
-        """Reset the Emergency Stop state."""
-        self.emergency_stop_active = False
-        logs = await self.get_state(LogState)
-        logs.add_log(
-            "warning", "System", "Emergency stop reset. System returned to ready state."
-        )
-        yield rx.toast("Emergency Stop reset. System ready.", duration=3000)
\ No newline at end of file
+    def reset_estop(self):
+        """Release the process-wide e-stop."""
+        emergency_stop.reset()
@@ -0,0 +1,46 @@
+import reflex as rx
+from app.services.fleet import fleet_hub
+
+
+class FleetState(rx.State):
+    """Fleet overview for one session.
+
+    The belt list is sent once; after that each tick only pushes compact
+    rows for the belts that changed, which the page applies to the
+    existing cards in place.
+    """
+
+    belt_ids: list[str] = []
+    fleet_patch: list[list[float]] = []
+    health_counts: list[int] = [0, 0, 0]
+    _page_mounted: bool = False
+
+    @rx.event
+    def enter_fleet_page(self):
+        self.belt_ids = fleet_hub.fleet.belt_ids
+        if not self._page_mounted:
+            self._page_mounted = True
+            return FleetState.follow_fleet
+
+    @rx.event
+    def leave_fleet_page(self):
+        self._page_mounted = False
+
+    @rx.event(background=True)
+    async def follow_fleet(self):
+        async with self:
+            subscription = fleet_hub.subscribe(self.router.session.client_token)
+        try:
+            while True:
+                changed = await subscription.changed()
+                if changed is None:
+                    break
+                async with self:
+                    if not self._page_mounted:
+                        break
+                    self.fleet_patch = fleet_hub.fleet.rows(changed)
+                    counts = fleet_hub.fleet.health_counts()
+                    if counts != self.health_counts:
+                        self.health_counts = counts
+        finally:
+            subscription.close()
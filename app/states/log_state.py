@@ -1,64 +1,251 @@
 import reflex as rx
+import logging
+import time
 from datetime import datetime
+from urllib.parse import urlencode
+from app.services import settings
+from app.services.log_bus import log_bus
+from app.services.log_store import LogQuery, LogRecord
 
 
 class LogEntry(rx.Base):
     id: int
+    created: float
     timestamp: str
     severity: str
     category: str
     message: str
+    repeats: int = 1
+    last_timestamp: str = ""
+
+
+def _to_entry(record: LogRecord) -> LogEntry:
+    return LogEntry(
+        id=record.id,
+        created=record.created,
+        timestamp=record.timestamp,
+        severity=record.severity,
+        category=record.category,
+        message=record.message,
+        repeats=record.repeats,
+        last_timestamp=record.last_timestamp,
+    )
+
+
+# Time window label -> seconds back from now (None for no limit).
+TIME_WINDOWS = {
+    "All time": None,
+    "Last 15 min": 900,
+    "Last hour": 3600,
+    "Last 24 h": 86400,
+}
+COUNT_LIMIT = 10000
 
 
 class LogState(rx.State):
-    entries: list[LogEntry] = []
-    filter_mode: str = "All"
-    _next_id: int = 0
+    """One session's view of the shared log bus.
+
+    Entries live once in `log_bus.store`; the session keeps a read cursor,
+    its filters and the page of entries it is displaying.
+    """
+
+    severity_filter: list[str] = []
+    category_filter: str = "All"
+    time_window: str = "All time"
+    search_text: str = ""
+    category_options: list[str] = ["All"]
+    filtered_entries: list[LogEntry] = []
+    filtered_count: int = 0
+    count_capped: bool = False
+    recent_logs: list[LogEntry] = []
+    has_newer: bool = False
+    has_older: bool = False
+    # Id the current page ends below, or None when following new entries.
+    _page_before: int | None = None
+    # Last entry id this session has seen, and the first one not cleared.
+    _cursor: int = -1
+    _cleared_before: int = 0
+    _is_following: bool = False
+
+    @rx.var
+    def export_url(self) -> str:
+        """CSV export of the full indexed history under the current filters."""
+        params = {"format": "csv", "severity": ",".join(self.severity_filter)}
+        if self.category_filter != "All":
+            params["category"] = self.category_filter
+        window = TIME_WINDOWS.get(self.time_window)
+        if window:
+            params["last"] = window
+        if self.search_text.strip():
+            params["q"] = self.search_text.strip()
+        return f"{rx.config.get_config().api_url}/api/logs/export?{urlencode(params)}"
+
+    def _query(self) -> LogQuery:
+        window = TIME_WINDOWS.get(self.time_window)
+        return LogQuery(
+            severities=frozenset(self.severity_filter),
+            category="" if self.category_filter == "All" else self.category_filter,
+            since=time.time() - window if window else None,
+            text=self.search_text.strip(),
+            min_id=self._cleared_before,
+        )
+
+    def _show_page(self, before_id: int | None):
+        """Materialize one page of matches ending below `before_id`."""
+        query = self._query()
+        page_size = settings.LOG_VIEW_SIZE
+        records = log_bus.store.select(query, page_size + 1, before_id=before_id)
+        self.has_older = len(records) > page_size
+        records = records[:page_size]
+        if before_id is None:
+            self.has_newer = False
+        else:
+            after_id = records[0].id if records else before_id - 1
+            self.has_newer = bool(log_bus.store.select(query, 1, after_id=after_id))
+        self._page_before = before_id if self.has_newer else None
+        self.filtered_entries = [_to_entry(r) for r in records]
+
+    def _reload_visible(self, repeated: set[int]):
+        """Re-read the shown entries if any of them gained repeats."""
+        shown = self.filtered_entries + self.recent_logs
+        if not any(entry.id in repeated for entry in shown):
+            return
+        self._show_page(self._page_before)
+        recent = log_bus.store.select(LogQuery(min_id=self._cleared_before), 5)
+        self.recent_logs = [_to_entry(r) for r in recent]
+
+    def _refresh_view(self):
+        """Recount matches and rebuild the current page from the store."""
+        self.filtered_count = log_bus.store.count(self._query(), COUNT_LIMIT)
+        self.count_capped = self.filtered_count >= COUNT_LIMIT
+        self._show_page(self._page_before)
+        self.category_options = ["All", *log_bus.store.categories]
+        recent = log_bus.store.select(LogQuery(min_id=self._cleared_before), 5)
+        self.recent_logs = [_to_entry(r) for r in recent]
+
+    def _ingest(self, record: LogRecord):
+        """Fold one entry published after the cursor into the view."""
+        entry = _to_entry(record)
+        self.recent_logs = [entry, *self.recent_logs[:4]]
+        if record.category not in self.category_options:
+            self.category_options.append(record.category)
+        if not self._query().matches(record):
+            return
+        self.filtered_count += 1
+        if self._page_before is None:
+            self.filtered_entries = [
+                entry,
+                *self.filtered_entries[: settings.LOG_VIEW_SIZE - 1],
+            ]
+            self.has_older = self.filtered_count > settings.LOG_VIEW_SIZE
+        else:
+            self.has_newer = True
 
     @rx.event
     def on_mount(self):
-        """Initialize with some default logs if empty."""
-        if not self.entries:
-            self.add_log("info", "System", "System initialized successfully.")
-            self.add_log("success", "Network", "Connection established with PLC.")
+        self._refresh_view()
 
     @rx.event
-    def add_log(self, severity: str, category: str, message: str):
-        """Add a new log entry. This can be called from other states."""
-        now = datetime.now().strftime("%H:%M:%S")
-        entry = LogEntry(
-            id=self._next_id,
-            timestamp=now,
-            severity=severity,
-            category=category,
-            message=message,
-        )
-        self.entries.insert(0, entry)
-        self._next_id += 1
-        if len(self.entries) > 100:
-            self.entries.pop()
+    def start_following(self):
+        if not self._is_following:
+            self._is_following = True
+            return LogState.follow_logs
+
+    @rx.event(background=True)
+    async def follow_logs(self):
+        """Apply entries published by any session to this session's view."""
+        async with self:
+            subscription = log_bus.subscribe(self.router.session.client_token)
+            self._cursor = log_bus.store.next_id - 1
+            self._refresh_view()
+        try:
+            while True:
+                await subscription.wait()
+                repeated = subscription.take_repeated()
+                async with self:
+                    store = log_bus.store
+                    if store.next_id - 1 - self._cursor > settings.LOG_VIEW_SIZE:
+                        self._refresh_view()
+                    else:
+                        for record in store.iter_oldest(self._cursor):
+                            self._ingest(record)
+                        if repeated:
+                            self._reload_visible(repeated)
+                    self._cursor = store.next_id - 1
+        finally:
+            subscription.close()
 
     @rx.event
-    def set_filter(self, mode: str):
-        self.filter_mode = mode
+    def toggle_severity(self, severity: str):
+        if severity in self.severity_filter:
+            self.severity_filter.remove(severity)
+        else:
+            self.severity_filter.append(severity)
+        self._page_before = None
+        self._refresh_view()
 
     @rx.event
-    def clear_logs(self):
-        self.entries = []
+    def set_category_filter(self, category: str):
+        self.category_filter = category
+        self._page_before = None
+        self._refresh_view()
 
-    @rx.var
-    def filtered_entries(self) -> list[LogEntry]:
-        if self.filter_mode == "All":
-            return self.entries
-        elif self.filter_mode == "Errors Only":
-            return [e for e in self.entries if e.severity == "error"]
-        elif self.filter_mode == "Warnings":
-            return [e for e in self.entries if e.severity == "warning"]
-        elif self.filter_mode == "System Events":
-            return [e for e in self.entries if e.category == "System"]
-        return self.entries
+    @rx.event
+    def set_time_window(self, window: str):
+        self.time_window = window
+        self._page_before = None
+        self._refresh_view()
 
-    @rx.var
-    def recent_logs(self) -> list[LogEntry]:
-        """Return the 5 most recent logs for the dashboard panel."""
-        return self.entries[:5]
\ No newline at end of file
+    @rx.event
+    def search(self, form_data: dict):
+        self.search_text = form_data.get("search", "")
+        self._page_before = None
+        self._refresh_view()
+
+    @rx.event
+    def reset_filters(self):
+        self.severity_filter = []
+        self.category_filter = "All"
+        self.time_window = "All time"
+        self.search_text = ""
+        self._page_before = None
+        self._refresh_view()
+
+    @rx.event
+    def older_page(self):
+        if self.filtered_entries:
+            self._show_page(self.filtered_entries[-1].id)
+
+    @rx.event
+    def newer_page(self):
+        if not self.filtered_entries:
+            self._show_page(None)
+            return
+        page = log_bus.store.select(
+            self._query(),
+            settings.LOG_VIEW_SIZE,
+            after_id=self.filtered_entries[0].id,
+            newest_first=False,
+        )
+        self._show_page(page[-1].id + 1 if page else None)
+
+    @rx.event
+    def newest_page(self):
+        self._show_page(None)
+
+    @rx.event
+    def jump_to_time(self, value: str):
+        """Show the page ending at a `YYYY-MM-DDTHH:MM` local time."""
+        try:
+            target = datetime.fromisoformat(value).timestamp()
+        except ValueError as e:
+            logging.exception(f"Error: {e}")
+            return
+        self._show_page(log_bus.store.id_after(target))
+
+    @rx.event
+    def clear_logs(self):
+        """Hide the current entries from this session only."""
+        self._cleared_before = log_bus.store.next_id
+        self._page_before = None
+        self._refresh_view()
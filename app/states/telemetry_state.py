@@ -1,6 +1,16 @@
+import time
 import reflex as rx
-import asyncio
-import random
+from reflex.utils.format import json_dumps
+from app.services.metrics import SIZE_BUCKETS_BYTES, metrics
+from app.services.telemetry_delta import telemetry_delta
+from app.services.telemetry_history import CHANNELS
+from app.services.telemetry_hub import IDLE, LIVE, PAUSED, telemetry_hub
+
+QUEUE_WAIT = metrics.histogram("telemetry.queue_wait")
+LOCK_WAIT = metrics.histogram("telemetry.lock_wait")
+HANDLER_TIME = metrics.histogram("telemetry.handler_time")
+DELTA_SIZE = metrics.histogram("telemetry.delta_size", "bytes", SIZE_BUCKETS_BYTES)
+CLIENT_LATENCY = metrics.histogram("telemetry.client_latency")
 
 
 class TelemetryState(rx.State):
@@ -11,9 +21,15 @@ class TelemetryState(rx.State):
     belt_tension: float = 450.0
     current_draw: float = 2.4
     system_health: str = "Optimal"
-    previous_health: str = "Optimal"
-    uptime_seconds: int = 45600
+    uptime_seconds: int = 0
+    trends: dict[str, str] = {name: "—" for name in CHANNELS}
+    sparklines: dict[str, str] = {name: "" for name in CHANNELS}
+    telemetry_seq: int = 0
+    _seq_produced: float = 0.0
+    _history_version: int = -1
     _is_running: bool = False
+    _status_page_mounted: bool = False
+    _tab_hidden: bool = False
 
     @rx.var
     def uptime_formatted(self) -> str:
@@ -21,100 +37,87 @@ class TelemetryState(rx.State):
         minutes = self.uptime_seconds % 3600 // 60
         return f"{hours}h {minutes}m"
 
-    @rx.var
-    def health_color(self) -> str:
-        if self.system_health == "Optimal":
-            return "text-green-600"
-        elif self.system_health == "Warning":
-            return "text-yellow-600"
-        return "text-red-600"
-
-    @rx.var
-    def health_bg_color(self) -> str:
-        if self.system_health == "Optimal":
-            return "bg-green-500"
-        elif self.system_health == "Warning":
-            return "bg-yellow-500"
-        return "bg-red-500"
-
     @rx.var
     def tension_pct(self) -> str:
         val = (self.belt_tension - 300) / 3.0
         return f"{max(0, min(100, val)):.1f}%"
 
+    def _rate_mode(self) -> str:
+        """Full rate on System Status, slow elsewhere, paused when hidden."""
+        if self._tab_hidden:
+            return PAUSED
+        return LIVE if self._status_page_mounted else IDLE
+
+    def _apply_rate_mode(self):
+        telemetry_hub.set_mode(self.router.session.client_token, self._rate_mode())
+
     @rx.event
     def start_simulation(self):
         if not self._is_running:
             self._is_running = True
             return TelemetryState.update_telemetry
 
+    @rx.event
+    def enter_status_page(self):
+        self._status_page_mounted = True
+        self._apply_rate_mode()
+
+    @rx.event
+    def leave_status_page(self):
+        self._status_page_mounted = False
+        self._apply_rate_mode()
+
+    @rx.event
+    def set_tab_hidden(self):
+        self._tab_hidden = True
+        self._apply_rate_mode()
+
+    @rx.event
+    def set_tab_visible(self):
+        self._tab_hidden = False
+        self._apply_rate_mode()
+
+    @rx.event
+    def ack_telemetry(self, seq: int):
+        """Record the latency of the latest tick once the client rendered it."""
+        if seq == self.telemetry_seq and self._seq_produced:
+            CLIENT_LATENCY.observe((time.monotonic() - self._seq_produced) * 1000)
+            self._seq_produced = 0.0
+
     @rx.event(background=True)
     async def update_telemetry(self):
-        while True:
-            async with self:
-                if not self._is_running:
-                    break
-                from app.states.control_state import ControlState
-                from app.states.log_state import LogState
-
-                control = await self.get_state(ControlState)
-                target = control.target_speed if control.is_motor_running else 0
-                if self.belt_speed < target:
-                    self.belt_speed = min(target, self.belt_speed + 15)
-                elif self.belt_speed > target:
-                    self.belt_speed = max(target, self.belt_speed - 25)
-                if self.belt_speed > 0:
-                    self.belt_speed = int(
-                        max(0, self.belt_speed + random.randint(-2, 2))
-                    )
-                self.motor_temp = int(
-                    max(20, min(95, self.motor_temp + random.randint(-1, 2)))
-                )
-                base_tension = 450 + self.belt_speed * 0.2
-                self.belt_tension = max(
-                    300, min(600, base_tension + random.uniform(-10, 10))
-                )
-                base_current = 1.0 + self.belt_speed * 0.01
-                self.current_draw = max(
-                    0.5, min(8.0, base_current + random.uniform(-0.1, 0.1))
-                )
-                self.uptime_seconds += 2
-                if (
-                    self.motor_temp > 85
-                    or self.belt_tension > 580
-                    or self.belt_tension < 320
-                ):
-                    self.system_health = "Critical"
-                elif (
-                    self.motor_temp > 70
-                    or self.belt_tension > 550
-                    or self.belt_tension < 350
-                ):
-                    self.system_health = "Warning"
-                else:
-                    self.system_health = "Optimal"
-                if self.system_health != self.previous_health:
-                    log_state = await self.get_state(LogState)
-                    if self.system_health == "Critical":
-                        log_state.add_log(
-                            "error",
-                            "System",
-                            f"CRITICAL HEALTH ALERT: Motor {self.motor_temp}°C, Tension {self.belt_tension:.0f}N",
-                        )
-                    elif self.system_health == "Warning":
-                        log_state.add_log(
-                            "warning",
-                            "System",
-                            f"System warning detected. Parameters deviating from optimal.",
-                        )
-                    elif (
-                        self.system_health == "Optimal"
-                        and self.previous_health != "Optimal"
-                    ):
-                        log_state.add_log(
-                            "success",
-                            "System",
-                            "System parameters stabilized. Health is Optimal.",
-                        )
-                    self.previous_health = self.system_health
-            await asyncio.sleep(2)
\ No newline at end of file
+        async with self:
+            subscription = telemetry_hub.subscribe(
+                self.router.session.client_token, self._rate_mode()
+            )
+        try:
+            while True:
+                sample = await subscription.get()
+                received = time.monotonic()
+                QUEUE_WAIT.observe((received - sample.produced) * 1000)
+                async with self:
+                    locked = time.monotonic()
+                    LOCK_WAIT.observe((locked - received) * 1000)
+                    if not self._is_running:
+                        break
+                    delta = telemetry_delta(self, sample)
+                    for name, value in delta.items():
+                        setattr(self, name, value)
+                    if delta:
+                        self.telemetry_seq = delta["telemetry_seq"] = sample.seq
+                        self._seq_produced = sample.produced
+                    history = telemetry_hub.history
+                    if history.version != self._history_version:
+                        trends, sparklines = history.snapshot()
+                        self.trends = delta["trends"] = dict(trends)
+                        self.sparklines = delta["sparklines"] = dict(sparklines)
+                        self._history_version = history.version
+                    if delta:
+                        # The update Reflex sends on leaving the block: every
+                        # dirty var and dependent computed var by state path.
+                        payload = json_dumps(self._get_root_state().get_delta())
+                HANDLER_TIME.observe((time.monotonic() - locked) * 1000)
+                if delta:
+                    DELTA_SIZE.observe(len(payload.encode()))
+        finally:
+            subscription.close()
@@ -0,0 +1,150 @@
+"""Shared style classes built from the theme tokens.
+
+Components used to repeat the same inline `style` dicts, which Reflex
+compiles into a per-element CSS object that is serialized and hashed on
+every render. These classes are emitted once into the page head instead;
+components add them to `class_name`. Rules are scoped under `:root` so
+they take precedence over single Tailwind utilities such as `border-b`,
+as the inline styles did.
+"""
+
+from app import theme
+
+CLASSES: dict[str, dict[str, str]] = {
+    "rb-text": {"color": theme.text_primary},
+    "rb-muted": {"color": theme.text_secondary},
+    "rb-accent": {"color": theme.accent_color},
+    "rb-success": {"color": theme.success_color},
+    "rb-warning": {"color": theme.warning_color},
+    "rb-error": {"color": theme.error_color},
+    "rb-surface": {"background-color": theme.bg_color},
+    "rb-panel": {"background-color": theme.card_color},
+    "rb-card": {"background-color": theme.card_color, "border": theme.border},
+    "rb-inset": {"background-color": theme.bg_color, "border": theme.border},
+    "rb-border": {"border-color": theme.border_color},
+    "rb-outline": {
+        "border-color": theme.border_color,
+        "border-width": theme.border_width,
+    },
+    "rb-divider-t": {
+        "border-color": theme.border_color,
+        "border-top-width": theme.border_width,
+    },
+    "rb-divider-b": {
+        "border-color": theme.border_color,
+        "border-bottom-width": theme.border_width,
+    },
+    "rb-divider-l": {
+        "border-color": theme.border_color,
+        "border-left-width": theme.border_width,
+    },
+    "rb-divider-r": {
+        "border-color": theme.border_color,
+        "border-right-width": theme.border_width,
+    },
+    "rb-input": {
+        "background-color": theme.bg_color,
+        "border-color": theme.border_color,
+        "border-width": theme.border_width,
+        "color": theme.text_primary,
+    },
+    "rb-ghost": {
+        "background-color": "transparent",
+        "color": theme.text_secondary,
+        "border": f"1px solid {theme.border_color}",
+    },
+    "rb-outline-button": {
+        "background-color": "transparent",
+        "color": theme.text_primary,
+        "border": f"1px solid {theme.border_color}",
+    },
+    "rb-accent-fill": {
+        "background-color": theme.accent_color,
+        "color": theme.accent_text,
+    },
+    "rb-accent-button": {
+        "background-color": theme.accent_color,
+        "color": theme.accent_text,
+        "border": theme.accent_border,
+    },
+    "rb-success-badge": {
+        "color": theme.success_color,
+        "background-color": theme.success_tint,
+        "border": theme.success_outline,
+    },
+    "rb-warning-badge": {
+        "color": theme.warning_color,
+        "background-color": theme.warning_tint,
+        "border": theme.warning_outline,
+    },
+    "rb-key": {
+        "background-color": "transparent",
+        "border-color": theme.border_color,
+        "color": theme.text_secondary,
+    },
+    "rb-stroke-accent": {"stroke": theme.accent_color},
+    "rb-stroke-border": {"stroke": theme.border_color},
+    "rb-health-dot": {"background-color": theme.error_color},
+    "rb-health-text": {"color": theme.error_color},
+    "rb-health-glow": {"box-shadow": "0 0 8px rgba(239, 68, 68, 0.6)"},
+    "rb-severity": {
+        "font-weight": "bold",
+        "padding": "2px 8px",
+        "border-radius": "9999px",
+        "display": "inline-block",
+        "width": "5rem",
+        "text-align": "center",
+        "font-size": "0.75rem",
+        "color": theme.accent_color,
+        "background-color": "rgba(59, 130, 246, 0.1)",
+        "border": f"1px solid {theme.accent_color}",
+    },
+}
+
+# Variants selected by a data attribute, so rows need no per-row style logic.
+VARIANTS: dict[str, dict[str, str]] = {
+    ".rb-key[data-pressed=true]": {
+        "background-color": theme.accent_color,
+        "border-color": theme.accent_color,
+        "color": theme.accent_text,
+    },
+    ".rb-health-dot[data-health=Optimal]": {"background-color": theme.success_color},
+    ".rb-health-dot[data-health=Warning]": {"background-color": theme.warning_color},
+    ".rb-health-text[data-health=Optimal]": {"color": theme.success_color},
+    ".rb-health-text[data-health=Warning]": {"color": theme.warning_color},
+    ".rb-health-glow[data-health=Optimal]": {
+        "box-shadow": "0 0 8px rgba(34, 197, 94, 0.6)"
+    },
+    ".rb-health-glow[data-health=Warning]": {
+        "box-shadow": "0 0 8px rgba(234, 179, 8, 0.6)"
+    },
+    ".rb-severity[data-severity=error]": {
+        "color": theme.error_color,
+        "background-color": "rgba(239, 68, 68, 0.1)",
+        "border-color": theme.error_color,
+    },
+    ".rb-severity[data-severity=warning]": {
+        "color": theme.warning_color,
+        "background-color": "rgba(245, 158, 11, 0.1)",
+        "border-color": theme.warning_color,
+    },
+    ".rb-severity[data-severity=success]": {
+        "color": theme.success_color,
+        "background-color": "rgba(16, 185, 129, 0.1)",
+        "border-color": theme.success_color,
+    },
+}
+
+
+def _rule(selector: str, declarations: dict[str, str]) -> str:
+    body = " ".join(f"{name}: {value};" for name, value in declarations.items())
+    return f":root {selector} {{ {body} }}"
+
+
+def styles_css() -> str:
+    """Stylesheet with every shared class and its variants."""
+    rules = [_rule(f".{name}", declarations) for name, declarations in CLASSES.items()]
+    rules += [
+        _rule(selector, declarations) for selector, declarations in VARIANTS.items()
+    ]
+    return "\n".join(rules)
@@ -0,0 +1,168 @@
+"""Theme palettes compiled to CSS custom properties.
+
+Each palette is emitted once, at build time, as a rule on
+`[data-theme=<name>]`; components style themselves with the `var(...)`
+references below, so switching theme only flips the `data-theme`
+attribute and never re-evaluates component styles.
+
+The theme is chosen entirely in the browser: a head script applies the
+saved choice to `<html>` before first paint, and the theme buttons call
+it directly, so theme changes never reach the backend.
+"""
+
+import json
+import reflex as rx
+
+THEMES = ("dark", "light", "contrast")
+DEFAULT_THEME = "dark"
+STORAGE_KEY = "theme_mode"
+
+PALETTES: dict[str, dict[str, str]] = {
+    "dark": {
+        "bg_color": "#212B38",
+        "card_color": "#37465B",
+        "text_primary": "#FFFFFF",
+        "text_secondary": "#9CA3AF",
+        "accent_color": "#08C6AB",
+        "accent_text": "#212B38",
+        "accent_icon": "white",
+        "accent_border": "none",
+        "border_color": "#37465B",
+        "border_width": "1px",
+        "success_color": "#08C6AB",
+        "success_tint": "rgba(8, 198, 171, 0.2)",
+        "success_outline": "none",
+        "warning_color": "#F59E0B",
+        "warning_tint": "rgba(245, 158, 11, 0.1)",
+        "warning_outline": "none",
+        "error_color": "#EF4444",
+    },
+    "light": {
+        "bg_color": "#F9FAFB",
+        "card_color": "#FFFFFF",
+        "text_primary": "#111827",
+        "text_secondary": "#6B7280",
+        "accent_color": "#0D9488",
+        "accent_text": "#212B38",
+        "accent_icon": "white",
+        "accent_border": "none",
+        "border_color": "#E5E7EB",
+        "border_width": "1px",
+        "success_color": "#059669",
+        "success_tint": "rgba(8, 198, 171, 0.2)",
+        "success_outline": "none",
+        "warning_color": "#D97706",
+        "warning_tint": "rgba(245, 158, 11, 0.1)",
+        "warning_outline": "none",
+        "error_color": "#DC2626",
+    },
+    "contrast": {
+        "bg_color": "#000000",
+        "card_color": "#000000",
+        "text_primary": "#FFFFFF",
+        "text_secondary": "#FFFF00",
+        "accent_color": "#00FFFF",
+        "accent_text": "black",
+        "accent_icon": "black",
+        "accent_border": "2px solid white",
+        "border_color": "#FFFFFF",
+        "border_width": "2px",
+        "success_color": "#00FF00",
+        "success_tint": "transparent",
+        "success_outline": "1px solid #00FF00",
+        "warning_color": "#FFFF00",
+        "warning_tint": "transparent",
+        "warning_outline": "1px solid #FFFF00",
+        "error_color": "#FF0000",
+    },
+}
+
+
+def css_var(token: str) -> str:
+    """The `var(...)` reference for a palette token."""
+    return f"var(--rb-{token.replace('_', '-')})"
+
+
+bg_color = css_var("bg_color")
+card_color = css_var("card_color")
+text_primary = css_var("text_primary")
+text_secondary = css_var("text_secondary")
+accent_color = css_var("accent_color")
+accent_text = css_var("accent_text")
+accent_icon = css_var("accent_icon")
+accent_border = css_var("accent_border")
+border_color = css_var("border_color")
+border_width = css_var("border_width")
+success_color = css_var("success_color")
+success_tint = css_var("success_tint")
+success_outline = css_var("success_outline")
+warning_color = css_var("warning_color")
+warning_tint = css_var("warning_tint")
+warning_outline = css_var("warning_outline")
+error_color = css_var("error_color")
+border = f"{border_width} solid {border_color}"
+
+
+def _rule(selector: str, palette: dict[str, str]) -> str:
+    declarations = " ".join(
+        f"--rb-{token.replace('_', '-')}: {value};" for token, value in palette.items()
+    )
+    return f"{selector} {{ {declarations} }}"
+
+
+def theme_script() -> str:
+    """Applies the saved theme and defines `window.robobeltSetTheme`.
+
+    Also follows theme changes made in other tabs.
+    """
+    key = json.dumps(STORAGE_KEY)
+    return f"""
+(function () {{
+  const themes = {json.dumps(THEMES)};
+  const apply = (mode) => {{
+    document.documentElement.dataset.theme = themes.includes(mode)
+      ? mode
+      : {json.dumps(DEFAULT_THEME)};
+  }};
+  window.robobeltSetTheme = (mode) => {{
+    apply(mode);
+    try {{
+      localStorage.setItem({key}, mode);
+    }} catch (e) {{}}
+  }};
+  try {{
+    apply(localStorage.getItem({key}));
+  }} catch (e) {{
+    apply(null);
+  }}
+  window.addEventListener("storage", (event) => {{
+    if (event.key === {key}) apply(event.newValue);
+  }});
+}})();
+"""
+
+
+def set_theme(mode: str) -> rx.event.EventSpec:
+    """Client-only event switching to `mode`."""
+    return rx.call_script(f"window.robobeltSetTheme({json.dumps(mode)})")
+
+
+def head_components() -> list[rx.Component]:
+    return [rx.el.script(theme_script()), rx.el.style(theme_css())]
+
+
+def theme_css() -> str:
+    """Stylesheet defining every palette and the theme switcher states."""
+    rules = [_rule(":root", PALETTES[DEFAULT_THEME])]
+    rules += [_rule(f"[data-theme={name}]", PALETTES[name]) for name in THEMES]
+    rules.append(
+        ".theme-button { color: var(--rb-text-secondary); "
+        "background-color: transparent; }"
+    )
+    rules += [
+        f"[data-theme={name}] .theme-button[data-mode={name}] {{ "
+        "background-color: var(--rb-accent-color); color: var(--rb-accent-icon); "
+        "border: var(--rb-accent-border); }"
+        for name in THEMES
+    ]
+    return "\n".join(rules)
@@ -0,0 +1,110 @@
+"""Timing and step response of the motor control loop.
+
+Run from the repository root:
+
+    python -m benchmarks.control_loop
+    python -m benchmarks.control_loop --rate 200 --kp 2 --ki 0.5 --busy-threads 2
+
+The loop runs on its own thread at `--rate` Hz while the setpoint steps
+through `PROFILE`. `--busy-threads` adds pure-Python threads competing
+for the GIL, as a loaded event loop does. The report shows tick interval
+jitter and overruns, then rise time, overshoot and settling time for
+each step.
+"""
+
+import argparse
+import threading
+import time
+import numpy as np
+from app.services.motor_control import JITTER, ControlLoop, PidGains
+
+# (seconds from start, setpoint) steps.
+PROFILE = [(0.0, 0), (0.5, 1500), (4.5, 600), (8.5, 2400)]
+
+
+class TracedLoop(ControlLoop):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trace: list[tuple[float, float, float]] = []
+
+    def step(self, dt: float):
+        super().step(dt)
+        self.trace.append((time.perf_counter(), self.setpoint, self.speed))
+
+
+def spin(stop: threading.Event):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def step_response(times, speeds, start, end, before, target):
+    window = (times >= start) & (times < end)
+    t, v = times[window] - start, speeds[window]
+    span = target - before
+    progress = (v - before) / span
+    rise = np.flatnonzero(progress >= 0.9)
+    rise_start = np.flatnonzero(progress >= 0.1)
+    overshoot = max(0.0, (progress.max() - 1) * 100)
+    outside = np.flatnonzero(np.abs(v - target) > 0.02 * abs(span))
+    settle = t[outside[-1] + 1] if len(outside) and outside[-1] + 1 < len(t) else 0
+    rise_time = t[rise[0]] - t[rise_start[0]] if len(rise) else float("nan")
+    final_error = np.mean(v[-20:]) - target
+    return rise_time, overshoot, settle, final_error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=100)
+    parser.add_argument("--kp", type=float, default=PidGains.kp)
+    parser.add_argument("--ki", type=float, default=PidGains.ki)
+    parser.add_argument("--kd", type=float, default=PidGains.kd)
+    parser.add_argument("--busy-threads", type=int, default=0)
+    parser.add_argument("--seconds", type=float, default=12.5)
+    args = parser.parse_args()
+
+    stop = threading.Event()
+    for _ in range(args.busy_threads):
+        threading.Thread(target=spin, args=(stop,), daemon=True).start()
+    loop = TracedLoop(rate=args.rate, gains=PidGains(args.kp, args.ki, args.kd))
+    JITTER.reset()
+    began = time.perf_counter()
+    loop.start()
+    for offset, setpoint in PROFILE:
+        time.sleep(max(0.0, began + offset - time.perf_counter()))
+        loop.set_setpoint(setpoint)
+    time.sleep(max(0.0, began + args.seconds - time.perf_counter()))
+    loop.close()
+    stop.set()
+
+    times, setpoints, speeds = (np.array(column) for column in zip(*loop.trace))
+    times -= began
+    intervals = np.diff(times) * 1000
+    period = 1000 / args.rate
+    p50, p99 = np.percentile(intervals, [50, 99])
+    print(
+        f"{loop.ticks} ticks at {args.rate:g} Hz ({period:.1f} ms), "
+        f"{args.busy_threads} busy threads"
+    )
+    print(
+        f"  tick interval  p50 {p50:.3f} ms  p99 {p99:.3f} ms  "
+        f"max {intervals.max():.3f} ms"
+    )
+    print(
+        f"  lateness       p99 <= {JITTER.percentile(0.99):g} ms  "
+        f"max {JITTER.max:.3f} ms  overruns {loop.overruns}"
+    )
+    print(f"Gains kp={args.kp:g} ki={args.ki:g} kd={args.kd:g}")
+    steps = PROFILE + [(args.seconds, None)]
+    for (start, target), (end, _), (_, before) in zip(steps[1:], steps[2:], steps):
+        rise, overshoot, settle, error = step_response(
+            times, speeds, start, end, before, target
+        )
+        print(
+            f"  {before:>5} -> {target:<5} rise {rise:5.2f} s  "
+            f"overshoot {overshoot:4.1f} %  settle {settle:5.2f} s  "
+            f"final error {error:+6.1f} RPM"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""E-stop latency under heavy telemetry and log load.
+
+Run from the repository root:
+
+    python -m benchmarks.estop_latency
+    python -m benchmarks.estop_latency --sessions 200 --logs 5000 --busy-ms 500
+
+Each simulated session has a lock standing in for its Reflex state lock.
+The lock is taken by a telemetry consumer, a fleet consumer and a log
+follower, each doing `--handler-ms` of blocking work per wake-up, and once
+a second by a slow handler that holds it for `--busy-ms`. A flood task
+publishes `--logs` entries per second.
+
+Each trial clicks the stop the way the browser does, with a POST to
+`/api/estop` through the ASGI app, and reports the time from the click
+until the stop was applied to every producer, until the endpoint
+responded, until the telemetry producer emitted a stopped sample, and
+until each session mirrored it. For comparison it then clicks again as an
+event queued behind the first session's handler, which is what a click
+sent through Reflex's event queue waits for.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import httpx
+import numpy as np
+import app.api
+from app.api import CONTROL_HEADER, api
+from app.services.estop import EmergencyStop
+from app.services.fleet import FleetHub
+from app.services.log_bus import LogBus
+from app.services.telemetry_hub import TelemetryHub
+
+
+def busy(ms: float):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+async def session(
+    key: str,
+    lock: asyncio.Lock,
+    hub: TelemetryHub,
+    fleet: FleetHub,
+    log: LogBus,
+    estop: EmergencyStop,
+    handler_ms: float,
+    busy_ms: float,
+    followed: list[float],
+):
+    async def telemetry():
+        subscription = hub.subscribe(key)
+        while True:
+            await subscription.get()
+            async with lock:
+                busy(handler_ms)
+
+    async def fleet_view():
+        subscription = fleet.subscribe(key)
+        while await subscription.changed() is not None:
+            async with lock:
+                busy(handler_ms)
+
+    async def logs():
+        subscription = log.subscribe(key)
+        cursor = log.store.next_id - 1
+        while True:
+            await subscription.wait()
+            async with lock:
+                for _ in log.store.iter_oldest(cursor):
+                    pass
+                cursor = log.store.next_id - 1
+                busy(handler_ms)
+
+    async def slow_handler():
+        await asyncio.sleep(random.random())
+        while True:
+            async with lock:
+                await asyncio.sleep(busy_ms / 1000)
+            await asyncio.sleep(1)
+
+    async def watch():
+        subscription = estop.subscribe(key)
+        while await subscription.wait():
+            async with lock:
+                if estop.active:
+                    followed.append((time.monotonic() - estop.changed_at) * 1000)
+
+    await asyncio.gather(telemetry(), fleet_view(), logs(), slow_handler(), watch())
+
+
+async def flood(log: LogBus, rate: float):
+    """Publish `rate` entries a second in batches every 10 ms."""
+    words = ["sensor", "relay", "encoder", "valve", "bus", "drive"]
+    deadline = time.monotonic()
+    while True:
+        for _ in range(max(1, round(rate / 100))):
+            log.publish("info", random.choice(words).title(), random.choice(words))
+        deadline += 0.01
+        await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+
+
+async def run(args):
+    log = LogBus(coalesce_window=0, rate=args.logs, burst=int(args.logs))
+    hub = TelemetryHub(interval=1 / args.rate, queue_size=4, log=log)
+    fleet = FleetHub([f"BELT-{i + 1:05d}" for i in range(args.belts)], interval=1)
+    estop = EmergencyStop([hub, fleet], log=log)
+    # The endpoint triggers the process-wide latch; point it at this one.
+    app.api.emergency_stop = estop
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api), base_url="http://benchmark"
+    )
+    locks = [asyncio.Lock() for _ in range(args.sessions)]
+    followed: list[float] = []
+    tasks = [
+        asyncio.create_task(
+            session(
+                f"session-{i}",
+                locks[i],
+                hub,
+                fleet,
+                log,
+                estop,
+                args.handler_ms,
+                args.busy_ms,
+                followed,
+            )
+        )
+        for i in range(args.sessions)
+    ]
+    tasks.append(asyncio.create_task(flood(log, args.logs)))
+    probe = hub.subscribe("probe")
+    await asyncio.sleep(2)
+
+    async def click() -> float:
+        began = time.monotonic()
+        response = await client.post(
+            "/api/estop?source=benchmark", headers={CONTROL_HEADER: "1"}
+        )
+        response.raise_for_status()
+        return began
+
+    # The first request through the app pays one-off setup costs.
+    await click()
+    estop.reset("benchmark")
+    results = {
+        name: []
+        for name in (
+            "click to halted",
+            "click to response",
+            "stopped sample",
+            "session followed",
+            "slowest session",
+            "queued click",
+        )
+    }
+    for _ in range(args.trials):
+        await asyncio.sleep(0.5 + random.random())
+        followed.clear()
+        seq = hub.seq
+        began = await click()
+        results["click to response"].append((time.monotonic() - began) * 1000)
+        results["click to halted"].append((estop.changed_at - began) * 1000)
+        while (sample := await probe.get()).seq <= seq:
+            pass
+        results["stopped sample"].append((sample.produced - began) * 1000)
+        while len(followed) < args.sessions:
+            await asyncio.sleep(0.001)
+        results["slowest session"].append(max(followed))
+        results["session followed"].extend(followed)
+        estop.reset("benchmark")
+
+        await asyncio.sleep(0.5 + random.random())
+        began = time.monotonic()
+        async with locks[0]:
+            pass
+        await click()
+        results["queued click"].append((estop.changed_at - began) * 1000)
+        estop.reset("benchmark")
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await client.aclose()
+    probe.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=10, help="telemetry Hz")
+    parser.add_argument("--belts", type=int, default=1000)
+    parser.add_argument("--logs", type=float, default=2000, help="entries/s")
+    parser.add_argument("--handler-ms", type=float, default=0.2)
+    parser.add_argument("--busy-ms", type=float, default=200)
+    parser.add_argument("--trials", type=int, default=20)
+    args = parser.parse_args()
+    results = asyncio.run(run(args))
+    print(
+        f"{args.sessions} sessions, telemetry at {args.rate:g} Hz, "
+        f"{args.belts} belts, {args.logs:g} log entries/s, {args.trials} trials"
+    )
+    for name, samples in results.items():
+        p50, p99 = np.percentile(samples, [50, 99])
+        print(
+            f"  {name:17} p50 {p50:8.3f} ms  p99 {p99:8.3f} ms  "
+            f"max {max(samples):8.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
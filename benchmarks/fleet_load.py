@@ -0,0 +1,78 @@
+"""Load generator for the fleet dashboard path.
+
+Run from the repository root:
+
+    python -m benchmarks.fleet_load
+    python -m benchmarks.fleet_load --belts 10000 --rate 10 --seconds 30
+
+Each tick advances the batch simulator, evaluates health and picks the
+changed belts, then encodes their patch rows as the session would send
+them. Ticks are paced at `--rate` on one core; the report shows whether
+every tick fit in its budget.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from app.services.batch_simulator import BatchSimulator
+from app.services.fleet import FleetTelemetry
+
+
+def run(belts: int, rate: float, seconds: float, fault_rate: float, seed: int):
+    interval = 1 / rate
+    simulator = BatchSimulator(
+        belts, interval=interval, seed=seed, fault_rate=fault_rate, retarget_rate=0.01
+    )
+    simulator.randomize()
+    fleet = FleetTelemetry([f"BELT-{i + 1:05d}" for i in range(belts)])
+    ticks = int(seconds * rate)
+    simulate, update, encode, changed, payload = [], [], [], [], []
+    late = 0
+    deadline = time.monotonic()
+    for _ in range(ticks):
+        began = time.perf_counter()
+        values = simulator.step()
+        simulated = time.perf_counter()
+        indices = fleet.update(values, simulator.elapsed)
+        updated = time.perf_counter()
+        body = json.dumps(fleet.rows(indices))
+        encoded = time.perf_counter()
+        simulate.append(simulated - began)
+        update.append(updated - simulated)
+        encode.append(encoded - updated)
+        changed.append(len(indices))
+        payload.append(len(body))
+        deadline += interval
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        else:
+            late += 1
+    total = np.add(np.add(simulate, update), encode)
+    print(f"{belts} belts at {rate:g} Hz for {ticks} ticks")
+    for name, samples in (
+        ("simulate", simulate),
+        ("health + diff", update),
+        ("encode rows", encode),
+        ("tick total", total),
+    ):
+        p50, p99 = np.percentile(samples, [50, 99]) * 1000
+        print(f"  {name:14} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+    print(f"  changed belts  mean {np.mean(changed):8.0f} per tick")
+    print(f"  patch payload  mean {np.mean(payload) / 1024:8.1f} KiB per tick")
+    print(f"  budget used    p99 {np.percentile(total, 99) / interval:8.0%}")
+    print(f"  late ticks     {late}")
+    print(f"  active faults  {simulator.active_faults()}")
+    print(f"  health counts  {fleet.health_counts()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--belts", type=int, default=10_000)
+    parser.add_argument("--rate", type=float, default=10.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--fault-rate", type=float, default=0.001)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.belts, args.rate, args.seconds, args.fault_rate, args.seed)
@@ -0,0 +1,105 @@
+"""Memory cost of the log store per 10k entries.
+
+Run from the repository root:
+
+    python -m benchmarks.log_store_memory
+    python -m benchmarks.log_store_memory --module some.other.log_store
+    python -m benchmarks.log_store_memory --module baseline
+
+Messages are built before measuring, so the figures cover only what the
+store itself allocates and retains. `--module baseline` measures how logs
+were kept before the log store existed: `LogState.entries`, a newest-first
+list of `rx.Base` LogEntry models with formatted timestamps, here capped
+at the same number of entries.
+"""
+
+import argparse
+import importlib
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ENTRIES = 10_000
+SEVERITIES = ["info"] * 80 + ["warning"] * 15 + ["error"] * 4 + ["success"]
+CATEGORIES = ["System", "Motor", "Camera", "Config", "Network"]
+
+
+def baseline_store() -> type:
+    import reflex as rx
+
+    class LogEntry(rx.Base):
+        id: int
+        timestamp: str
+        severity: str
+        category: str
+        message: str
+
+    class LogStore:
+        def __init__(self, capacity: int):
+            self.capacity = capacity
+            self.entries: list[LogEntry] = []
+            self._next_id = 0
+
+        def append(self, created: float, severity: str, category: str, message: str):
+            entry = LogEntry(
+                id=self._next_id,
+                timestamp=datetime.fromtimestamp(created).strftime("%H:%M:%S"),
+                severity=severity,
+                category=category,
+                message=message,
+            )
+            self.entries.insert(0, entry)
+            self._next_id += 1
+            if len(self.entries) > self.capacity:
+                self.entries.pop()
+
+    return LogStore
+
+
+def measure(module_name: str):
+    if module_name == "baseline":
+        store_class = baseline_store()
+    else:
+        store_class = importlib.import_module(module_name).LogStore
+    rng = random.Random(0)
+    start = time.time()
+    entries = [
+        (
+            start + i * 0.5,
+            rng.choice(SEVERITIES),
+            rng.choice(CATEGORIES),
+            f"Target speed set to {rng.randint(0, 3000)} RPM.",
+        )
+        for i in range(2 * ENTRIES)
+    ]
+    tracemalloc.start()
+    store = store_class(ENTRIES)
+    empty, _ = tracemalloc.get_traced_memory()
+    blocks = sys.getallocatedblocks()
+    began = time.perf_counter()
+    for entry in entries[:ENTRIES]:
+        store.append(*entry)
+    fill_seconds = time.perf_counter() - began
+    filled, _ = tracemalloc.get_traced_memory()
+    filled_blocks = sys.getallocatedblocks() - blocks
+    began = time.perf_counter()
+    for entry in entries[ENTRIES:]:
+        store.append(*entry)
+    churn_seconds = time.perf_counter() - began
+    churned, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{module_name}, {ENTRIES} entries")
+    print(f"  preallocated:      {empty / 1024:8.1f} KiB")
+    print(f"  retained when full:{filled / 1024:8.1f} KiB")
+    print(f"  live objects added:{filled_blocks:8d}")
+    print(f"  retained after wrap:{churned / 1024:7.1f} KiB")
+    print(f"  append (filling):  {fill_seconds / ENTRIES * 1e6:8.2f} µs")
+    print(f"  append (evicting): {churn_seconds / ENTRIES * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.services.log_store")
+    measure(parser.parse_args().module)
@@ -0,0 +1,96 @@
+"""Record a seeded telemetry run and replay it through the hub.
+
+Run from the repository root:
+
+    python -m benchmarks.telemetry_replay record run.rbrec --seed 7
+    python -m benchmarks.telemetry_replay replay run.rbrec --speed 0
+
+`record` simulates a belt offline with a fixed speed profile, so the same
+seed always gives the same file. `replay` feeds a recording through a
+`TelemetryHub` and prints the health timeline and throughput; diffing the
+timeline between two versions shows changed alert behaviour.
+"""
+
+import argparse
+import asyncio
+import time
+from app.services.log_bus import LogBus
+from app.services.telemetry_hub import TelemetryHub
+from app.services.telemetry_recording import (
+    RecordingReplaySource,
+    TelemetryRecorder,
+    TelemetryRecording,
+)
+from app.services.telemetry_source import SimulatedTelemetrySource
+
+# (seconds from start, target speed) steps of the recorded run.
+PROFILE = [(0, 0), (10, 1500), (600, 2800), (1500, 600), (2400, 0)]
+
+
+def record(path: str, seed: int, seconds: float, interval: float):
+    async def run():
+        source = SimulatedTelemetrySource(interval=interval, seed=seed)
+        recorder = TelemetryRecorder(path, interval=interval, seed=seed)
+        steps = iter(PROFILE)
+        step = next(steps, None)
+        target = 0
+        for tick in range(int(seconds / interval)):
+            offset = tick * interval
+            while step is not None and step[0] <= offset:
+                target = step[1]
+                recorder.event("target_speed", target, offset)
+                step = next(steps, None)
+            recorder.sample(await source.read(target), offset)
+        recorder.close()
+        return tick + 1
+
+    samples = asyncio.run(run())
+    print(f"Recorded {samples} samples to {path}")
+
+
+def replay(path: str, speed: float):
+    recording = TelemetryRecording(path)
+    offsets = [frame.offset for frame in recording if frame.sample is not None]
+
+    async def run():
+        hub = TelemetryHub(
+            source_factory=lambda: RecordingReplaySource(path, speed),
+            interval=recording.header.interval,
+            queue_size=len(offsets) + 1,
+            log=LogBus(),
+        )
+        subscription = hub.subscribe("replay")
+        began = time.perf_counter()
+        health = None
+        for offset in offsets:
+            sample = await subscription.get()
+            if sample.system_health != health:
+                health = sample.system_health
+                print(f"  {offset:9.1f} s  {health}")
+        elapsed = time.perf_counter() - began
+        subscription.close()
+        return elapsed, subscription.dropped
+
+    seed = recording.header.seed
+    print(f"{path}: {len(offsets)} samples, seed {seed}")
+    elapsed, dropped = asyncio.run(run())
+    print(f"Replayed in {elapsed:.2f} s ({len(offsets) / elapsed:.0f} samples/s)")
+    print(f"Dropped samples: {dropped}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record")
+    record_parser.add_argument("path")
+    record_parser.add_argument("--seed", type=int, default=0)
+    record_parser.add_argument("--seconds", type=float, default=3600)
+    record_parser.add_argument("--interval", type=float, default=2.0)
+    replay_parser = commands.add_parser("replay")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--speed", type=float, default=0)
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.path, args.seed, args.seconds, args.interval)
+    else:
+        replay(args.path, args.speed)
@@ -0,0 +1,55 @@
+import pytest
+from starlette.datastructures import QueryParams
+from starlette.testclient import TestClient
+from app.api import _log_filters, api
+
+client = TestClient(api)
+
+
+def test_log_filters_parse_range_and_severities():
+    filters = _log_filters(
+        QueryParams("end=2000&last=600&severity=Error,warning&category=Motor&q=rpm")
+    )
+    assert filters == {
+        "start": 1400.0,
+        "end": 2000.0,
+        "severities": frozenset({"error", "warning"}),
+        "category": "Motor",
+        "text": "rpm",
+    }
+    assert _log_filters(QueryParams("end=50&start=10"))["start"] == 10.0
+
+
+@pytest.mark.parametrize(
+    "query", ["severity=info,fatal", "start=yesterday", "end=now", "last=x"]
+)
+def test_log_filters_reject_bad_input(query):
+    with pytest.raises(ValueError):
+        _log_filters(QueryParams(query))
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"q": "speed", "limit": "0"},
+        {"q": "speed", "limit": "-1"},
+        {"q": "speed", "limit": "many"},
+        {"q": "  "},
+        {"q": "speed", "severity": "fatal"},
+    ],
+)
+def test_search_rejects_bad_parameters(params):
+    assert client.get("/api/logs/search", params=params).status_code == 400
+
+
+def test_export_rejects_unknown_formats():
+    response = client.get("/api/logs/export", params={"format": "xml"})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"start": "10", "end": "10"}, {"bucket": "0"}, {"start": "soon"}],
+)
+def test_telemetry_history_rejects_bad_ranges(params):
+    assert client.get("/api/telemetry/history", params=params).status_code == 400
@@ -0,0 +1,66 @@
+import numpy as np
+from app.services.health_rules import (
+    CRITICAL,
+    OPTIMAL,
+    WARNING,
+    HealthEngine,
+    HealthRule,
+)
+
+RULES = (
+    HealthRule("motor_temp", WARNING, above=70, hysteresis=2, dwell=4),
+    HealthRule("motor_temp", CRITICAL, above=85, hysteresis=2, dwell=2),
+    HealthRule("belt_tension", WARNING, above=550, below=350, hysteresis=5),
+)
+
+
+def readings(*temps: float, tension: float = 450) -> np.ndarray:
+    """One row per belt: speed, temperature, tension and current."""
+    return np.array([[1000, temp, tension, 2.0] for temp in temps], float)
+
+
+def run(engine: HealthEngine, steps) -> list[int]:
+    """Evaluate `(time, temperature)` steps for one belt."""
+    return [int(engine.evaluate(readings(temp), now)[0]) for now, temp in steps]
+
+
+def test_rules_trip_only_after_their_dwell():
+    engine = HealthEngine(RULES)
+    levels = run(engine, [(0, 75), (2, 75), (3.9, 75), (4, 75)])
+    assert levels == [OPTIMAL, OPTIMAL, OPTIMAL, WARNING]
+
+
+def test_a_brief_excursion_restarts_the_dwell():
+    engine = HealthEngine(RULES)
+    levels = run(engine, [(0, 75), (3, 60), (4, 75), (7, 75), (8, 75)])
+    assert levels == [OPTIMAL, OPTIMAL, OPTIMAL, OPTIMAL, WARNING]
+
+
+def test_clearing_needs_the_hysteresis_margin_and_dwell():
+    engine = HealthEngine(RULES)
+    run(engine, [(0, 75), (4, 75)])
+    # 69 is below the limit but inside the 2 °C hysteresis band.
+    assert run(engine, [(5, 69), (20, 69)]) == [WARNING, WARNING]
+    assert run(engine, [(21, 68), (24, 68), (25, 68)]) == [WARNING, WARNING, OPTIMAL]
+
+
+def test_the_highest_active_level_wins():
+    engine = HealthEngine(RULES)
+    assert run(engine, [(0, 90), (2, 90), (4, 90)]) == [OPTIMAL, CRITICAL, CRITICAL]
+    assert run(engine, [(5, 80), (7, 80)]) == [CRITICAL, WARNING]
+
+
+def test_lower_limits_and_zero_dwell():
+    engine = HealthEngine(RULES)
+    assert engine.evaluate(readings(40, tension=340), 0)[0] == WARNING
+    assert engine.evaluate(readings(40, tension=352), 1)[0] == WARNING
+    assert engine.evaluate(readings(40, tension=356), 2)[0] == OPTIMAL
+
+
+def test_belts_are_evaluated_independently():
+    engine = HealthEngine(RULES, belts=3)
+    engine.evaluate(readings(40, 90, 75), 0)
+    health = engine.evaluate(readings(40, 90, 75), 4)
+    assert health.tolist() == [OPTIMAL, CRITICAL, WARNING]
+    engine.resize(2)
+    assert engine.evaluate(readings(90, 90), 5).tolist() == [OPTIMAL, OPTIMAL]
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+import pytest
+from app.services import log_bus as log_bus_module
+from app.services.log_bus import LogBus, TokenBucket, message_template
+from app.services.log_store import LogStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(log_bus_module, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def make_bus(**kwargs) -> LogBus:
+    bus = LogBus(store=LogStore(100), **kwargs)
+    bus._started = True
+    return bus
+
+
+def messages(bus: LogBus) -> list[tuple[str, int]]:
+    return [(r.message, r.repeats) for r in bus.store.iter_oldest()]
+
+
+def test_token_bucket_refills_at_its_rate():
+    bucket = TokenBucket(rate=2, burst=3, now=0)
+    assert [bucket.take(0) for _ in range(4)] == [True, True, True, False]
+    assert bucket.take(0.5)
+    assert not bucket.take(0.5)
+    assert [bucket.take(10) for _ in range(4)] == [True, True, True, False]
+
+
+def test_message_template_masks_numbers():
+    assert message_template("Motor 86°C, Tension -1.5N") == "Motor #°C, Tension #N"
+
+
+def test_events_differing_only_in_numbers_are_coalesced(clock):
+    bus = make_bus(coalesce_window=60)
+    bus.publish("warning", "System", "Motor at 81°C.")
+    clock.now += 1
+    record = bus.publish("warning", "System", "Motor at 83°C.")
+    assert (record.repeats, record.last) == (2, 1001.0)
+    assert messages(bus) == [("Motor at 83°C.", 2)]
+    clock.now += 60
+    bus.publish("warning", "System", "Motor at 84°C.")
+    assert messages(bus)[-1] == ("Motor at 84°C.", 1)
+    assert bus.coalesced == 1
+
+
+def test_audit_entries_keep_every_distinct_action(clock):
+    bus = make_bus(coalesce_window=60, rate=1, burst=1)
+    for speed in (300, 0, 300):
+        bus.publish("info", "Motor", f"Target speed set to {speed} RPM.", audit=True)
+    assert messages(bus) == [
+        ("Target speed set to 300 RPM.", 1),
+        ("Target speed set to 0 RPM.", 1),
+        ("Target speed set to 300 RPM.", 1),
+    ]
+    assert bus.suppressed == {}
+
+
+def test_suppressed_entries_are_summarized_on_the_next_token(clock):
+    bus = make_bus(coalesce_window=0, rate=1, burst=2)
+    results = [bus.publish("info", "Camera", f"frame {i}") for i in range(5)]
+    assert [r is not None for r in results] == [True, True, False, False, False]
+    assert bus.suppressed == {"Camera": 3}
+    clock.now += 1
+    bus.publish("info", "Camera", "stream resumed")
+    assert messages(bus)[-2:] == [
+        ("3 Camera entries suppressed by rate limiting.", 1),
+        ("stream resumed", 1),
+    ]
+    assert bus.suppressed == {}
+
+
+def test_sweep_summarizes_a_burst_that_stopped(clock):
+    bus = make_bus(coalesce_window=0, rate=1, burst=1)
+    for i in range(4):
+        bus.publish("info", "Camera", f"frame {i}")
+    bus._sweep()
+    assert bus.suppressed == {"Camera": 3}
+    clock.now += 1
+    bus._sweep()
+    assert bus.suppressed == {}
+    assert messages(bus)[-1] == ("3 Camera entries suppressed by rate limiting.", 1)
+
+
+def test_errors_are_never_rate_limited(clock):
+    bus = make_bus(coalesce_window=0, rate=1, burst=1)
+    for i in range(3):
+        assert bus.publish("error", "System", f"fault {'x' * i}") is not None
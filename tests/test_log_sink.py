@@ -0,0 +1,47 @@
+import json
+import os
+import time
+from app.services.log_sink import LogSink
+from app.services.log_store import LogRecord
+
+
+def archived(sink: LogSink) -> list[dict]:
+    with open(sink.active_path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def run(directory, records: list[LogRecord], **kwargs) -> LogSink:
+    """Write `records` as one process run would, then shut down."""
+    sink = LogSink(directory, **kwargs)
+    sink._open()
+    sink._write_batch(records)
+    sink._close()
+    return sink
+
+
+def test_ids_continue_across_restarts(tmp_path):
+    now = time.time()
+    records = [LogRecord(i, now + i, "info", "System", f"m{i}") for i in range(3)]
+    run(tmp_path, records)
+    sink = run(tmp_path, records[:2])
+    assert [entry["id"] for entry in archived(sink)] == [0, 1, 2, 3, 4]
+
+
+def test_ids_continue_after_the_active_file_was_rotated(tmp_path):
+    now = time.time()
+    records = [LogRecord(i, now, "info", "System", f"m{i}") for i in range(3)]
+    sink = run(tmp_path, records, max_bytes=1)
+    assert not os.path.getsize(sink.active_path)
+    sink = run(tmp_path, records[:1])
+    assert [entry["id"] for entry in archived(sink)] == [3]
+
+
+def test_rotation_age_starts_at_the_first_archived_entry(tmp_path):
+    created = time.time() - 7200
+    run(tmp_path, [LogRecord(0, created, "info", "System", "old")])
+    sink = LogSink(tmp_path, max_age=3600)
+    sink._open()
+    assert sink._opened_at == created
+    sink._maintain()
+    assert len(sink.archives()) == 1
+    sink._close()
@@ -0,0 +1,96 @@
+import random
+from app.services.log_store import LogQuery, LogStore
+
+SEVERITIES = ["info", "warning", "error", "success"]
+CATEGORIES = ["System", "Motor", "Camera"]
+
+
+def fill(store: LogStore, count: int, seed: int = 0) -> list[tuple]:
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        entry = (
+            1000.0 + i,
+            rng.choice(SEVERITIES),
+            rng.choice(CATEGORIES),
+            f"Target speed set to {rng.randint(0, 30) * 100} RPM.",
+        )
+        store.append(*entry)
+        entries.append(entry)
+    return entries
+
+
+def expected(store: LogStore, query: LogQuery) -> list[int]:
+    """Brute-force ids of the retained records matching `query`, newest first."""
+    return [record.id for record in store.iter_newest() if query.matches(record)]
+
+
+def test_ring_evicts_the_oldest_entries():
+    store = LogStore(capacity=8)
+    entries = fill(store, 20)
+    assert (store.first_id, store.next_id, len(store)) == (12, 20, 8)
+    assert store.get(11) is None
+    record = store.get(12)
+    assert (record.created, record.severity, record.category, record.message) == (
+        entries[12]
+    )
+    assert [r.id for r in store.iter_oldest()] == list(range(12, 20))
+    assert [r.id for r in store.iter_oldest(after_id=17)] == [18, 19]
+
+
+def test_indexed_queries_match_a_full_scan_after_eviction():
+    store = LogStore(capacity=64)
+    fill(store, 1000)
+    queries = [
+        LogQuery(),
+        LogQuery(severities=frozenset({"error"})),
+        LogQuery(severities=frozenset({"error", "warning"}), category="Motor"),
+        LogQuery(category="Camera"),
+        LogQuery(category="Unknown"),
+        LogQuery(severities=frozenset({"info"}), text="1500 rpm"),
+        LogQuery(since=1950.5, until=1980.0),
+        LogQuery(min_id=980),
+    ]
+    for query in queries:
+        ids = expected(store, query)
+        assert [r.id for r in store.select(query, 1000)] == ids, query
+        assert store.count(query, 1000) == len(ids), query
+        assert store.count(query, 3) == min(3, len(ids)), query
+        oldest_first = store.select(query, 1000, newest_first=False)
+        assert [r.id for r in oldest_first] == ids[::-1], query
+
+
+def test_categories_drop_out_once_evicted():
+    store = LogStore(capacity=4)
+    store.append(1.0, "info", "Camera", "Camera stream connected.")
+    for i in range(4):
+        store.append(2.0 + i, "info", "Motor", "Motor stopped manually.")
+    assert store.categories == ["Motor"]
+    assert store.count(LogQuery(category="Camera"), 10) == 0
+
+
+def test_pages_and_time_lookup():
+    store = LogStore(capacity=16)
+    fill(store, 40)
+    query = LogQuery(category="Motor")
+    ids = expected(store, query)
+    first_page = store.select(query, 3)
+    second_page = store.select(query, 3, before_id=first_page[-1].id)
+    assert [r.id for r in first_page + second_page] == ids[:6]
+    assert store.id_after(1030.0) == 31
+    assert store.id_after(0.0) == store.first_id
+
+
+def test_bump_counts_repeats_of_retained_entries():
+    store = LogStore(capacity=2)
+    entry_id = store.append(1.0, "warning", "Motor", "Drive slipping.")
+    assert store.bump(entry_id, 5.0, "Drive slipping again.")
+    record = store.get(entry_id)
+    assert (record.repeats, record.last, record.message) == (
+        2,
+        5.0,
+        "Drive slipping again.",
+    )
+    store.append(2.0, "info", "Motor", "a")
+    store.append(3.0, "info", "Motor", "b")
+    assert not store.bump(entry_id, 6.0, "gone")
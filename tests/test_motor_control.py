@@ -0,0 +1,65 @@
+import math
+import pytest
+from app.services.motor_control import (
+    ControlLoop,
+    MotorModel,
+    PidController,
+    PidGains,
+)
+
+LIMIT = 3000.0
+BAD_GAINS = [
+    PidGains(kp=math.nan),
+    PidGains(ki=math.inf),
+    PidGains(kd=-math.inf),
+    PidGains(kp=-1.0),
+]
+
+
+def track(pid: PidController, setpoint: float, measured: float, ticks: int):
+    return [pid.update(setpoint, measured, 0.01) for _ in range(ticks)]
+
+
+@pytest.mark.parametrize("gains", BAD_GAINS[:3])
+def test_non_finite_gains_fall_back_to_feedforward(gains):
+    pid = PidController(gains, LIMIT)
+    outputs = track(pid, 500, 400, 5)
+    assert outputs == [500.0] * 5
+    assert pid.integral == 0.0
+
+
+def test_controller_recovers_when_gains_become_finite():
+    pid = PidController(PidGains(), LIMIT)
+    track(pid, 500, 400, 10)
+    pid.set_gains(PidGains(ki=math.nan))
+    track(pid, 500, 400, 3)
+    assert pid.integral == 0.0
+    pid.set_gains(PidGains())
+    outputs = track(pid, 500, 400, 3)
+    assert all(math.isfinite(output) and output > 500 for output in outputs)
+    assert pid.integral == pytest.approx(3 * 100 * 0.01)
+
+
+def test_non_finite_output_is_clamped_feedforward():
+    pid = PidController(PidGains(kp=math.inf), LIMIT)
+    assert pid.update(5000, 0, 0.01) == LIMIT
+    assert pid.update(-10, 0, 0.01) == 0.0
+
+
+@pytest.mark.parametrize("gains", BAD_GAINS)
+def test_control_loop_rejects_invalid_gains(gains):
+    loop = ControlLoop()
+    with pytest.raises(ValueError):
+        loop.set_gains(gains)
+    with pytest.raises(ValueError):
+        loop.load_gains(gains)
+    assert not loop.gains_set
+    loop.step(0.01)
+    assert loop.pid.gains == PidGains()
+
+
+def test_motor_resets_non_finite_speed():
+    motor = MotorModel(seed=1)
+    motor.step(500, 0.1)
+    assert motor.step(math.nan, 0.1) == 0.0
+    assert math.isfinite(motor.step(500, 0.1))
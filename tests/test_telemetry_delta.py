@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+from app.services.telemetry_delta import telemetry_delta
+from app.services.telemetry_source import TelemetrySample
+
+
+def make_view(**fields) -> SimpleNamespace:
+    values = dict(
+        belt_speed=1000,
+        motor_temp=40,
+        belt_tension=450.0,
+        current_draw=2.0,
+        system_health="Optimal",
+        uptime_seconds=120,
+    )
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def make_sample(**fields) -> TelemetrySample:
+    return TelemetrySample(**vars(make_view(**fields)))
+
+
+def test_changes_below_the_deadband_are_not_sent():
+    delta = telemetry_delta(
+        make_view(),
+        make_sample(
+            belt_speed=1001,
+            motor_temp=40,
+            belt_tension=450.4,
+            current_draw=2.04,
+            uptime_seconds=170,
+        ),
+    )
+    assert delta == {}
+
+
+def test_visible_changes_are_rounded_to_display_precision():
+    delta = telemetry_delta(
+        make_view(),
+        make_sample(belt_speed=1002, belt_tension=451.234, current_draw=2.0567),
+    )
+    assert delta == {"belt_speed": 1002, "belt_tension": 451.2, "current_draw": 2.06}
+
+
+def test_reaching_or_leaving_zero_is_always_sent():
+    assert telemetry_delta(make_view(belt_speed=1), make_sample(belt_speed=0)) == {
+        "belt_speed": 0
+    }
+    assert telemetry_delta(make_view(belt_speed=0), make_sample(belt_speed=1)) == {
+        "belt_speed": 1
+    }
+
+
+def test_health_and_uptime_minutes():
+    delta = telemetry_delta(
+        make_view(), make_sample(system_health="Warning", uptime_seconds=180)
+    )
+    assert delta == {"system_health": "Warning", "uptime_seconds": 180}
@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+from app.services.telemetry_history import TelemetryHistory
+
+
+def record_minutes(history: TelemetryHistory, minutes, speed: float):
+    """Samples every 10 s through each listed minute since the epoch."""
+    for minute in minutes:
+        for second in range(0, 60, 10):
+            sample = SimpleNamespace(
+                belt_speed=speed, motor_temp=40, belt_tension=450, current_draw=2
+            )
+            history.record(minute * 60 + second, sample)
+
+
+def test_trend_compares_against_the_bucket_an_hour_earlier():
+    history = TelemetryHistory(interval=10)
+    record_minutes(history, range(0, 61), 1000)
+    record_minutes(history, [61, 62], 1100)
+    # Minute 61 closed when minute 62 began; an hour before it is minute 1.
+    assert history.trend("belt_speed") == "+10.0%"
+
+
+def test_trend_is_none_without_a_bucket_an_hour_earlier():
+    history = TelemetryHistory(interval=10)
+    record_minutes(history, range(0, 10), 1000)
+    # A restart leaves a gap: nothing was recorded an hour before minute 70.
+    record_minutes(history, [70, 71], 1100)
+    assert history.trend("belt_speed") is None
+    assert history.snapshot()[0]["belt_speed"] == "—"
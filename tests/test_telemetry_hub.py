@@ -0,0 +1,54 @@
+import asyncio
+from app.services.telemetry_hub import TelemetryHub
+from app.services.telemetry_source import SimulatedTelemetrySource
+
+INTERVAL = 0.05
+
+
+def make_hub() -> TelemetryHub:
+    return TelemetryHub(
+        source_factory=lambda: SimulatedTelemetrySource(interval=INTERVAL, seed=0),
+        interval=INTERVAL,
+    )
+
+
+def test_halt_then_unsubscribe_leaves_a_single_producer():
+    async def scenario():
+        hub = make_hub()
+        subscription = hub.subscribe("session")
+        await subscription.get()
+        await subscription.get()
+        first = hub._task
+        # The halt wakes the producer in the same loop iteration as the
+        # cancel from the last unsubscribe.
+        hub.halt(True)
+        subscription.close()
+        subscription = hub.subscribe("session")
+        await asyncio.sleep(4 * INTERVAL)
+        assert first.done()
+        assert hub._task is not first
+        seq = hub.seq
+        await asyncio.sleep(20 * INTERVAL)
+        assert hub.seq - seq <= 22
+        subscription.close()
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+
+
+def test_controls_are_shared_and_cleared_by_a_halt():
+    async def scenario():
+        hub = make_hub()
+        first = hub.subscribe_controls("first")
+        second = hub.subscribe_controls("second")
+        hub.set_controls(300, True)
+        assert await second.wait()
+        assert (hub.setpoint, hub.running, hub.target_speed) == (300, True, 300)
+        hub.halt(True)
+        assert await first.wait()
+        assert (hub.setpoint, hub.running, hub.target_speed) == (0, False, 0)
+        second.close()
+        assert hub.subscribe_controls("first") is not first
+        assert not await first.wait()
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from app.services.telemetry_recording import (
+    MAGIC,
+    RecordingReplaySource,
+    TelemetryRecording,
+    _HEADER,
+    encode_event,
+    encode_sample,
+)
+from app.services.telemetry_source import TelemetrySample
+
+SAMPLE = TelemetrySample(
+    belt_speed=1200, motor_temp=48, belt_tension=690.5, current_draw=13.0
+)
+
+
+def write(path, *frames: bytes, seed: int = 7) -> bytes:
+    data = _HEADER.pack(MAGIC, 1000.0, 0.5, seed) + b"".join(frames)
+    path.write_bytes(data)
+    return data
+
+
+def frames(path) -> list:
+    return [(f.offset, f.sample, f.event) for f in TelemetryRecording(str(path))]
+
+
+def test_reads_header_samples_and_events(tmp_path):
+    path = tmp_path / "run.rbrec"
+    write(
+        path,
+        encode_sample(0.0, SAMPLE),
+        encode_event(0.25, "target_speed", 600),
+        encode_sample(0.5, SAMPLE),
+    )
+    recording = TelemetryRecording(str(path))
+    assert (recording.header.started, recording.header.interval) == (1000.0, 0.5)
+    assert recording.header.seed == 7
+    assert frames(path) == [
+        (0.0, SAMPLE, None),
+        (0.25, None, ("target_speed", 600)),
+        (0.5, SAMPLE, None),
+    ]
+
+
+def test_negative_seed_means_none(tmp_path):
+    path = tmp_path / "run.rbrec"
+    write(path, seed=-1)
+    assert TelemetryRecording(str(path)).header.seed is None
+
+
+def test_rejects_files_that_are_not_recordings(tmp_path):
+    path = tmp_path / "run.rbrec"
+    path.write_bytes(b"RBREC")
+    with pytest.raises(ValueError):
+        TelemetryRecording(str(path))
+
+
+def test_stops_cleanly_at_any_truncation(tmp_path):
+    path = tmp_path / "run.rbrec"
+    sample = encode_sample(0.0, SAMPLE)
+    event = encode_event(0.25, "estop", True)
+    data = write(path, sample, event)
+    header = _HEADER.size
+    for end in range(header, len(data)):
+        path.write_bytes(data[:end])
+        expected = [(0.0, SAMPLE, None)] if end >= header + len(sample) else []
+        assert frames(path) == expected, end
+
+
+def test_unpaced_replay_hands_events_to_the_hub(tmp_path):
+    path = tmp_path / "run.rbrec"
+    write(
+        path,
+        encode_sample(0.0, SAMPLE),
+        encode_event(30.0, "target_speed", 600),
+        encode_sample(60.0, SAMPLE),
+    )
+
+    async def replay():
+        source = RecordingReplaySource(str(path), speed=0)
+        first = await source.read(0)
+        assert source.take_events() == []
+        second = await asyncio.wait_for(source.read(0), 1)
+        assert (first, second) == (SAMPLE, SAMPLE)
+        assert source.take_events() == [("target_speed", 600)]
+        assert source.now() == 60.0
+        assert source.replay and source.paced
+
+    asyncio.run(replay())